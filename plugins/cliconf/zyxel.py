@@ -20,15 +20,46 @@ author:
 
 import re
 import json
+import time
 
 from ansible.errors import AnsibleConnectionFailure
 from ansible.module_utils.common.text.converters import to_text
 from ansible.plugins.cliconf import CliconfBase, enable_mode
 
+# Seconds a cached running-config stays valid, so changes made outside
+# this connection show up
+_CACHE_TTL = 5.0
+
+# System information fields, matched in one scan of the command output
+_RE_DEVICE_INFO = re.compile(r'(System Name|Firmware Version|Model)\s*:\s*(\S+)')
+_DEVICE_INFO_KEYS = {
+    'System Name': 'network_os_hostname',
+    'Firmware Version': 'network_os_version',
+    'Model': 'network_os_model',
+}
+
+_DEVICE_OPERATIONS = {
+    'supports_diff_replace': False,
+    'supports_commit': False,
+    'supports_rollback': False,
+    'supports_defaults': False,
+    'supports_onbox_diff': False,
+    'supports_commit_comment': False,
+    'supports_multiline_delimiter': False,
+    'supports_diff_match': False,
+    'supports_diff_ignore_lines': False,
+    'supports_generate_diff': False,
+    'supports_replace': False,
+}
 
 class Cliconf(CliconfBase):
     """Cliconf plugin for Zyxel devices."""
 
+    def __init__(self, connection):
+        super(Cliconf, self).__init__(connection)
+        self._capabilities = None  # JSON capabilities, fixed for the connection
+        self._config_cache = {}  # (timestamp, get_config() output) keyed by (source, flags)
+
     def get_device_info(self):
         """Get device information."""
         device_info = {}
@@ -37,23 +68,15 @@ class Cliconf(CliconfBase):
         # Try to get system information
         try:
             reply = self.get('show system-information')
-            data = to_text(reply, errors='surrogate_or_strict').strip()
-            
-            # Parse system name
-            match = re.search(r'System Name\s*:\s*(\S+)', data)
-            if match:
-                device_info['network_os_hostname'] = match.group(1)
+            # network_cli already returns text, so this is normally a no-op;
+            # the search does not need the surrounding whitespace stripped
+            data = to_text(reply, errors='surrogate_or_strict')
             
-            # Parse firmware version
-            match = re.search(r'Firmware Version\s*:\s*(\S+)', data)
-            if match:
-                device_info['network_os_version'] = match.group(1)
-            
-            # Parse model
-            match = re.search(r'Model\s*:\s*(\S+)', data)
-            if match:
-                device_info['network_os_model'] = match.group(1)
-                
+            # Parse system name, firmware version and model; the first
+            # occurrence of each wins
+            for match in _RE_DEVICE_INFO.finditer(data):
+                device_info.setdefault(_DEVICE_INFO_KEYS[match.group(1)], match.group(2))
+
         except AnsibleConnectionFailure:
             # Fall back to simpler command
             pass
@@ -62,19 +85,7 @@ class Cliconf(CliconfBase):
 
     def get_device_operations(self):
         """Return supported operations."""
-        return {
-            'supports_diff_replace': False,
-            'supports_commit': False,
-            'supports_rollback': False,
-            'supports_defaults': False,
-            'supports_onbox_diff': False,
-            'supports_commit_comment': False,
-            'supports_multiline_delimiter': False,
-            'supports_diff_match': False,
-            'supports_diff_ignore_lines': False,
-            'supports_generate_diff': False,
-            'supports_replace': False,
-        }
+        return dict(_DEVICE_OPERATIONS)
 
     def get_option_values(self):
         """Return option values."""
@@ -86,57 +97,72 @@ class Cliconf(CliconfBase):
         }
 
     def get_capabilities(self):
-        """Return device capabilities."""
-        result = super(Cliconf, self).get_capabilities()
-        result['rpc'] += ['run_commands', 'get_config', 'edit_config']
-        result['device_operations'] = self.get_device_operations()
-        result['network_api'] = 'cliconf'
-        return json.dumps(result)
+        """Return device capabilities.
+
+        The result includes device info read from the switch, so it is
+        built once per connection and reused.
+        """
+        if self._capabilities is None:
+            result = super(Cliconf, self).get_capabilities()
+            result['rpc'] += ['run_commands', 'get_config', 'edit_config']
+            result['device_operations'] = self.get_device_operations()
+            result['network_api'] = 'cliconf'
+            self._capabilities = json.dumps(result)
+        return self._capabilities
 
     @enable_mode
     def get_config(self, source='running', flags=None, format=None):
-        """Get running configuration."""
+        """Get running configuration.
+
+        The output is reused for at most _CACHE_TTL seconds, and until a
+        command is sent through edit_config(), get() or run_commands(), any
+        of which may change the configuration.
+        """
         if source != 'running':
             raise AnsibleConnectionFailure("Zyxel devices only support 'running' configuration")
-        
+
+        key = (source, tuple(flags or ()))
+        entry = self._config_cache.get(key)
+        if entry is not None:
+            if time.monotonic() - entry[0] <= _CACHE_TTL:
+                return entry[1]
+            del self._config_cache[key]
+
         cmd = 'show running-config'
         if flags:
             cmd += ' ' + ' '.join(flags)
-        
-        return self.send_command(cmd)
+
+        config = self.send_command(cmd)
+        self._config_cache[key] = (time.monotonic(), config)
+        return config
 
     @enable_mode
     def edit_config(self, candidate=None, commit=True, replace=None, comment=None):
         """Edit device configuration."""
+        self._config_cache.clear()
         responses = []
         
         if not candidate:
             return {'request': [], 'response': []}
         
+        # Commands go out serially on the one CLI session, in order
         for cmd in candidate:
-            if isinstance(cmd, dict):
-                command = cmd.get('command', '')
-                prompt = cmd.get('prompt')
-                answer = cmd.get('answer')
-                newline = cmd.get('newline', True)
-            else:
-                command = cmd
-                prompt = None
-                answer = None
-                newline = True
-            
+            if not isinstance(cmd, dict):
+                cmd = {'command': cmd}
+            command = cmd.get('command', '')
             if command:
                 responses.append(self.send_command(
                     command=command,
-                    prompt=prompt,
-                    answer=answer,
-                    newline=newline
+                    prompt=cmd.get('prompt'),
+                    answer=cmd.get('answer'),
+                    newline=cmd.get('newline', True)
                 ))
         
         return {'request': candidate, 'response': responses}
 
     def get(self, command, prompt=None, answer=None, sendonly=False, newline=True, check_all=False):
         """Send a command to the device."""
+        self._config_cache.clear()
         return self.send_command(
             command=command,
             prompt=prompt,
@@ -148,6 +174,7 @@ class Cliconf(CliconfBase):
 
     def run_commands(self, commands, check_rc=True):
         """Run a list of commands on the device."""
+        self._config_cache.clear()
         responses = []
         for cmd in commands:
             try:
@@ -27,40 +27,395 @@ options:
     description:
       - The Zyxel switch model type.
       - If not specified, will be auto-detected from the login page.
+      - Setting it skips the login page request used for auto-detection.
     choices: ['gs1900', 'gs1915', 'gs1920']
     vars:
       - name: ansible_zyxel_model
       - name: zyxel_model
 """
 
+import functools
 import json
 import random
 import re
+import time
+from collections import defaultdict
+from itertools import chain, islice
 try:
     from urllib.parse import urlencode
 except ImportError:
     from urllib import urlencode
+try:
+    import lxml.html
+    from lxml import etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
 from ansible.plugins.httpapi import HttpApiBase
 from ansible.module_utils.basic import to_text
 
 
+# Seconds a cached page or parsed result stays valid without a write
+_CACHE_TTL = 5.0
+
+# Model-independent parts of get_capabilities()
+_CAPABILITY_RPC = ('get_page', 'post_form', 'get_system_info', 'get_device_info',
+                   'get_ports_info', 'get_vlans_info', 'get_vlan_info')
+_DEVICE_OPERATIONS = {
+    'supports_commit': False,
+    'supports_replace': False,
+    'supports_rollback': False,
+    'supports_defaults': False,
+    'supports_onbox_diff': False,
+    'supports_generate_diff': False,
+    'supports_multiline_delimiter': False,
+    'supports_diff_match': False,
+    'supports_diff_ignore_lines': False,
+    'supports_config_replace': False,
+    'supports_admin': False,
+    'supports_commit_comment': False,
+}
+
+# Precompiled HTML parsing patterns, shared by every parse call
+
+# Model name on the login page, matched on the raw response bytes
+_RE_MODEL = re.compile(rb'GS19(00|15|20)')
+
+# System information
+_RE_SYSINFO_HOSTNAME_GS1900 = re.compile(r'name="system_name"[^>]*value="([^"]*)"')
+_RE_SYSINFO_HOSTNAME = re.compile(r'System Name[^<]*</td>\s*<td[^>]*>\s*([^<]*?)\s*(?=<)')
+_RE_SYSINFO_MODEL = re.compile(r'Product Model[^<]*</td>\s*<td[^>]*>\s*([^<]*?)\s*(?=<)')
+_RE_SYSINFO_FIRMWARE = re.compile(r'F/W Version[^<]*</td>\s*<td[^>]*>\s*([^<]*?)\s*(?=<)')
+_RE_SYSINFO_MAC = re.compile(r'Ethernet Address[^<]*</td>\s*<td[^>]*>\s*([^<]*?)\s*(?=<)')
+
+# Firmware version like 'V4.80(ABMH.1) | 05/04/2022': release numbers, then the patch number
+_RE_FIRMWARE_VERSION = re.compile(r'\s*[Vv]?(\d+(?:\.\d+)*)(?:\([^).]*\.(\d+)\))?')
+
+# Form keys and values that urlencode would leave unchanged
+_FAST_ENCODE_SAFE = re.compile(r'\A[A-Za-z0-9._~-]*\Z')
+
+# GS1900 XSSID form token
+_RE_XSSID = re.compile(rb'name="XSSID"\s+value="([^"]+)"')
+
+# GS1900 port tables: a port checkbox followed by one cell per column
+_RE_GS1900_PORT_CHECK = re.compile(r'<input type="checkbox" name="port" value="(\d+)"', re.IGNORECASE)
+_RE_GS1900_CELL = re.compile(
+    r'<td class="font-4"[^>]*><div align=center>\s*([^<]*?)\s*</div></td>',
+    re.IGNORECASE
+)
+
+# Port information
+_RE_PORT_NAME_GS1915 = re.compile(r'rpport_IptPortName\?(\d+)"[^>]*VALUE="([^"]*)"', re.IGNORECASE)
+_RE_PORT_ACTIVE_GS1915 = re.compile(r'rpport_ChkPortActive[^>]*VALUE="\?(\d+)"([^>]*)', re.IGNORECASE)
+_RE_PORT_SPEED_GS1915 = re.compile(
+    r'rpport_SltSpeed\?(\d+)"[^>]*>.*?<OPTION[^>]*SELECTED[^>]*>\s*([^<]*?)\s*(?=<)',
+    re.IGNORECASE | re.DOTALL
+)
+_RE_PORT_NAME_GS1920 = re.compile(r'rpPort_Ipt_PortName\?(\d+)"[^>]*VALUE="([^"]*)"', re.IGNORECASE)
+_RE_PORT_ACTIVE_GS1920 = re.compile(r'rpPort_Chk_PortActive[^>]*value="\?(\d+)"[^>]*checked', re.IGNORECASE)
+_RE_PORT_SPEED_GS1920 = re.compile(
+    r'rpPort_Slt_Speed\?(\d+)"[^>]*>.*?<OPTION\s+VALUE=(\w+)\s+SELECTED>\s*([^<]*?)\s*(?=<)',
+    re.IGNORECASE | re.DOTALL
+)
+
+# VLAN lists
+_RE_VLANTAG_ROW_GS1920 = re.compile(
+    r'NAME="rpVlantag_Chk_TabDel"\s+VALUE="\?\d+"'  # Checkbox with index
+    r'.*?</td>\s*'                                   # Close checkbox td
+    r'<td[^>]*>(\d+)\s*</td>\s*'                    # VID
+    r'<td[^>]*>.*?</td>\s*'                         # Active status (ON/OFF span)
+    r'<td[^>]*>\s*(\S[^<]*?)\s*</td>',              # Name (non-empty, trimmed)
+    re.IGNORECASE | re.DOTALL
+)
+_RE_VLANTAG_ROW_GS1915 = re.compile(
+    r'GetIndexID\((\d+)\)[^<]*</a>'                 # VID from JavaScript link
+    r'.*?<div align=center>\s*(Yes|No)\s*</div>'    # Active status
+    r'.*?<div align=center>\s*([^<]*?)\s*</div>',   # Name
+    re.IGNORECASE | re.DOTALL
+)
+_RE_VLANS_GS1900 = re.compile(
+    r'<td class="font-4" ><div align=center>\s*(\d+)\s*</div></td>\s*'
+    r'<td class="font-4" ><div align=center>\s*([^<]*?)\s*</div></td>\s*'
+    r'<td class="font-4" ><div align=center>\s*(Default|Static)\s*</div></td>',
+    re.DOTALL | re.IGNORECASE
+)
+_RE_VLANSTATUS_GS1915 = re.compile(
+    r"<a href='US/(\d+)/rpvlanstatusStatisticsDetail\.html'[^>]*>\s*\d+\s*</a>"
+    r".*?<div align=center>\s*(\d+)\s*</div>"      # VID (duplicated in URL and column)
+    r".*?<div align=center>\s*([^<]*?)\s*</div>"   # Name
+    r".*?<div align=center>\s*([^<]*?)\s*</div>"   # Untagged ports
+    r".*?<div align=center>\s*([^<]*?)\s*</div>",  # Tagged ports
+    re.DOTALL | re.IGNORECASE
+)
+
+
+# Single-pass pattern for the fields of a port config form, filled with
+# the (enable checkbox, name input, speed select) names. Named groups tell
+# which field matched; each is followed by its port ID or field name
+# group, then its value group(s). Only checked enable checkboxes match the
+# active branch. The select branch stops at </SELECT> so it never swallows
+# the inputs that follow.
+_PORT_FORM_TEMPLATE = (
+    r'(?P<active><INPUT(?=[^>]*\bCHECKED\b)[^>]*NAME="%s"[^>]*VALUE="\?(\d+)"[^>]*>)'
+    r'|(?P<name><INPUT[^>]*NAME="(%s\?\d+)"[^>]*VALUE="([^"]*)")'
+    r'|(?P<speed><SELECT[^>]*NAME="(%s\?\d+)"[^>]*>(?:(?!</SELECT>).)*?<OPTION[^>]*'
+    r'(?:VALUE="([^"]*)"[^>]*SELECTED|SELECTED[^>]*VALUE="([^"]*)"))'
+)
+
+
+# Port config form fields (enable checkbox, name input, speed select)
+# on rpport.html (GS1915) / rpPort.html (GS1920)
+_PORT_FORM_FIELDS_GS1915 = ('rpport_ChkPortActive', 'rpport_IptPortName', 'rpport_SltSpeed')
+_PORT_FORM_FIELDS_GS1920 = ('rpPort_Chk_PortActive', 'rpPort_Ipt_PortName', 'rpPort_Slt_Speed')
+
+# Port number strings for per-port form loops, sized for stacked switches
+_MAX_TABLE_PORT = 256
+_PORT_STR = tuple(str(port) for port in range(_MAX_TABLE_PORT + 1))
+_PORT_QMARK = tuple('?' + port for port in _PORT_STR)
+
+# Port speed option values on the GS1915/GS1920 port config forms
+_PORT_SPEED_VALUES = {
+    'auto': '00000000',
+    '10m-half': '00000006',
+    '10m-full': '00000007',
+    '100m-half': '00000004',
+    '100m-full': '00000005',
+    '1g-full': '00000003',
+}
+
+# Chunk size when feeding a page to the lxml pull parser
+_PULL_PARSER_CHUNK = 65536
+
+# GS1920 syslog global enable checkbox and LAG group enable checkboxes,
+# matching only when checked
+_RE_SYSLOG_GLOBAL_ACTIVE = re.compile(
+    r'<INPUT(?=[^>]*\bCHECKED\b)[^>]*NAME="rpSyslog_Chk_GlobalActive"[^>]*>', re.IGNORECASE)
+_RE_LAG_GROUP_ACTIVE = re.compile(
+    r'<INPUT(?=[^>]*\bCHECKED\b)[^>]*NAME="rpLacpsetting_Chk_GroupActive"[^>]*VALUE="\?(\d+)"[^>]*>',
+    re.IGNORECASE)
+
+# Form field templates, filled with a NAME regex by the _parse_form_* helpers
+# Checkbox template only matches checked boxes, via the CHECKED lookahead
+_FORM_CHECKBOX_TEMPLATE = r'<INPUT(?=[^>]*\bCHECKED\b)[^>]*NAME="%s"[^>]*VALUE="([^"]*)"[^>]*>'
+_FORM_INPUT_TEMPLATE = r'<INPUT[^>]*NAME="(%s)"[^>]*VALUE="([^"]*)"'
+# SELECTED may come after or before VALUE in the OPTION tag
+_FORM_SELECT_TEMPLATE = (
+    r'<SELECT[^>]*NAME="(%s)"[^>]*>.*?<OPTION[^>]*'
+    r'(?:VALUE="([^"]*)"[^>]*SELECTED|SELECTED[^>]*VALUE="([^"]*)")'
+)
+
+# GS1915 VLAN tag rows link to javascript:GetIndexID(<vid>)
+_RE_GET_INDEX_ID = re.compile(r'GetIndexID\((\d+)\)')
+_RE_VLANTAG_CHKDEL_GS1915 = re.compile(r'rpvlantag_ChkDel[^>]*VALUE="\?([^"]+)"', re.IGNORECASE)
+_RE_TABLE_ROW_GS1915 = re.compile(r'<tr[^>]*>(.*?)</tr>', re.DOTALL | re.IGNORECASE)
+
+# GS1920 VLAN tag table: tbody rows of a "?index" checkbox, then the VID cell.
+# One match per row; neither group may run past the row's </tr>.
+_RE_TBODY = re.compile(r'<tbody>(.*?)</tbody>', re.DOTALL)
+_RE_VLANTAG_INDEX_GS1920 = re.compile(
+    r'<tr>(?:(?!</tr>).)*?VALUE="\?(\d+)"(?:(?!</tr>).)*?</td>\s*<td>(\d+)\s*</td>',
+    re.DOTALL
+)
+
+# One part of a port range list like '1-4,6,8-10': a port or a start-end pair
+_RE_PORT_PART = re.compile(r'\s*(\d+)(?:\s*-\s*(\d+))?\s*\Z')
+
+# VLAN port settings
+# One pass over rpVlanport.html for every field, in both naming dialects
+# GS1920: rpVlanport_Ipt_PVID?1  GS1915: rpvlanport_IptPVID?1
+# Each named group is followed by two groups: port ID and value/attributes
+_RE_VLANPORT = re.compile(
+    r'(?P<pvid>rpvlanport_Ipt_?PVID\?(\d+)[^>]*VALUE="(\d+)")'
+    r'|(?P<ingress>rpvlanport_Chk_?Ingress[^>]*VALUE="\?(\d+)"([^>]*))'
+    r'|(?P<trunk>rpvlanport_Chk_?VLANTrunking[^>]*VALUE="\?(\d+)"([^>]*))'
+    r'|(?P<frame>rpvlanport_Slt_?AcceptableFrame\?(\d+)[^>]*>.*?<OPTION[^>]*VALUE="?(\d+)"?[^>]*SELECTED)',
+    re.IGNORECASE | re.DOTALL
+)
+_VLANPORT_FRAME_TYPES = {0: 'all', 1: 'tagged_only', 2: 'untagged_only'}
+
+
+# Per-model page tables; unknown models use the GS1920 page names
+# GS1900 pages are dispatcher.cgi cmd numbers (see get_page)
+_SYSINFO_PAGES = {
+    'gs1900': 512,
+    'gs1915': '/rpsysinfo.html',  # lowercase for GS1915
+    'gs1920': '/rpSysinfo.html',
+}
+_PORTS_PAGES = {
+    'gs1900': '/cgi-bin/dispatcher.cgi?cmd=768',
+    'gs1915': '/rpport.html',  # lowercase for GS1915
+    'gs1920': '/rpPort.html',
+}
+_VLANPORT_PAGES = {
+    'gs1900': '/cgi-bin/dispatcher.cgi?cmd=1290',
+    'gs1915': '/rpvlanport.html',
+    'gs1920': '/rpVlanport.html',
+}
+_VLANTAG_PAGES = {
+    'gs1900': 1282,
+    'gs1915': '/rpvlantag.html',
+    'gs1920': '/rpVlantag.html',
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled(pattern_template, name_pattern, flags=0):
+    """Compile a form field template for a NAME regex, once per combination.
+
+    name_pattern may be a tuple for templates with several NAME slots.
+    """
+    return re.compile(pattern_template % name_pattern, flags)
+
+
+def _model_page(pages, model):
+    """Look up the page for a model in one of the per-model page tables."""
+    return pages.get(model, pages['gs1920'])
+
+
+def _find_attr_value(content, anchor):
+    """Find the value="..." attribute directly following a literal anchor.
+
+    Fast path for simple tags like name="XSSID" value="...". Works on
+    str or bytes content, with an anchor of the same type. Returns None
+    if the anchor is missing or the value does not follow it with only
+    whitespace in between, so callers can fall back to a regex.
+    """
+    if isinstance(content, bytes):
+        value_marker, quote = b'value="', b'"'
+    else:
+        value_marker, quote = 'value="', '"'
+    start = content.find(anchor)
+    if start < 0:
+        return None
+    start += len(anchor)
+    value_start = content.find(value_marker, start)
+    if value_start < 0 or content[start:value_start].strip():
+        return None
+    value_start += 7
+    value_end = content.find(quote, value_start)
+    if value_end < 0:
+        return None
+    return content[value_start:value_end]
+
+
+def _iter_pull_elements(content, tags):
+    """Stream a page through lxml's HTML pull parser, one chunk at a time.
+
+    Yields each element with one of the given tags once it is closed,
+    then clears it so the parsed tree does not grow with the page.
+    """
+    parser = etree.HTMLPullParser(events=('end',), tag=tags)
+    for start in range(0, len(content), _PULL_PARSER_CHUNK):
+        parser.feed(content[start:start + _PULL_PARSER_CHUNK])
+        for dummy, element in parser.read_events():
+            yield element
+            element.clear()
+    parser.close()
+    for dummy, element in parser.read_events():
+        yield element
+        element.clear()
+
+
+def _port_labels(num_ports):
+    """Iterate (port, 'port', '?port') for ports 1..num_ports.
+
+    The strings come from the _PORT_STR/_PORT_QMARK tables, and are only
+    formatted for ports beyond them.
+    """
+    top = min(num_ports, _MAX_TABLE_PORT)
+    labels = zip(range(1, top + 1), _PORT_STR[1:top + 1], _PORT_QMARK[1:top + 1])
+    if num_ports <= top:
+        return labels
+    return chain(labels, ((port, str(port), '?%d' % port) for port in range(top + 1, num_ports + 1)))
+
+
+def _syslog_post_ok(code, response):
+    """Return True if the switch accepted a syslog server form POST."""
+    return code == 200 and 'Error' not in response
+
+
+def _syslog_server_listed(content, address):
+    """Return True if a syslog page lists address as a whole token."""
+    if not address:
+        return False
+    pattern = r'(?<![\w.:-])' + re.escape(address) + r'(?![\w.:-])'
+    return re.search(pattern, content) is not None
+
+
+def _invalid_port_ids(port_ids, num_ports=None):
+    """Return the port IDs, as strings, that are not valid port numbers.
+
+    Port numbers must be positive and, when num_ports is given, no higher
+    than num_ports.
+    """
+    invalid = []
+    for port_id in port_ids:
+        try:
+            if int(port_id) >= 1 and (num_ports is None or int(port_id) <= num_ports):
+                continue
+        except (TypeError, ValueError):
+            pass
+        invalid.append(str(port_id))
+    return invalid
+
+
+def _ports_label(port_ids):
+    """Describe port IDs for a result message, e.g. 'Port 1' or 'Ports 1, 2'."""
+    port_ids = [str(port_id) for port_id in port_ids]
+    if len(port_ids) == 1:
+        return 'Port %s' % port_ids[0]
+    return 'Ports %s' % ', '.join(port_ids)
+
+
+# VLAN membership actions per port, indexing _vlan_member_entries()
+_MEMBER_NORMAL, _MEMBER_UNTAGGED, _MEMBER_TAGGED = 0, 1, 2
+
+
+def _vlan_member_actions(num_ports, tagged_ports, untagged_ports):
+    """Return a bytearray of the membership action for ports 0..num_ports.
+
+    Tagged membership wins over untagged; ports outside the switch are
+    ignored.
+    """
+    actions = bytearray(num_ports + 1)
+    for ports, action in ((untagged_ports, _MEMBER_UNTAGGED), (tagged_ports, _MEMBER_TAGGED)):
+        for port in ports or ():
+            port = str(port)
+            if port.isdigit() and 0 < int(port) <= num_ports:
+                actions[int(port)] = action
+    return actions
+
+
+@functools.lru_cache(maxsize=8)
+def _vlan_member_entries(control_field, tagging_field, num_ports):
+    """Return the VLAN membership form entries, indexed by action then port.
+
+    Tagged ports get the Fixed control value plus a tagging checkbox,
+    untagged ports just the Fixed control value, all others Normal.
+    """
+    normal, untagged, tagged = [()], [()], [()]
+    for dummy, dummy, qmark in _port_labels(num_ports):
+        normal.append(((control_field + qmark, '0'),))
+        untagged.append(((control_field + qmark, '1'),))
+        tagged.append(((control_field + qmark, '1'), (tagging_field, qmark)))
+    return tuple(normal), tuple(untagged), tuple(tagged)
+
+
+# Filler characters for the GS1900 encoded password
+_GS1900_PASSWORD_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+
+
 def encode_gs1900_password(password):
     """Encode password for GS1900 series switches."""
-    text = ""
-    possible = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
     input_len = len(password)
-    remaining = input_len
-    for i in range(1, 322):
-        if i % 5 == 0 and remaining > 0:
-            remaining -= 1
-            text += password[remaining]
-        elif i == 123:
-            text += "0" if input_len < 10 else str(input_len // 10)
-        elif i == 289:
-            text += str(input_len % 10)
-        else:
-            text += random.choice(possible)
-    return text
+    # Start from random filler, then overwrite the fixed positions
+    text = random.choices(_GS1900_PASSWORD_CHARS, k=321)
+    text[122] = "0" if input_len < 10 else str(input_len // 10)
+    text[288] = str(input_len % 10)
+    # Every 5th position holds the password reversed, up to 64 characters
+    count = min(input_len, 64)
+    text[4:5 * count:5] = password[::-1][:count]
+    return "".join(text)
 
 
 class HttpApi(HttpApiBase):
@@ -73,6 +428,8 @@ class HttpApi(HttpApiBase):
         self._firmware_version = None
         self._auth_id = None  # For GS1900 token-based auth
         self._logged_in = False
+        self._page_cache = {}  # (timestamp, page content) keyed by path
+        self._parsed_cache = {}  # (timestamp, parsed info) keyed by getter name
 
     def detect_model(self):
         """Detect switch model from the login page."""
@@ -87,23 +444,33 @@ class HttpApi(HttpApiBase):
 
         # Try to detect from login page
         try:
-            response, response_data = self.connection.send('/', None, method='GET')
-            content = to_text(response_data.getvalue())
+            code, content = self._send_request_bytes('/')
+            # Collect every model mentioned in one scan, then keep the
+            # GS1900 > GS1915 > GS1920 precedence
+            found = set(_RE_MODEL.findall(content))
 
-            if 'GS1900' in content:
+            if b'00' in found:
                 self._model = 'gs1900'
-            elif 'GS1915' in content:
+            elif b'15' in found:
                 self._model = 'gs1915'
-            elif 'GS1920' in content:
-                self._model = 'gs1920'
             else:
-                # Default to gs1920 form-based auth
+                # GS1920, or default to gs1920 form-based auth
                 self._model = 'gs1920'
         except Exception:
             self._model = 'gs1920'
 
         return self._model
 
+    def reset_model_cache(self):
+        """Forget the detected model so the next detect_model() runs again.
+
+        Firmware version and cached pages belong to the detected model and
+        are dropped along with it.
+        """
+        self._model = None
+        self._firmware_version = None
+        self._invalidate_cache()
+
     def get_firmware_version(self):
         """Get firmware version from the switch.
         
@@ -125,48 +492,59 @@ class HttpApi(HttpApiBase):
         """Compare two firmware version strings.
         
         Args:
-            version1: First version string (e.g., 'V1.15', 'V2.70')
-            version2: Second version string (e.g., 'V1.16', 'V2.70')
+            version1: First version string (e.g., 'V1.15', 'V4.80(ABMH.1)')
+            version2: Second version string (e.g., 'V1.16', 'V4.80(ABMH.2)')
             
         Returns:
             -1 if version1 < version2
              0 if version1 == version2
              1 if version1 > version2
         """
-        # Extract numeric parts from versions like 'V1.15' -> [1, 15]
+        # Extract numeric parts from versions like 'V4.80(ABMH.1)' -> [4, 80, 1]
         def parse_version(v):
-            # Remove 'V' prefix if present and split by '.'
-            v = v.upper().strip()
-            if v.startswith('V'):
-                v = v[1:]
-            try:
-                return [int(x) for x in v.split('.')]
-            except (ValueError, AttributeError):
+            match = _RE_FIRMWARE_VERSION.match(v or '')
+            if not match:
                 return [0]
-        
+            parts = [int(x) for x in match.group(1).split('.')]
+            if match.group(2):
+                parts.append(int(match.group(2)))
+            return parts
+
         parts1 = parse_version(version1)
         parts2 = parse_version(version2)
-        
+
         # Pad shorter version with zeros
         max_len = max(len(parts1), len(parts2))
         parts1.extend([0] * (max_len - len(parts1)))
         parts2.extend([0] * (max_len - len(parts2)))
-        
-        # Compare each part
-        for p1, p2 in zip(parts1, parts2):
-            if p1 < p2:
-                return -1
-            elif p1 > p2:
-                return 1
-        return 0
+        return (parts1 > parts2) - (parts1 < parts2)
 
     def send_request(self, path, data=None, **kwargs):
         """Send an HTTP request to the device."""
+        code, body = self._send_request_bytes(path, data, **kwargs)
+        return code, to_text(body)
+
+    def _send_request_bytes(self, path, data=None, **kwargs):
+        """Send an HTTP request to the device without decoding the body.
+
+        Returns:
+            Tuple of (HTTP status code, raw response body bytes)
+        """
         method = kwargs.get('method', 'GET')
         headers = kwargs.get('headers', {})
 
+        if method != 'GET':
+            # Any write may change what every page reports
+            self._invalidate_cache()
+
         if data and method == 'POST':
-            if isinstance(data, (dict, list)):
+            if isinstance(data, dict) and all(
+                    isinstance(key, str) and isinstance(value, str)
+                    and _FAST_ENCODE_SAFE.match(key) and _FAST_ENCODE_SAFE.match(value)
+                    for key, value in data.items()):
+                # Small payloads like login need no quoting at all
+                data = '&'.join('%s=%s' % item for item in data.items())
+            elif isinstance(data, (dict, list)):
                 # urlencode handles both dict and list of tuples
                 data = urlencode(data)
             if 'Content-Type' not in headers:
@@ -179,7 +557,7 @@ class HttpApi(HttpApiBase):
             headers=headers
         )
 
-        return response.getcode(), to_text(response_data.getvalue())
+        return response.getcode(), response_data.getvalue()
 
     def login(self, username, password):
         """Login to the Zyxel switch web interface."""
@@ -240,20 +618,73 @@ class HttpApi(HttpApiBase):
         self._logged_in = False
         self._auth_id = None
 
-    def get_page(self, page):
-        """Get a page from the web interface."""
-        model = self.detect_model()
+    def _invalidate_cache(self, prefix=None):
+        """Drop cached pages and parsed info.
 
-        if model == 'gs1900':
-            # GS1900 uses cmd parameter
-            if isinstance(page, int):
-                path = '/cgi-bin/dispatcher.cgi?cmd=%d' % page
-            else:
-                path = page
+        Args:
+            prefix: Only drop pages whose path starts with this prefix,
+                along with all parsed info. Drops everything if None.
+        """
+        if prefix is None:
+            self._page_cache.clear()
         else:
-            path = page
+            for path in [path for path in self._page_cache if path.startswith(prefix)]:
+                del self._page_cache[path]
+        self._parsed_cache.clear()
+
+    def invalidate_all(self):
+        """Drop all cached pages and parsed info for this connection."""
+        self._invalidate_cache()
+
+    def _cache_get(self, cache, key):
+        """Return a cached value, or None if missing or older than _CACHE_TTL."""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > _CACHE_TTL:
+            del cache[key]
+            return None
+        return entry[1]
+
+    def _cache_put(self, cache, key, value):
+        """Store a value in one of the caches with the current time."""
+        cache[key] = (time.monotonic(), value)
+
+    def get_page(self, page, use_cache=True):
+        """Get a page from the web interface.
+
+        Pages are cached per connection until the next write request, for
+        at most _CACHE_TTL seconds so changes made elsewhere show up.
+        Pass use_cache=False for pages carrying one-time form tokens.
+        """
+        path = self._page_path(page)
+
+        if use_cache:
+            cached = self._cache_get(self._page_cache, path)
+            if cached is not None:
+                return cached
 
         code, response = self.send_request(path, method='GET')
+        if code == 200:
+            if use_cache:
+                self._cache_put(self._page_cache, path, response)
+            return response
+        raise Exception('Failed to get page %s: HTTP %d' % (page, code))
+
+    def _page_path(self, page):
+        """Return the request path for a page name or GS1900 cmd number."""
+        if isinstance(page, int) and self.detect_model() == 'gs1900':
+            # GS1900 uses cmd parameter
+            return '/cgi-bin/dispatcher.cgi?cmd=%d' % page
+        return page
+
+    def _get_page_bytes(self, page):
+        """Get a page as raw bytes, bypassing the page cache.
+
+        For pages that are only searched for a short ASCII value, where
+        decoding the whole body would be wasted work.
+        """
+        code, response = self._send_request_bytes(self._page_path(page), method='GET')
         if code == 200:
             return response
         raise Exception('Failed to get page %s: HTTP %d' % (page, code))
@@ -282,24 +713,44 @@ class HttpApi(HttpApiBase):
         Returns:
             XSSID token string or None if not found
         """
-        content = self.get_page(cmd)
-        match = re.search(r'name="XSSID"\s+value="([^"]+)"', content)
+        # One-time token, so never cached; only the token is decoded
+        content = self._get_page_bytes(cmd)
+        xssid = _find_attr_value(content, b'name="XSSID"')
+        if xssid:
+            return to_text(xssid)
+        match = _RE_XSSID.search(content)
         if match:
-            return match.group(1)
+            return to_text(match.group(1))
         return None
 
     def get_system_info(self):
         """Get system information from the switch."""
+        cached = self._cache_get(self._parsed_cache, 'system_info')
+        if cached is not None:
+            return cached
+
         model = self.detect_model()
+        content = self.get_page(_model_page(_SYSINFO_PAGES, model))
+        info = self._parse_system_info(content, model)
+        self._cache_put(self._parsed_cache, 'system_info', info)
+        return info
 
-        if model == 'gs1900':
-            content = self.get_page(512)  # System Information cmd
-        elif model == 'gs1915':
-            content = self.get_page('/rpsysinfo.html')  # lowercase for GS1915
-        else:  # gs1920
-            content = self.get_page('/rpSysinfo.html')
+    def get_device_info(self):
+        """Get the network OS facts for the switch.
+
+        Built from the detected model and firmware version, which are
+        both remembered for the life of the connection, so only the
+        first call reads the switch.
 
-        return self._parse_system_info(content, model)
+        Returns:
+            Dict with network_os, network_os_platform and
+            network_os_version keys
+        """
+        return {
+            'network_os': 'zyxel',
+            'network_os_platform': self.detect_model(),
+            'network_os_version': self.get_firmware_version(),
+        }
 
     def _parse_system_info(self, content, model):
         """Parse system information from HTML content."""
@@ -312,137 +763,156 @@ class HttpApi(HttpApiBase):
 
         if model == 'gs1900':
             # Parse GS1900 format
-            name_match = re.search(r'name="system_name"[^>]*value="([^"]*)"', content)
-            if name_match:
-                info['hostname'] = name_match.group(1)
+            hostname = _find_attr_value(content, 'name="system_name"')
+            if hostname is not None:
+                info['hostname'] = hostname
+            else:
+                name_match = _RE_SYSINFO_HOSTNAME_GS1900.search(content)
+                if name_match:
+                    info['hostname'] = name_match.group(1)
         else:
             # Parse GS1915/GS1920 format
-            name_match = re.search(r'System Name[^<]*</td>\s*<td[^>]*>([^<]+)', content)
+            name_match = _RE_SYSINFO_HOSTNAME.search(content)
             if name_match:
-                info['hostname'] = name_match.group(1).strip()
+                info['hostname'] = name_match.group(1)
 
-            model_match = re.search(r'Product Model[^<]*</td>\s*<td[^>]*>([^<]+)', content)
+            model_match = _RE_SYSINFO_MODEL.search(content)
             if model_match:
-                info['model'] = model_match.group(1).strip()
+                info['model'] = model_match.group(1)
 
-            fw_match = re.search(r'F/W Version[^<]*</td>\s*<td[^>]*>([^<]+)', content)
+            fw_match = _RE_SYSINFO_FIRMWARE.search(content)
             if fw_match:
-                info['firmware'] = fw_match.group(1).strip()
+                info['firmware'] = fw_match.group(1)
 
-            mac_match = re.search(r'Ethernet Address[^<]*</td>\s*<td[^>]*>([^<]+)', content)
+            mac_match = _RE_SYSINFO_MAC.search(content)
             if mac_match:
-                info['mac_address'] = mac_match.group(1).strip()
+                info['mac_address'] = mac_match.group(1)
 
         return info
 
     def get_ports_info(self):
         """Get port information from the switch."""
+        cached = self._cache_get(self._parsed_cache, 'ports_info')
+        if cached is not None:
+            return cached
+
         model = self.detect_model()
+        content = self.get_page(_model_page(_PORTS_PAGES, model))
+        ports = self._parse_ports_info(content, model)
+        self._cache_put(self._parsed_cache, 'ports_info', ports)
+        return ports
 
+    def _parse_ports_info(self, content, model):
+        """Parse port information from HTML content."""
         if model == 'gs1900':
-            content = self.get_page('/cgi-bin/dispatcher.cgi?cmd=768')
+            return self._parse_ports_info_gs1900(content)
         elif model == 'gs1915':
-            content = self.get_page('/rpport.html')  # lowercase for GS1915
+            return self._parse_ports_info_gs1915(content)
         else:  # gs1920
-            content = self.get_page('/rpPort.html')
-
-        return self._parse_ports_info(content, model)
+            return self._parse_ports_info_gs1920(content)
 
-    def _parse_ports_info(self, content, model):
-        """Parse port information from HTML content."""
+    def _parse_ports_info_gs1900(self, content):
+        """Parse port information from the GS1900 cmd=768 table."""
         ports = {}
 
-        if model == 'gs1900':
-            # GS1900 uses cmd=768 with table format
-            # Pattern: checkbox value, port num, name, state, link, speed, duplex, flowctrl
-            pattern = (
-                r'<input type="checkbox" name="port" value="(\d+)"'
-                r'.*?<td class="font-4" ><div align=center>\s*\d+\s*</div></td>\s*'  # Port num
-                r'<td class="font-4" ><div align=center>\s*([^<]*?)\s*</div></td>\s*'  # Name
-                r'<td class="font-4" ><div align=center>\s*(\w+)\s*</div></td>\s*'  # State
-                r'<td class="font-4" ><div align=center>\s*(\w+)\s*</div></td>\s*'  # Link Status
-                r'<td class="font-4" ><div align=center>\s*(\w+)\s*</div></td>\s*'  # Speed
-                r'<td class="font-4" ><div align=center>\s*(\w+)\s*</div></td>\s*'  # Duplex
-                r'<td class="font-4" ><div align=center>\s*(\w+)\s*</div></td>'      # FlowCtrl
-            )
-            matches = re.findall(pattern, content, re.DOTALL | re.IGNORECASE)
-            for port, name, state, link, speed, duplex, flowctrl in matches:
-                ports[port] = {
-                    'name': name.strip(),
-                    'enabled': state.lower() == 'enable',
-                    'link_status': link.lower(),
-                    'speed': speed.lower(),
-                    'duplex': duplex.lower(),
-                    'flow_control': flowctrl.lower() == 'enable',
-                }
-        elif model == 'gs1915':
-            # GS1915 uses rpport.html with different field names
-            # Port names: rpport_IptPortName?{port}
-            name_matches = re.findall(
-                r'rpport_IptPortName\?(\d+)"[^>]*VALUE="([^"]*)"',
-                content, re.IGNORECASE
-            )
-            for port_id, name in name_matches:
-                if port_id not in ports:
-                    ports[port_id] = {'enabled': False, 'name': '', 'speed': 'auto'}
-                ports[port_id]['name'] = name
-
-            # Port active: rpport_ChkPortActive with VALUE="?{port}" and CHECKED
-            active_matches = re.findall(
-                r'rpport_ChkPortActive[^>]*VALUE="\?(\d+)"([^>]*)',
-                content, re.IGNORECASE
-            )
-            for port_id, attrs in active_matches:
-                if port_id not in ports:
-                    ports[port_id] = {'enabled': False, 'name': '', 'speed': 'auto'}
-                ports[port_id]['enabled'] = 'CHECKED' in attrs.upper()
-
-            # Speed: rpport_SltSpeed?{port} with SELECTED option
-            speed_pattern = r'rpport_SltSpeed\?(\d+)"[^>]*>.*?<OPTION[^>]*SELECTED[^>]*>([^<]+)'
-            speed_matches = re.findall(speed_pattern, content, re.IGNORECASE | re.DOTALL)
-            for port_id, speed_name in speed_matches:
-                if port_id not in ports:
-                    ports[port_id] = {'enabled': False, 'name': '', 'speed': 'auto'}
-                ports[port_id]['speed'] = speed_name.strip().lower()
-        else:
-            # GS1920 format - parse form inputs
-            # Find port names - VALUE attribute is case-insensitive
-            name_matches = re.findall(
-                r'rpPort_Ipt_PortName\?(\d+)"[^>]*VALUE="([^"]*)"',
-                content, re.IGNORECASE
-            )
-            for port_id, name in name_matches:
-                if port_id not in ports:
-                    ports[port_id] = {'enabled': False, 'name': '', 'speed': 'auto'}
-                ports[port_id]['name'] = name
-
-            # Find port states (checkboxes) - checked attribute
-            active_matches = re.findall(
-                r'rpPort_Chk_PortActive[^>]*value="\?(\d+)"[^>]*checked',
-                content, re.IGNORECASE
-            )
-            for port_id in active_matches:
-                if port_id not in ports:
-                    ports[port_id] = {'enabled': False, 'name': '', 'speed': 'auto'}
-                ports[port_id]['enabled'] = True
-
-            # Find speed settings - look for SELECTED option
-            speed_pattern = r'rpPort_Slt_Speed\?(\d+)"[^>]*>.*?<OPTION\s+VALUE=(\w+)\s+SELECTED>([^<]+)'
-            speed_matches = re.findall(speed_pattern, content, re.IGNORECASE | re.DOTALL)
-            for port_id, speed_val, speed_name in speed_matches:
-                if port_id not in ports:
-                    ports[port_id] = {'enabled': False, 'name': '', 'speed': 'auto'}
-                ports[port_id]['speed'] = speed_name.strip().lower()
+        # Cells: port num, name, state, link, speed, duplex, flowctrl
+        for port, cells in self._iter_gs1900_port_rows(content, 7):
+            name, state, link, speed, duplex, flowctrl = cells[1:]
+            ports[port] = {
+                'name': name,
+                'enabled': state.lower() == 'enable',
+                'link_status': link.lower(),
+                'speed': speed.lower(),
+                'duplex': duplex.lower(),
+                'flow_control': flowctrl.lower() == 'enable',
+            }
 
         return ports
 
-    def get_vlans_info(self):
+    def _parse_ports_info_gs1915(self, content):
+        """Parse port information from GS1915 rpport.html."""
+        # Fields are filled across several passes
+        ports = defaultdict(lambda: {'enabled': False, 'name': '', 'speed': 'auto'})
+
+        # Port names: rpport_IptPortName?{port}
+        for match in _RE_PORT_NAME_GS1915.finditer(content):
+            port_id, name = match.group(1, 2)
+            ports[port_id]['name'] = name
+
+        # Port active: rpport_ChkPortActive with VALUE="?{port}" and CHECKED
+        for match in _RE_PORT_ACTIVE_GS1915.finditer(content):
+            port_id, attrs = match.group(1, 2)
+            ports[port_id]['enabled'] = 'CHECKED' in attrs.upper()
+
+        # Speed: rpport_SltSpeed?{port} with SELECTED option
+        for match in _RE_PORT_SPEED_GS1915.finditer(content):
+            port_id, speed_name = match.group(1, 2)
+            ports[port_id]['speed'] = speed_name.lower()
+
+        return dict(ports)
+
+    def _parse_ports_info_gs1920(self, content):
+        """Parse port information from GS1920 rpPort.html form inputs."""
+        # Fields are filled across several passes
+        ports = defaultdict(lambda: {'enabled': False, 'name': '', 'speed': 'auto'})
+
+        # Find port names - VALUE attribute is case-insensitive
+        for match in _RE_PORT_NAME_GS1920.finditer(content):
+            port_id, name = match.group(1, 2)
+            ports[port_id]['name'] = name
+
+        # Find port states (checkboxes) - checked attribute
+        for match in _RE_PORT_ACTIVE_GS1920.finditer(content):
+            port_id = match.group(1)
+            ports[port_id]['enabled'] = True
+
+        # Find speed settings - look for SELECTED option
+        for match in _RE_PORT_SPEED_GS1920.finditer(content):
+            port_id, speed_name = match.group(1, 3)
+            ports[port_id]['speed'] = speed_name.lower()
+
+        return dict(ports)
+
+    def get_vlans_info(self, vlan_ids=None):
         """Get VLAN information from the switch.
 
         GS1920: Uses rpVlantag.html for VLAN list, rpVlanport.html for port settings
         GS1915: Uses rpvlantag.html for VLAN list (lowercase), rpvlanport.html for port settings
         GS1900: Uses different format
+
+        Args:
+            vlan_ids: Optional list of VLAN IDs to return. The switch pages
+                always list every VLAN, so this only trims the result sent
+                back over the connection. Unknown IDs are left out.
+
+        Returns:
+            Dict of VLAN info keyed by VLAN ID string
+        """
+        vlans = self._get_vlans_info()
+        if vlan_ids is None:
+            return vlans
+        return dict((vid, vlans[vid]) for vid in map(str, vlan_ids) if vid in vlans)
+
+    def get_vlan_info(self, vlan_id=None):
+        """Get info for one VLAN, or for every VLAN when vlan_id is None.
+
+        Args:
+            vlan_id: Optional VLAN ID
+
+        Returns:
+            Dict of VLAN info keyed by VLAN ID string, with at most one
+            entry when vlan_id is given
         """
+        if vlan_id is None:
+            return self.get_vlans_info()
+        return self.get_vlans_info([vlan_id])
+
+    def _get_vlans_info(self):
+        """Get info for every VLAN, using the parsed cache when fresh."""
+        cached = self._cache_get(self._parsed_cache, 'vlans_info')
+        if cached is not None:
+            return cached
+
         model = self.detect_model()
 
         if model == 'gs1900':
@@ -450,49 +920,38 @@ class HttpApi(HttpApiBase):
             content = self.get_page('/cgi-bin/dispatcher.cgi?cmd=1283&pageindex=1')
             vlans = self._parse_vlans_info_gs1900(content)
             # Get port PVID settings to determine untagged port membership
-            port_content = self.get_page('/cgi-bin/dispatcher.cgi?cmd=1290')
+            port_content = self.get_page(_VLANPORT_PAGES['gs1900'])
             port_settings = self._parse_port_settings_gs1900(port_content)
-            # Build untagged port membership from PVID assignments
-            for port_id, settings in port_settings.items():
-                pvid = str(settings.get('pvid', 1))
-                if pvid in vlans:
-                    if port_id not in vlans[pvid]['untagged_ports']:
-                        vlans[pvid]['untagged_ports'].append(port_id)
-            # Sort port lists
-            for vid in vlans:
-                vlans[vid]['untagged_ports'] = sorted(
-                    vlans[vid]['untagged_ports'],
-                    key=lambda x: int(x) if x.isdigit() else 0
-                )
-            return vlans
         elif model == 'gs1915':
             # GS1915 uses rpvlantag.html (lowercase) for VLAN list
             # The ?1,1 parameter shows the add form with the VLAN list table
             tag_content = self.get_page('/rpvlantag.html?1,1')
-            port_content = self.get_page('/rpvlanport.html')
+            port_content = self.get_page(_VLANPORT_PAGES['gs1915'])
             vlans = self._parse_vlans_from_tag_page_gs1915(tag_content)
             # Supplement with PVID data
             port_settings = self._parse_vlan_port_settings(port_content)
         else:  # gs1920
-            tag_content = self.get_page('/rpVlantag.html')  # Tag page has ALL VLANs
-            port_content = self.get_page('/rpVlanport.html')  # Port page has PVID info
+            tag_content = self.get_page(_VLANTAG_PAGES['gs1920'])  # Tag page has ALL VLANs
+            port_content = self.get_page(_VLANPORT_PAGES['gs1920'])  # Port page has PVID info
             vlans = self._parse_vlans_from_tag_page(tag_content, model)
             port_settings = self._parse_vlan_port_settings(port_content)
 
-        # Build untagged port membership from PVID assignments
+        # Build untagged port membership from PVID assignments, as integer
+        # port numbers so the lists sort without a key function
+        untagged = dict(
+            (vid, set(int(port_id) for port_id in vlan['untagged_ports']))
+            for vid, vlan in vlans.items()
+        )
         for port_id, settings in port_settings.items():
             pvid = str(settings.get('pvid', 1))
-            if pvid in vlans:
-                if port_id not in vlans[pvid]['untagged_ports']:
-                    vlans[pvid]['untagged_ports'].append(port_id)
-
-        # Sort port lists for consistent output
-        for vid in vlans:
-            vlans[vid]['untagged_ports'] = sorted(
-                vlans[vid]['untagged_ports'],
-                key=lambda x: int(x) if x.isdigit() else 0
-            )
+            if pvid in untagged:
+                untagged[pvid].add(int(port_id))
 
+        # Sort port lists for consistent output, returned as strings
+        for vid, ports in untagged.items():
+            vlans[vid]['untagged_ports'] = [str(port) for port in sorted(ports)]
+
+        self._cache_put(self._parsed_cache, 'vlans_info', vlans)
         return vlans
 
     def _parse_vlans_from_tag_page(self, content, model):
@@ -506,28 +965,51 @@ class HttpApi(HttpApiBase):
           <td>1   </td>
           <td><span class="status-on">ON</span></td>
           <td style="text-align:left" class="word-break">CORE</td>
+
+        Uses lxml when available, otherwise a regex scan.
         """
+        if HAS_LXML:
+            try:
+                doc = lxml.html.fromstring(content)
+            except (etree.ParserError, ValueError):
+                doc = None
+            if doc is not None:
+                return self._parse_vlans_from_tag_page_lxml(doc)
+
         vlans = {}
 
         # Pattern to match VLAN rows - find checkbox name, then VID and Name
         # The checkbox VALUE="?N" is followed by VID in next <td>, status span, then name
-        row_pattern = (
-            r'NAME="rpVlantag_Chk_TabDel"\s+VALUE="\?\d+"'  # Checkbox with index
-            r'.*?</td>\s*'                                   # Close checkbox td
-            r'<td[^>]*>(\d+)\s*</td>\s*'                    # VID
-            r'<td[^>]*>.*?</td>\s*'                         # Active status (ON/OFF span)
-            r'<td[^>]*>\s*(\S[^<]*?)\s*</td>'               # Name (non-empty, trimmed)
-        )
-        matches = re.findall(row_pattern, content, re.IGNORECASE | re.DOTALL)
-        for vid, name in matches:
-            vlans[vid.strip()] = {
-                'name': name.strip(),
+        for match in _RE_VLANTAG_ROW_GS1920.finditer(content):
+            vid, name = match.group(1, 2)
+            vlans[vid] = {
+                'name': name,
                 'tagged_ports': [],
                 'untagged_ports': [],
             }
 
         return vlans
 
+    def _parse_vlans_from_tag_page_lxml(self, doc):
+        """Parse VLAN rows of a parsed rpVlantag.html document."""
+        vlans = {}
+        for chk in doc.iter('input'):
+            if (chk.get('name') or '').lower() != 'rpvlantag_chk_tabdel':
+                continue
+            # Checkbox cell is followed by the VID, status and name cells
+            cells = chk.xpath('ancestor::td[1]/following-sibling::td')
+            if len(cells) < 3:
+                continue
+            vid = cells[0].text_content().strip()
+            name = cells[2].text_content().strip()
+            if vid.isdigit() and name:
+                vlans[vid] = {
+                    'name': name,
+                    'tagged_ports': [],
+                    'untagged_ports': [],
+                }
+        return vlans
+
     def _parse_vlans_info_gs1900(self, content):
         """Parse VLAN information for GS1900 series.
 
@@ -540,15 +1022,10 @@ class HttpApi(HttpApiBase):
         vlans = {}
 
         # GS1900 VLAN list pattern: VID, Name, Type (Default/Static)
-        pattern = (
-            r'<td class="font-4" ><div align=center>\s*(\d+)\s*</div></td>\s*'
-            r'<td class="font-4" ><div align=center>\s*([^<]*?)\s*</div></td>\s*'
-            r'<td class="font-4" ><div align=center>\s*(Default|Static)\s*</div></td>'
-        )
-        matches = re.findall(pattern, content, re.DOTALL | re.IGNORECASE)
-        for vid, name, vtype in matches:
-            vlans[vid.strip()] = {
-                'name': name.strip(),
+        for match in _RE_VLANS_GS1900.finditer(content):
+            vid, name = match.group(1, 2)
+            vlans[vid] = {
+                'name': name,
                 'tagged_ports': [],
                 'untagged_ports': [],
                 'active': True,  # GS1900 doesn't have active/inactive concept
@@ -556,6 +1033,50 @@ class HttpApi(HttpApiBase):
 
         return vlans
 
+    def _iter_gs1900_port_rows(self, content, num_cells):
+        """Iterate over the rows of a GS1900 per-port table.
+
+        Each row starts with a port checkbox and is followed by num_cells
+        table cells before the next checkbox. Rows with fewer cells are
+        skipped. Uses lxml when available, otherwise a regex scan.
+
+        Returns:
+            Iterator of (port_id, list of stripped cell texts) tuples
+        """
+        if HAS_LXML:
+            try:
+                doc = lxml.html.fromstring(content)
+            except (etree.ParserError, ValueError):
+                doc = None
+            if doc is not None:
+                return self._iter_gs1900_port_rows_lxml(doc, num_cells)
+        return self._iter_gs1900_port_rows_re(content, num_cells)
+
+    def _iter_gs1900_port_rows_lxml(self, doc, num_cells):
+        """Iterate over GS1900 per-port table rows of a parsed lxml document."""
+        port, cells = None, []
+        for element in doc.iter('input', 'td'):
+            if element.tag == 'input':
+                if ((element.get('type') or '').lower() == 'checkbox'
+                        and (element.get('name') or '').lower() == 'port'):
+                    value = element.get('value') or ''
+                    port, cells = (value if value.isdigit() else None), []
+            elif port is not None and element.get('class') == 'font-4':
+                cells.append(element.text_content().strip())
+                if len(cells) == num_cells:
+                    yield port, cells
+                    port, cells = None, []
+
+    def _iter_gs1900_port_rows_re(self, content, num_cells):
+        """Iterate over GS1900 per-port table rows using regex scanning."""
+        checks = list(_RE_GS1900_PORT_CHECK.finditer(content))
+        for index, check in enumerate(checks):
+            end = checks[index + 1].start() if index + 1 < len(checks) else len(content)
+            cells = [cell.group(1) for cell in islice(
+                _RE_GS1900_CELL.finditer(content, check.end(), end), num_cells)]
+            if len(cells) == num_cells:
+                yield check.group(1), cells
+
     def _parse_port_settings_gs1900(self, content):
         """Parse port settings from GS1900 cmd=1290.
 
@@ -570,17 +1091,11 @@ class HttpApi(HttpApiBase):
         """
         ports = {}
 
-        # Pattern to extract port settings
-        pattern = (
-            r'<input type="checkbox" name="port" value="(\d+)"'
-            r'.*?<td class="font-4" ><div align=center>\s*\d+\s*</div></td>\s*'  # Port num
-            r'<td class="font-4" ><div align=center>\s*(\d+)\s*</div></td>\s*'   # PVID
-            r'<td class="font-4" ><div align=center>\s*(\w+)\s*</div></td>\s*'   # AcceptFrame
-            r'<td class="font-4" ><div align=center>\s*(\w+)\s*</div></td>\s*'   # IngressCheck
-            r'<td class="font-4" ><div align=center>\s*(\w+)\s*</div></td>'      # VLANTrunk
-        )
-        matches = re.findall(pattern, content, re.DOTALL | re.IGNORECASE)
-        for port, pvid, accept_frame, ingress, trunk in matches:
+        # Cells: port num, PVID, AcceptFrame, IngressCheck, VLANTrunk
+        for port, cells in self._iter_gs1900_port_rows(content, 5):
+            pvid, accept_frame, ingress, trunk = cells[1:]
+            if not pvid.isdigit():
+                continue
             ports[port] = {
                 'pvid': int(pvid),
                 'accept_frame_type': accept_frame,
@@ -599,21 +1114,13 @@ class HttpApi(HttpApiBase):
         vlans = {}
 
         # Pattern to extract VLAN data from the status page rows
-        pattern = (
-            r"<a href='US/(\d+)/rpvlanstatusStatisticsDetail\.html'[^>]*>\s*\d+\s*</a>"
-            r".*?<div align=center>\s*(\d+)\s*</div>"  # VID (duplicated in URL and column)
-            r".*?<div align=center>\s*([^<]*?)\s*</div>"  # Name
-            r".*?<div align=center>\s*([^<]*?)\s*</div>"  # Untagged ports
-            r".*?<div align=center>\s*([^<]*?)\s*</div>"  # Tagged ports
-        )
-        matches = re.findall(pattern, content, re.DOTALL | re.IGNORECASE)
-        for vlan_id, vid2, name, untagged, tagged in matches:
+        for match in _RE_VLANSTATUS_GS1915.finditer(content):
+            vlan_id, name, untagged, tagged = match.group(1, 3, 4, 5)
             # Use the VID from the URL (vlan_id)
-            vid = vlan_id.strip()
-            vlans[vid] = {
-                'name': name.strip(),
-                'tagged_ports': self._parse_port_range(tagged.strip()),
-                'untagged_ports': self._parse_port_range(untagged.strip()),
+            vlans[vlan_id] = {
+                'name': name,
+                'tagged_ports': self._parse_port_range(tagged),
+                'untagged_ports': self._parse_port_range(untagged),
             }
 
         return vlans
@@ -632,15 +1139,10 @@ class HttpApi(HttpApiBase):
         vlans = {}
 
         # Pattern to match VLAN rows - find GetIndexID(VID) followed by Active and Name
-        row_pattern = (
-            r'GetIndexID\((\d+)\)[^<]*</a>'  # VID from JavaScript link
-            r'.*?<div align=center>\s*(Yes|No)\s*</div>'  # Active status
-            r'.*?<div align=center>\s*([^<]*?)\s*</div>'  # Name
-        )
-        matches = re.findall(row_pattern, content, re.IGNORECASE | re.DOTALL)
-        for vid, active, name in matches:
-            vlans[vid.strip()] = {
-                'name': name.strip(),
+        for match in _RE_VLANTAG_ROW_GS1915.finditer(content):
+            vid, active, name = match.group(1, 2, 3)
+            vlans[vid] = {
+                'name': name,
                 'tagged_ports': [],
                 'untagged_ports': [],
                 'active': active.lower() == 'yes',
@@ -650,17 +1152,19 @@ class HttpApi(HttpApiBase):
 
     def get_vlan_port_settings(self):
         """Get VLAN port settings including PVID from rpVlanport.html."""
+        cached = self._cache_get(self._parsed_cache, 'vlan_port_settings')
+        if cached is not None:
+            return cached
+
         model = self.detect_model()
+        content = self.get_page(_model_page(_VLANPORT_PAGES, model))
 
         if model == 'gs1900':
-            content = self.get_page('/cgi-bin/dispatcher.cgi?cmd=1290')
-            return self._parse_port_settings_gs1900(content)
-        elif model == 'gs1915':
-            content = self.get_page('/rpvlanport.html')
-        else:  # gs1920
-            content = self.get_page('/rpVlanport.html')
-
-        return self._parse_vlan_port_settings(content)
+            ports = self._parse_port_settings_gs1900(content)
+        else:
+            ports = self._parse_vlan_port_settings(content)
+        self._cache_put(self._parsed_cache, 'vlan_port_settings', ports)
+        return ports
 
     def _parse_vlan_port_settings(self, content):
         """Parse VLAN port settings from rpVlanport.html.
@@ -670,59 +1174,26 @@ class HttpApi(HttpApiBase):
         """
         ports = {}
 
-        # Parse PVID values - try both formats
-        # GS1920: rpVlanport_Ipt_PVID?1  GS1915: rpvlanport_IptPVID?1
-        pvid_patterns = [
-            r'rpVlanport_Ipt_PVID\?(\d+)[^>]*VALUE="(\d+)"',
-            r'rpvlanport_IptPVID\?(\d+)[^>]*VALUE="(\d+)"',
-        ]
-        for pvid_pattern in pvid_patterns:
-            pvid_matches = re.findall(pvid_pattern, content, re.IGNORECASE)
-            for port_id, pvid in pvid_matches:
-                if port_id not in ports:
-                    ports[port_id] = {}
-                ports[port_id]['pvid'] = int(pvid)
-
-        # Parse Ingress Filtering: checked means enabled
-        # GS1920: rpVlanport_Chk_Ingress  GS1915: rpvlanport_ChkIngress
-        ingress_patterns = [
-            r'rpVlanport_Chk_Ingress[^>]*VALUE="\?(\d+)"([^>]*)',
-            r'rpvlanport_ChkIngress[^>]*VALUE="\?(\d+)"([^>]*)',
-        ]
-        for ingress_pattern in ingress_patterns:
-            ingress_matches = re.findall(ingress_pattern, content, re.IGNORECASE)
-            for port_id, attrs in ingress_matches:
-                if port_id not in ports:
-                    ports[port_id] = {}
-                ports[port_id]['ingress_filtering'] = 'CHECKED' in attrs.upper()
-
-        # Parse VLAN Trunking: checked means enabled
-        # GS1920: rpVlanport_Chk_VLANTrunking  GS1915: rpvlanport_ChkVLANTrunking
-        trunk_patterns = [
-            r'rpVlanport_Chk_VLANTrunking[^>]*VALUE="\?(\d+)"([^>]*)',
-            r'rpvlanport_ChkVLANTrunking[^>]*VALUE="\?(\d+)"([^>]*)',
-        ]
-        for trunk_pattern in trunk_patterns:
-            trunk_matches = re.findall(trunk_pattern, content, re.IGNORECASE)
-            for port_id, attrs in trunk_matches:
-                if port_id not in ports:
-                    ports[port_id] = {}
-                ports[port_id]['vlan_trunking'] = 'CHECKED' in attrs.upper()
-
-        # Parse Acceptable Frame Type from select
-        # Options: All Frames (0), Tagged Only (1), Untagged Only (2)
-        # GS1920: rpVlanport_Slt_AcceptableFrame  GS1915: rpvlanport_SltAcceptableFrame
-        frame_patterns = [
-            r'rpVlanport_Slt_AcceptableFrame\?(\d+)[^>]*>.*?<OPTION[^>]*VALUE="?(\d+)"?[^>]*SELECTED',
-            r'rpvlanport_SltAcceptableFrame\?(\d+)[^>]*>.*?<OPTION[^>]*VALUE="?(\d+)"?[^>]*SELECTED',
-        ]
-        frame_types = {0: 'all', 1: 'tagged_only', 2: 'untagged_only'}
-        for frame_pattern in frame_patterns:
-            frame_matches = re.findall(frame_pattern, content, re.IGNORECASE | re.DOTALL)
-            for port_id, frame_type in frame_matches:
-                if port_id not in ports:
-                    ports[port_id] = {}
-                ports[port_id]['acceptable_frame_type'] = frame_types.get(int(frame_type), 'all')
+        # Walk the page once; the matched named group tells which field it is
+        for match in _RE_VLANPORT.finditer(content):
+            field = match.lastgroup
+            port_id = match.group(match.lastindex + 1)
+            value = match.group(match.lastindex + 2)
+            if port_id not in ports:
+                ports[port_id] = {}
+
+            if field == 'pvid':
+                ports[port_id]['pvid'] = int(value)
+            elif field == 'ingress':
+                # Ingress Filtering: checked means enabled
+                ports[port_id]['ingress_filtering'] = 'CHECKED' in value.upper()
+            elif field == 'trunk':
+                # VLAN Trunking: checked means enabled
+                ports[port_id]['vlan_trunking'] = 'CHECKED' in value.upper()
+            else:
+                # Acceptable Frame Type select
+                # Options: All Frames (0), Tagged Only (1), Untagged Only (2)
+                ports[port_id]['acceptable_frame_type'] = _VLANPORT_FRAME_TYPES.get(int(value), 'all')
 
         return ports
 
@@ -732,15 +1203,14 @@ class HttpApi(HttpApiBase):
             return []
         ports = []
         for part in port_str.split(','):
-            part = part.strip()
-            if '-' in part:
-                try:
-                    start, end = part.split('-')
-                    ports.extend([str(p) for p in range(int(start), int(end) + 1)])
-                except ValueError:
-                    continue
-            elif part.isdigit():
-                ports.append(part)
+            match = _RE_PORT_PART.match(part)
+            if not match:
+                continue
+            start, end = match.groups()
+            if end:
+                ports.extend(map(str, range(int(start), int(end) + 1)))
+            else:
+                ports.append(start)
         return ports
 
     def _parse_form_checkboxes(self, content, name_pattern):
@@ -754,10 +1224,9 @@ class HttpApi(HttpApiBase):
             List of values that are checked
         """
         checked = []
-        pattern = r'<INPUT[^>]*NAME="%s"[^>]*VALUE="([^"]*)"[^>]*>' % name_pattern
-        for match in re.finditer(pattern, content, re.IGNORECASE):
-            if 'CHECKED' in match.group(0).upper():
-                checked.append(match.group(1))
+        pattern = _compiled(_FORM_CHECKBOX_TEMPLATE, name_pattern, re.IGNORECASE)
+        for match in pattern.finditer(content):
+            checked.append(match.group(1))
         return checked
 
     def _parse_form_inputs(self, content, name_pattern):
@@ -771,8 +1240,8 @@ class HttpApi(HttpApiBase):
             Dict of {field_name: value}
         """
         inputs = {}
-        pattern = r'<INPUT[^>]*NAME="(%s)"[^>]*VALUE="([^"]*)"' % name_pattern
-        for match in re.finditer(pattern, content, re.IGNORECASE):
+        pattern = _compiled(_FORM_INPUT_TEMPLATE, name_pattern, re.IGNORECASE)
+        for match in pattern.finditer(content):
             inputs[match.group(1)] = match.group(2)
         return inputs
 
@@ -787,26 +1256,18 @@ class HttpApi(HttpApiBase):
             Dict of {field_name: selected_value}
         """
         selects = {}
-        # Match SELECT with SELECTED OPTION
-        pattern = r'<SELECT[^>]*NAME="(%s)"[^>]*>.*?<OPTION[^>]*VALUE="([^"]*)"[^>]*SELECTED' % name_pattern
-        for match in re.finditer(pattern, content, re.IGNORECASE | re.DOTALL):
-            selects[match.group(1)] = match.group(2)
-        # Also try SELECTED before VALUE
-        pattern2 = r'<SELECT[^>]*NAME="(%s)"[^>]*>.*?<OPTION[^>]*SELECTED[^>]*VALUE="([^"]*)"' % name_pattern
-        for match in re.finditer(pattern2, content, re.IGNORECASE | re.DOTALL):
-            if match.group(1) not in selects:
-                selects[match.group(1)] = match.group(2)
+        # Match SELECT with SELECTED OPTION, in a single pass
+        pattern = _compiled(_FORM_SELECT_TEMPLATE, name_pattern, re.IGNORECASE | re.DOTALL)
+        for match in pattern.finditer(content):
+            # First SELECTED option wins
+            value = match.group(2)
+            selects.setdefault(match.group(1), value if value is not None else match.group(3))
         return selects
 
     def get_vlan_tag_page(self):
         """Get the VLAN tag configuration page (rpVlantag.html)."""
         model = self.detect_model()
-        if model == 'gs1900':
-            return self.get_page(1282)
-        elif model == 'gs1915':
-            return self.get_page('/rpvlantag.html')
-        else:  # gs1920
-            return self.get_page('/rpVlantag.html')
+        return self.get_page(_model_page(_VLANTAG_PAGES, model))
 
     def get_vlan_index(self, vlan_id):
         """Get the table index for a VLAN ID.
@@ -817,30 +1278,69 @@ class HttpApi(HttpApiBase):
         """
         model = self.detect_model()
 
+        if model == 'gs1915':
+            content = self.get_page('/rpvlantag.html?1,1')
+        else:
+            content = self.get_vlan_tag_page()
+
+        if HAS_LXML:
+            try:
+                doc = lxml.html.fromstring(content)
+            except (etree.ParserError, ValueError):
+                doc = None
+            if doc is not None:
+                return self._get_vlan_index_lxml(doc, vlan_id, model)
+
+        vlan_id = str(vlan_id)
         if model == 'gs1915':
             # GS1915: Parse from rpvlantag.html to find the ChkDel value for this VLAN
             # The checkbox VALUE is like "?slot,index" and we need to find which row has our VLAN ID
-            content = self.get_page('/rpvlantag.html?1,1')
-            rows = re.findall(r'<tr[^>]*>(.*?)</tr>', content, re.DOTALL | re.IGNORECASE)
-            for row in rows:
-                chk_match = re.search(r'rpvlantag_ChkDel[^>]*VALUE="\?([^"]+)"', row, re.IGNORECASE)
-                vid_match = re.search(r'GetIndexID\((\d+)\)', row)
-                if chk_match and vid_match and vid_match.group(1) == str(vlan_id):
+            for row in _RE_TABLE_ROW_GS1915.findall(content):
+                chk_match = _RE_VLANTAG_CHKDEL_GS1915.search(row)
+                vid_match = _RE_GET_INDEX_ID.search(row)
+                if chk_match and vid_match and vid_match.group(1) == vlan_id:
                     return chk_match.group(1)  # Returns 'slot,index' format
             return None
         else:
-            # GS1920: Parse tbody rows from rpVlantag.html
-            content = self.get_vlan_tag_page()
-            tbody_match = re.search(r'<tbody>(.*?)</tbody>', content, re.DOTALL)
+            # GS1920: Scan tbody rows from rpVlantag.html, stopping at the first hit
+            tbody_match = _RE_TBODY.search(content)
             if tbody_match:
-                rows = re.findall(r'<tr>(.*?)</tr>', tbody_match.group(1), re.DOTALL)
-                for row in rows:
-                    chk = re.search(r'VALUE="\?(\d+)"', row)
-                    vid = re.search(r'</td>\s*<td>(\d+)\s*</td>', row)
-                    if chk and vid and vid.group(1) == str(vlan_id):
-                        return chk.group(1)
+                for match in _RE_VLANTAG_INDEX_GS1920.finditer(tbody_match.group(1)):
+                    if match.group(2) == vlan_id:
+                        return match.group(1)
             return None
 
+    def _get_vlan_index_lxml(self, doc, vlan_id, model):
+        """Find the table index for a VLAN ID in a parsed VLAN tag page."""
+        vlan_id = str(vlan_id)
+
+        if model == 'gs1915':
+            # Row has a GetIndexID(VID) link and a rpvlantag_ChkDel "?slot,index" checkbox
+            for row in doc.iter('tr'):
+                vids = [_RE_GET_INDEX_ID.search(attr)
+                        for attr in row.xpath('.//@*[contains(., "GetIndexID(")]')]
+                if not any(vid and vid.group(1) == vlan_id for vid in vids):
+                    continue
+                for chk in row.iter('input'):
+                    value = chk.get('value') or ''
+                    if 'rpvlantag_chkdel' in (chk.get('name') or '').lower() and value.startswith('?'):
+                        return value[1:]  # Returns 'slot,index' format
+            return None
+
+        # GS1920: first tbody, rows of checkbox "?index" then VID cell
+        tbody = doc.find('.//tbody')
+        if tbody is None:
+            return None
+        for row in tbody.iter('tr'):
+            cells = [cell.text_content().strip() for cell in row.findall('td')[1:]]
+            if not cells or cells[0] != vlan_id:
+                continue
+            for chk in row.iter('input'):
+                value = chk.get('value') or ''
+                if value.startswith('?') and value[1:].isdigit():
+                    return value[1:]
+        return None
+
     def create_vlan(self, config):
         """Create or update a VLAN on the switch.
 
@@ -871,11 +1371,22 @@ class HttpApi(HttpApiBase):
 
         return {'success': success, 'msg': msg}
 
+    def create_vlans(self, configs):
+        """Create or update several VLANs in one call.
+
+        The switch forms take one VLAN per request, so this still posts
+        each VLAN, but saves a connection round trip per VLAN.
+
+        Args:
+            configs: List of config dicts accepted by create_vlan()
+
+        Returns:
+            List of create_vlan() results, in the same order
+        """
+        return [self.create_vlan(config) for config in configs]
+
     def _create_vlan_gs1915(self, vlan_id, name, tagged_ports, untagged_ports, num_ports):
         """Create VLAN on GS1915 series."""
-        tagged_ports = [str(p) for p in (tagged_ports or [])]
-        untagged_ports = [str(p) for p in (untagged_ports or [])]
-
         # Build the VLAN creation form as list of tuples
         form_data = [
             ('rpvlantag_ChkActive', 'on'),
@@ -891,15 +1402,11 @@ class HttpApi(HttpApiBase):
         # Set port membership for each port
         # RpgControl: 0=Normal(not member), 1=Fixed(member), 2=Forbidden
         # ChkTagging: checked=TX tagged, unchecked=TX untagged
+        actions = _vlan_member_actions(num_ports, tagged_ports, untagged_ports)
+        entries = _vlan_member_entries('rpvlantag_RpgControl', 'rpvlantag_ChkTagging', num_ports)
+        extend = form_data.extend
         for port in range(1, num_ports + 1):
-            port_str = str(port)
-            if port_str in tagged_ports:
-                form_data.append(('rpvlantag_RpgControl?%d' % port, '1'))
-                form_data.append(('rpvlantag_ChkTagging', '?%d' % port))
-            elif port_str in untagged_ports:
-                form_data.append(('rpvlantag_RpgControl?%d' % port, '1'))
-            else:
-                form_data.append(('rpvlantag_RpgControl?%d' % port, '0'))
+            extend(entries[actions[port]][port])
 
         code, response = self.post_form('/Forms/rpvlantag_1', form_data)
         if code == 200 and 'Error' not in response:
@@ -908,9 +1415,6 @@ class HttpApi(HttpApiBase):
 
     def _create_vlan_gs1920(self, vlan_id, name, tagged_ports, untagged_ports, num_ports):
         """Create VLAN on GS1920 series."""
-        tagged_ports = [str(p) for p in (tagged_ports or [])]
-        untagged_ports = [str(p) for p in (untagged_ports or [])]
-
         # First, open the add dialog (NumID=2)
         data = {
             'rpVlantag_HidBtn_IndexID': '0',
@@ -930,15 +1434,11 @@ class HttpApi(HttpApiBase):
         # Set port membership for each port
         # Rdo_Control: 0=Normal(not member), 1=Fixed(member), 2=Forbidden
         # Chk_Tagging: checked=TX tagged, unchecked=TX untagged
+        actions = _vlan_member_actions(num_ports, tagged_ports, untagged_ports)
+        entries = _vlan_member_entries('rpVlantag_Toggle_Rdo_Control', 'rpVlantag_Toggle_Chk_Tagging', num_ports)
+        extend = form_data.extend
         for port in range(1, num_ports + 1):
-            port_str = str(port)
-            if port_str in tagged_ports:
-                form_data.append(('rpVlantag_Toggle_Rdo_Control?%d' % port, '1'))
-                form_data.append(('rpVlantag_Toggle_Chk_Tagging', '?%d' % port))
-            elif port_str in untagged_ports:
-                form_data.append(('rpVlantag_Toggle_Rdo_Control?%d' % port, '1'))
-            else:
-                form_data.append(('rpVlantag_Toggle_Rdo_Control?%d' % port, '0'))
+            extend(entries[actions[port]][port])
 
         code, response = self.post_form('/Forms/rpVlantag_1', form_data)
         if code == 200 and 'Error' not in response:
@@ -987,6 +1487,25 @@ class HttpApi(HttpApiBase):
         else:  # gs1920
             return self._delete_vlan_gs1920(vlan_id)
 
+    def delete_vlans(self, vlan_ids):
+        """Delete several VLANs in one call.
+
+        Like create_vlans(), each VLAN is still its own form POST, but the
+        module makes a single connection round trip for all of them.
+
+        Args:
+            vlan_ids: List of VLAN IDs to delete
+
+        Returns:
+            List of dicts with 'success' and 'msg' keys, in the same order,
+            matching create_vlans()
+        """
+        results = []
+        for vlan_id in vlan_ids:
+            success, msg = self.delete_vlan(vlan_id)
+            results.append({'success': success, 'msg': msg})
+        return results
+
     def _delete_vlan_gs1915(self, vlan_id):
         """Delete VLAN on GS1915 series."""
         # Find the VLAN's checkbox value (format: 'slot,index')
@@ -1066,6 +1585,9 @@ class HttpApi(HttpApiBase):
         Returns:
             Tuple of (success, message)
         """
+        if _invalid_port_ids([port_id], num_ports):
+            return False, 'Invalid port ID %s' % port_id
+
         model = self.detect_model()
         if model == 'gs1900':
             return self._set_port_pvid_gs1900(
@@ -1083,96 +1605,173 @@ class HttpApi(HttpApiBase):
                 ingress_filtering, acceptable_frame_type
             )
 
+    def set_ports_pvid(self, port_settings, num_ports=28):
+        """Set the PVID and related settings for several ports in one batch.
+
+        GS1915/GS1920 read the VLAN port page once and apply all changes
+        with a single POST. GS1900 edits one port list per submit, so
+        ports are set one at a time.
+
+        Args:
+            port_settings: Dict of port ID to a dict with a pvid key and
+                optional vlan_trunking, ingress_filtering and
+                acceptable_frame_type keys (missing or None=preserve)
+            num_ports: Total number of ports on the switch
+
+        Returns:
+            Tuple of (success, message)
+        """
+        if not port_settings:
+            return True, 'No ports to configure'
+
+        invalid = _invalid_port_ids(port_settings, num_ports)
+        if invalid:
+            return False, 'Invalid port IDs %s' % ', '.join(invalid)
+
+        model = self.detect_model()
+        if model == 'gs1900':
+            failed = []
+            for port_id, settings in port_settings.items():
+                success, dummy = self._set_port_pvid_gs1900(
+                    port_id, settings['pvid'], settings.get('vlan_trunking'),
+                    settings.get('ingress_filtering'), settings.get('acceptable_frame_type')
+                )
+                if not success:
+                    failed.append(str(port_id))
+            if failed:
+                return False, 'Failed to set PVID on ports %s' % ', '.join(failed)
+        elif model == 'gs1915':
+            if not self._post_vlan_port_form_gs1915(port_settings, num_ports):
+                return False, 'Failed to set PVID on %s' % _ports_label(port_settings).lower()
+        else:  # gs1920
+            if not self._post_vlan_port_form_gs1920(port_settings, num_ports):
+                return False, 'Failed to set PVID on %s' % _ports_label(port_settings).lower()
+        return True, '%s PVID set' % _ports_label(port_settings)
+
     def _set_port_pvid_gs1915(self, port_id, pvid, num_ports, vlan_trunking=None,
                                ingress_filtering=None, acceptable_frame_type=None):
         """Set port PVID and VLAN settings on GS1915 series."""
+        settings = {'pvid': pvid, 'vlan_trunking': vlan_trunking}
+        if self._post_vlan_port_form_gs1915({port_id: settings}, num_ports):
+            return True, 'Port %s PVID set to %s' % (port_id, pvid)
+        return False, 'Failed to set port %s PVID' % port_id
+
+    def _post_vlan_port_form_gs1915(self, port_settings, num_ports):
+        """Apply port VLAN settings with one POST of the GS1915 form.
+
+        Args:
+            port_settings: Dict of port ID to settings, as for set_ports_pvid()
+            num_ports: Total number of ports on the switch
+
+        Returns:
+            True if the switch accepted the form
+        """
         # Get current port VLAN settings
         content = self.get_page('/rpvlanport.html')
 
         # Parse current settings for all ports
         current_settings = self._parse_vlan_port_settings(content)
 
+        # Canonical string form, so '05' still matches port 5
+        targets = dict([(str(int(port_id)), settings)
+                        for port_id, settings in port_settings.items()])
+
         # Build form data - GS1915 uses lowercase field names
         form_data = [('rpvlanport_HidBtnNum', '1')]  # Apply
+        append = form_data.append
 
-        for port in range(1, num_ports + 1):
-            port_str = str(port)
+        for dummy, port_str, qmark in _port_labels(num_ports):
             current = current_settings.get(port_str, {})
+            target = targets.get(port_str, {})
 
             # Set PVID - GS1915: rpvlanport_IptPVID?{port}
-            if port == int(port_id):
-                form_data.append(('rpvlanport_IptPVID?%d' % port, str(pvid)))
-            else:
-                current_pvid = current.get('pvid', 1)
-                form_data.append(('rpvlanport_IptPVID?%d' % port, str(current_pvid)))
+            pvid = target.get('pvid')
+            if pvid is None:
+                pvid = current.get('pvid', 1)
+            append(('rpvlanport_IptPVID' + qmark, str(pvid)))
 
             # VLAN Trunking checkbox - GS1915: rpvlanport_ChkVLANTrunking
-            if port == int(port_id) and vlan_trunking is not None:
-                set_trunking = vlan_trunking
-            else:
+            set_trunking = target.get('vlan_trunking')
+            if set_trunking is None:
                 set_trunking = current.get('vlan_trunking', False)
             if set_trunking:
-                form_data.append(('rpvlanport_ChkVLANTrunking', '?%d' % port))
+                append(('rpvlanport_ChkVLANTrunking', qmark))
 
         code, response = self.post_form('/Forms/rpvlanport_1', form_data)
-        if code == 200 and 'Error' not in response:
-            return True, 'Port %s PVID set to %s' % (port_id, pvid)
-        return False, 'Failed to set port %s PVID' % port_id
+        return code == 200 and 'Error' not in response
 
     def _set_port_pvid_gs1920(self, port_id, pvid, num_ports, vlan_trunking=None,
                                ingress_filtering=None, acceptable_frame_type=None):
         """Set port PVID and VLAN settings on GS1920 series."""
+        settings = {
+            'pvid': pvid,
+            'vlan_trunking': vlan_trunking,
+            'ingress_filtering': ingress_filtering,
+            'acceptable_frame_type': acceptable_frame_type,
+        }
+        if self._post_vlan_port_form_gs1920({port_id: settings}, num_ports):
+            return True, 'Port %s PVID set to %s' % (port_id, pvid)
+        return False, 'Failed to set port %s PVID' % port_id
+
+    def _post_vlan_port_form_gs1920(self, port_settings, num_ports):
+        """Apply port VLAN settings with one POST of the GS1920 form.
+
+        Args:
+            port_settings: Dict of port ID to settings, as for set_ports_pvid()
+            num_ports: Total number of ports on the switch
+
+        Returns:
+            True if the switch accepted the form
+        """
         # Get current port VLAN settings
         content = self.get_page('/rpVlanport.html')
 
         # Parse current settings for all ports
         current_settings = self._parse_vlan_port_settings(content)
 
+        # Canonical string form, so '05' still matches port 5
+        targets = dict([(str(int(port_id)), settings)
+                        for port_id, settings in port_settings.items()])
+
+        # Acceptable frame type: 00000000=all, 00000001=tagged, 00000002=untagged
+        aft_map = {'all': '00000000', 'tagged': '00000001', 'untagged': '00000002'}
+
         # Build form data - checkboxes use list of tuples
         form_data = [('rpVlanport_HidBtn_NumID', '1')]  # Apply
+        append = form_data.append
 
-        for port in range(1, num_ports + 1):
-            port_str = str(port)
+        for dummy, port_str, qmark in _port_labels(num_ports):
             current = current_settings.get(port_str, {})
+            target = targets.get(port_str, {})
 
             # Set PVID
-            if port == int(port_id):
-                form_data.append(('rpVlanport_Ipt_PVID?%d' % port, str(pvid)))
-            else:
-                current_pvid = current.get('pvid', 1)
-                form_data.append(('rpVlanport_Ipt_PVID?%d' % port, str(current_pvid)))
+            pvid = target.get('pvid')
+            if pvid is None:
+                pvid = current.get('pvid', 1)
+            append(('rpVlanport_Ipt_PVID' + qmark, str(pvid)))
 
-            # Acceptable frame type: 00000000=all, 00000001=tagged, 00000002=untagged
-            if port == int(port_id) and acceptable_frame_type is not None:
-                aft_map = {'all': '00000000', 'tagged': '00000001', 'untagged': '00000002'}
-                aft_value = aft_map.get(acceptable_frame_type, '00000000')
-            else:
-                # Preserve current setting
-                current_aft = current.get('acceptable_frame_type', 'all')
-                aft_map = {'all': '00000000', 'tagged': '00000001', 'untagged': '00000002'}
-                aft_value = aft_map.get(current_aft, '00000000')
-            form_data.append(('rpVlanport_Slt_AcceptableFrame?%d' % port, aft_value))
+            # Acceptable frame type, preserving the current setting
+            aft = target.get('acceptable_frame_type')
+            if aft is None:
+                aft = current.get('acceptable_frame_type', 'all')
+            append(('rpVlanport_Slt_AcceptableFrame' + qmark, aft_map.get(aft, '00000000')))
 
             # Ingress filtering checkbox
-            if port == int(port_id) and ingress_filtering is not None:
-                set_ingress = ingress_filtering
-            else:
+            set_ingress = target.get('ingress_filtering')
+            if set_ingress is None:
                 set_ingress = current.get('ingress_filtering', False)
             if set_ingress:
-                form_data.append(('rpVlanport_Chk_Ingress', '?%d' % port))
+                append(('rpVlanport_Chk_Ingress', qmark))
 
             # VLAN Trunking checkbox
-            if port == int(port_id) and vlan_trunking is not None:
-                set_trunking = vlan_trunking
-            else:
+            set_trunking = target.get('vlan_trunking')
+            if set_trunking is None:
                 set_trunking = current.get('vlan_trunking', False)
             if set_trunking:
-                form_data.append(('rpVlanport_Chk_VLANTrunking', '?%d' % port))
+                append(('rpVlanport_Chk_VLANTrunking', qmark))
 
         code, response = self.post_form('/Forms/rpVlanport_1', form_data)
-        if code == 200 and 'Error' not in response:
-            return True, 'Port %s PVID set to %s' % (port_id, pvid)
-        return False, 'Failed to set port %s PVID' % port_id
+        return code == 200 and 'Error' not in response
 
     def _set_port_pvid_gs1900(self, port_id, pvid, vlan_trunking=None,
                                ingress_filtering=None, acceptable_frame_type=None):
@@ -1208,6 +1807,9 @@ class HttpApi(HttpApiBase):
 
     def configure_port(self, port_id, config):
         """Configure a port on the switch."""
+        if _invalid_port_ids([port_id]):
+            return False, 'Invalid port ID %s' % port_id
+
         model = self.detect_model()
 
         if model == 'gs1900':
@@ -1217,74 +1819,196 @@ class HttpApi(HttpApiBase):
         else:  # gs1920
             return self._configure_port_gs1920(port_id, config)
 
-    def _configure_port_gs1915(self, port_id, config):
-        """Configure port on GS1915 using read-modify-write pattern."""
-        # STEP 1: READ current port page
-        content = self.get_page('/rpport.html')
+    def configure_ports(self, port_configs):
+        """Configure several ports on the switch in one batch.
+
+        GS1915/GS1920 read the port page once and apply all changes
+        with a single POST. GS1900 has no multi-port form, so ports are
+        configured one at a time.
 
-        # Parse all currently enabled ports (checkboxes)
-        # GS1915 uses rpport_ChkPortActive with VALUE="?{port}"
+        Args:
+            port_configs: Dict of port ID to the config accepted by
+                configure_port()
+
+        Returns:
+            Tuple of (success, message)
+        """
+        if not port_configs:
+            return True, 'No ports to configure'
+
+        invalid = _invalid_port_ids(port_configs)
+        if invalid:
+            return False, 'Invalid port IDs %s' % ', '.join(invalid)
+
+        model = self.detect_model()
+
+        if model == 'gs1900':
+            failed = []
+            for port_id, config in port_configs.items():
+                result = self._configure_port_gs1900(port_id, config)
+                if result is not None and result[0] != 200:
+                    failed.append(str(port_id))
+            if failed:
+                return False, 'Failed to configure ports %s' % ', '.join(failed)
+            return True, '%s configured' % _ports_label(port_configs)
+        elif model == 'gs1915':
+            return self._configure_ports_gs1915(port_configs)
+        else:  # gs1920
+            return self._configure_ports_gs1920(port_configs)
+
+    def _parse_port_form(self, content, fields):
+        """Parse the current state of a GS1915/GS1920 port config form.
+
+        Args:
+            content: HTML content of rpport.html / rpPort.html
+            fields: Tuple of (enable checkbox name, name input prefix,
+                speed select prefix)
+
+        Returns:
+            Tuple of (set of enabled port IDs, {name field: value},
+            {speed field: selected value})
+        """
         enabled_ports = set()
-        for match in re.finditer(
-            r'<INPUT[^>]*NAME="rpport_ChkPortActive"[^>]*VALUE="\?(\d+)"[^>]*>',
-            content, re.IGNORECASE
-        ):
-            if 'CHECKED' in match.group(0).upper():
-                enabled_ports.add(match.group(1))
+        port_names = {}
+        port_speeds = {}
+        for field, key, value in self._iter_port_form(content, fields):
+            if field == 'active':
+                enabled_ports.add(key)
+            elif field == 'name':
+                port_names[key] = value
+            else:
+                port_speeds.setdefault(key, value)
+        return enabled_ports, port_names, port_speeds
 
-        # Parse all port names - GS1915: rpport_IptPortName?{port}
-        port_names = self._parse_form_inputs(content, r'rpport_IptPortName\?\d+')
+    def _iter_port_fields(self, content, fields, port_configs):
+        """Yield the POST fields of a port config form with changes applied.
 
-        # Parse all port speeds - GS1915: rpport_SltSpeed?{port}
-        port_speeds = self._parse_form_selects(content, r'rpport_SltSpeed\?\d+')
+        Walks the page once and emits each current field, replaced by the
+        requested value where port_configs changes it, followed by the
+        requested fields the page did not have.
 
-        # STEP 2: MODIFY - apply requested changes
-        port_id_str = str(port_id)
+        Args:
+            content: HTML content of rpport.html / rpPort.html
+            fields: Tuple of (enable checkbox name, name input prefix,
+                speed select prefix)
+            port_configs: Dict of port ID to config with optional
+                enabled, name and speed keys
 
-        if config.get('enabled') is not None:
-            if config['enabled']:
-                enabled_ports.add(port_id_str)
+        Returns:
+            Iterator of (field name, value) tuples
+        """
+        active_name, name_field, speed_field = fields
+        enabled = {}
+        overrides = {}
+        for port_id, config in port_configs.items():
+            port_id_str = str(int(port_id))
+            if config.get('enabled') is not None:
+                enabled[port_id_str] = bool(config['enabled'])
+            if config.get('name') is not None:
+                overrides['%s?%s' % (name_field, port_id_str)] = config['name']
+            if config.get('speed') is not None:
+                overrides['%s?%s' % (speed_field, port_id_str)] = _PORT_SPEED_VALUES.get(
+                    config['speed'], '00000000'
+                )
+
+        # Checkbox ports and field names never collide, so one set does
+        seen = set()
+        for field, key, value in self._iter_port_form(content, fields):
+            if key in seen:
+                continue
+            seen.add(key)
+            if field == 'active':
+                if enabled.get(key, True):
+                    yield active_name, '?' + key
             else:
-                enabled_ports.discard(port_id_str)
+                yield key, overrides.get(key, value)
 
-        if config.get('name') is not None:
-            port_names['rpport_IptPortName?%s' % port_id_str] = config['name']
-
-        if config.get('speed') is not None:
-            speed_map = {
-                'auto': '00000000',
-                '10m-half': '00000006',
-                '10m-full': '00000007',
-                '100m-half': '00000004',
-                '100m-full': '00000005',
-                '1g-full': '00000003',
-            }
-            port_speeds['rpport_SltSpeed?%s' % port_id_str] = speed_map.get(
-                config['speed'], '00000000'
-            )
+        for port, is_enabled in enabled.items():
+            if is_enabled and port not in seen:
+                yield active_name, '?' + port
+        for key, value in overrides.items():
+            if key not in seen:
+                yield key, value
 
-        # STEP 3: WRITE - build form data with ALL current state
-        form_data = []
+    def _iter_port_form(self, content, fields):
+        """Iterate over the fields of a GS1915/GS1920 port config form.
 
-        # Include all enabled port checkboxes
-        for port in sorted(enabled_ports, key=int):
-            form_data.append(('rpport_ChkPortActive', '?%s' % port))
+        Uses the lxml pull parser when available, otherwise a single-pass
+        regex scan.
 
-        # Include all port names
-        for field, value in port_names.items():
-            form_data.append((field, value))
+        Returns:
+            Iterator of ('active', port ID, None) for checked enable
+            checkboxes, and ('name' or 'speed', field name, value) tuples
+        """
+        if HAS_LXML:
+            found = False
+            try:
+                for item in self._iter_port_form_lxml(content, fields):
+                    found = True
+                    yield item
+                return
+            except (etree.LxmlError, ValueError):
+                if found:
+                    raise
+        for item in self._iter_port_form_re(content, fields):
+            yield item
+
+    def _iter_port_form_lxml(self, content, fields):
+        """Iterate over port config form fields with lxml's pull parser."""
+        active_name = fields[0].lower()
+        name_prefix = fields[1].lower() + '?'
+        speed_prefix = fields[2].lower() + '?'
+
+        for element in _iter_pull_elements(content, ('input', 'select')):
+            name = element.get('name') or ''
+            lower_name = name.lower()
+            if element.tag == 'input':
+                value = element.get('value')
+                if lower_name == active_name:
+                    if (element.get('checked') is not None and value
+                            and value[0] == '?' and value[1:].isdigit()):
+                        yield 'active', value[1:], None
+                elif (value is not None and lower_name.startswith(name_prefix)
+                        and name[len(name_prefix):].isdigit()):
+                    yield 'name', name, value
+            elif lower_name.startswith(speed_prefix) and name[len(speed_prefix):].isdigit():
+                for option in element.iter('option'):
+                    if option.get('selected') is not None and option.get('value') is not None:
+                        yield 'speed', name, option.get('value')
+                        break
+
+    def _iter_port_form_re(self, content, fields):
+        """Iterate over port config form fields with the single-pass regex."""
+        pattern = _compiled(_PORT_FORM_TEMPLATE, fields, re.IGNORECASE | re.DOTALL)
+        for match in pattern.finditer(content):
+            field = match.lastgroup
+            index = match.lastindex
+            if field == 'active':
+                yield field, match.group(index + 1), None
+            elif field == 'name':
+                yield field, match.group(index + 1), match.group(index + 2)
+            else:
+                value = match.group(index + 2)
+                yield field, match.group(index + 1), value if value is not None else match.group(index + 3)
 
-        # Include all port speeds
-        for field, value in port_speeds.items():
-            form_data.append((field, value))
+    def _configure_port_gs1915(self, port_id, config):
+        """Configure port on GS1915 using read-modify-write pattern."""
+        return self._configure_ports_gs1915({port_id: config})
+
+    def _configure_ports_gs1915(self, port_configs):
+        """Configure ports on GS1915 with a single read-modify-write."""
+        # READ the current port page and WRITE it back with the requested
+        # changes applied, so all other port settings are preserved
+        content = self.get_page('/rpport.html')
+        form_data = list(self._iter_port_fields(content, _PORT_FORM_FIELDS_GS1915, port_configs))
 
         # Add apply button - GS1915: rpport_HidBtnNum
         form_data.append(('rpport_HidBtnNum', '1'))
 
         code, response = self.post_form('/Forms/rpport_1', form_data)
         if code == 200:
-            return True, 'Port %s configured' % port_id
-        return False, 'Failed to configure port %s' % port_id
+            return True, '%s configured' % _ports_label(port_configs)
+        return False, 'Failed to configure %s' % _ports_label(port_configs).lower()
 
     def _configure_port_gs1920(self, port_id, config):
         """Configure port on GS1920 using read-modify-write pattern.
@@ -1292,71 +2016,22 @@ class HttpApi(HttpApiBase):
         IMPORTANT: This method reads current state first and preserves all
         existing settings to prevent accidentally disabling all ports.
         """
-        # STEP 1: READ current port page
-        content = self.get_page('/rpPort.html')
-
-        # Parse all currently enabled ports (checkboxes)
-        enabled_ports = set()
-        for match in re.finditer(
-            r'<INPUT[^>]*NAME="rpPort_Chk_PortActive"[^>]*VALUE="\?(\d+)"[^>]*>',
-            content, re.IGNORECASE
-        ):
-            if 'CHECKED' in match.group(0).upper():
-                enabled_ports.add(match.group(1))
-
-        # Parse all port names
-        port_names = self._parse_form_inputs(content, r'rpPort_Ipt_PortName\?\d+')
-
-        # Parse all port speeds
-        port_speeds = self._parse_form_selects(content, r'rpPort_Slt_Speed\?\d+')
-
-        # STEP 2: MODIFY - apply requested changes
-        port_id_str = str(port_id)
-
-        if config.get('enabled') is not None:
-            if config['enabled']:
-                enabled_ports.add(port_id_str)
-            else:
-                enabled_ports.discard(port_id_str)
-
-        if config.get('name') is not None:
-            port_names['rpPort_Ipt_PortName?%s' % port_id_str] = config['name']
-
-        if config.get('speed') is not None:
-            speed_map = {
-                'auto': '00000000',
-                '10m-half': '00000006',
-                '10m-full': '00000007',
-                '100m-half': '00000004',
-                '100m-full': '00000005',
-                '1g-full': '00000003',
-            }
-            port_speeds['rpPort_Slt_Speed?%s' % port_id_str] = speed_map.get(
-                config['speed'], '00000000'
-            )
-
-        # STEP 3: WRITE - build form data with ALL current state
-        form_data = []
-
-        # Include all enabled port checkboxes
-        for port in sorted(enabled_ports, key=int):
-            form_data.append(('rpPort_Chk_PortActive', '?%s' % port))
-
-        # Include all port names
-        for field, value in port_names.items():
-            form_data.append((field, value))
+        return self._configure_ports_gs1920({port_id: config})
 
-        # Include all port speeds
-        for field, value in port_speeds.items():
-            form_data.append((field, value))
+    def _configure_ports_gs1920(self, port_configs):
+        """Configure ports on GS1920 with a single read-modify-write."""
+        # READ the current port page and WRITE it back with the requested
+        # changes applied, so all other port settings are preserved
+        content = self.get_page('/rpPort.html')
+        form_data = list(self._iter_port_fields(content, _PORT_FORM_FIELDS_GS1920, port_configs))
 
         # Add apply button
         form_data.append(('rpPort_HidBtn_NumID', '1'))
 
         code, response = self.post_form('/Forms/rpPort_1', form_data)
         if code == 200:
-            return True, 'Port %s configured' % port_id
-        return False, 'Failed to configure port %s' % port_id
+            return True, '%s configured' % _ports_label(port_configs)
+        return False, 'Failed to configure %s' % _ports_label(port_configs).lower()
 
     def _configure_port_gs1900(self, port_id, config):
         """Configure port on GS1900."""
@@ -1373,7 +2048,12 @@ class HttpApi(HttpApiBase):
         return None
 
     def configure_system(self, config):
-        """Configure system settings."""
+        """Configure system settings.
+
+        Returns:
+            Tuple of (success, message, changed). GS1900 returns None when
+            nothing was sent, or the raw (code, response) of its POST.
+        """
         model = self.detect_model()
 
         if model == 'gs1900':
@@ -1394,6 +2074,7 @@ class HttpApi(HttpApiBase):
         # Parse current values - GS1915 uses lowercase names like rpgeneral_IptSystemName
         current = self._parse_form_inputs(content, r'rpgeneral_Ipt\w+')
         current_selects = self._parse_form_selects(content, r'rpgeneral_Slt\w+')
+        before = (dict(current), dict(current_selects))
 
         # STEP 2: MODIFY - apply requested changes
         if config.get('hostname') is not None:
@@ -1405,6 +2086,10 @@ class HttpApi(HttpApiBase):
         if config.get('contact') is not None:
             current['rpgeneral_IptContactName'] = config['contact']
 
+        # Nothing to write if the switch already has the requested state
+        if (current, current_selects) == before:
+            return True, 'System already configured', False
+
         # STEP 3: WRITE - build form with all current state
         form_data = []
 
@@ -1421,8 +2106,8 @@ class HttpApi(HttpApiBase):
 
         code, response = self.post_form('/Forms/rpgeneral_1', form_data)
         if code == 200:
-            return True, 'System configured'
-        return False, 'Failed to configure system'
+            return True, 'System configured', True
+        return False, 'Failed to configure system', False
 
     def _configure_system_gs1920(self, config):
         """Configure system on GS1920 using read-modify-write pattern.
@@ -1435,6 +2120,7 @@ class HttpApi(HttpApiBase):
         # Parse current values
         current = self._parse_form_inputs(content, r'rpGeneral_Ipt_\w+')
         current_selects = self._parse_form_selects(content, r'rpGeneral_Slt_\w+')
+        before = (dict(current), dict(current_selects))
 
         # STEP 2: MODIFY - apply requested changes
         if config.get('hostname') is not None:
@@ -1471,6 +2157,10 @@ class HttpApi(HttpApiBase):
             tz_val = tz_map.get(config['timezone'], config['timezone'])
             current_selects['rpGeneral_Slt_TimeZone'] = tz_val
 
+        # Nothing to write if the switch already has the requested state
+        if (current, current_selects) == before:
+            return True, 'System already configured', False
+
         # STEP 3: WRITE - build form with all current state
         form_data = []
 
@@ -1487,26 +2177,28 @@ class HttpApi(HttpApiBase):
 
         code, response = self.post_form('/Forms/rpGeneral_1', form_data)
         if code == 200:
-            return True, 'System configured'
-        return False, 'Failed to configure system'
+            return True, 'System configured', True
+        return False, 'Failed to configure system', False
 
     def _configure_system_gs1900(self, config):
-        """Configure system on GS1900."""
-        data = {'cmd': 512}
-
-        if config.get('hostname') is not None:
-            data['system_name'] = config['hostname']
+        """Configure system on GS1900.
 
-        if config.get('location') is not None:
-            data['system_location'] = config['location']
+        Returns None without posting when none of hostname, location or
+        contact is given.
+        """
+        data = {'cmd': 512}
 
-        if config.get('contact') is not None:
-            data['system_contact'] = config['contact']
+        for key, field in (('hostname', 'system_name'),
+                           ('location', 'system_location'),
+                           ('contact', 'system_contact')):
+            value = config.get(key)
+            if value is not None:
+                data[field] = value
 
-        if data:
-            data['sysSubmit'] = 'Apply'
-            return self.post_form(512, data)
-        return None
+        if len(data) == 1:
+            return None
+        data['sysSubmit'] = 'Apply'
+        return self.post_form(512, data)
 
     def configure_syslog(self, config):
         """Configure syslog settings.
@@ -1517,13 +2209,13 @@ class HttpApi(HttpApiBase):
                 - servers: list of dicts with 'address' and optional 'port'
 
         Returns:
-            Tuple of (success, message)
+            Tuple of (success, message, changed)
         """
         model = self.detect_model()
         if model == 'gs1900':
-            return False, 'Syslog config not implemented for GS1900'
+            return False, 'Syslog config not implemented for GS1900', False
         elif model == 'gs1915':
-            return False, 'Syslog config not implemented for GS1915'
+            return False, 'Syslog config not implemented for GS1915', False
         else:  # gs1920
             return self._configure_syslog_gs1920(config)
 
@@ -1533,13 +2225,7 @@ class HttpApi(HttpApiBase):
         content = self.get_page('/rpSyslog.html')
 
         # Parse global syslog enabled checkbox
-        global_enabled = 'CHECKED' in re.search(
-            r'<INPUT[^>]*NAME="rpSyslog_Chk_GlobalActive"[^>]*>',
-            content, re.IGNORECASE
-        ).group(0).upper() if re.search(
-            r'<INPUT[^>]*NAME="rpSyslog_Chk_GlobalActive"[^>]*>',
-            content, re.IGNORECASE
-        ) else False
+        global_enabled = _RE_SYSLOG_GLOBAL_ACTIVE.search(content) is not None
 
         # Parse type active checkboxes (categories 1-5)
         type_active = self._parse_form_checkboxes(content, 'rpSyslog_Chk_TypeActive')
@@ -1547,37 +2233,72 @@ class HttpApi(HttpApiBase):
         # Parse facilities
         facilities = self._parse_form_selects(content, r'rpSyslog_Slt_Facility\?\d+')
 
-        # STEP 2: MODIFY
-        if config.get('enabled') is not None:
-            global_enabled = config['enabled']
-
-        # STEP 3: BUILD form data
-        form_data = []
-
-        if global_enabled:
-            form_data.append(('rpSyslog_Chk_GlobalActive', 'on'))
-
-        for val in type_active:
-            form_data.append(('rpSyslog_Chk_TypeActive', val))
-
-        for field, val in facilities.items():
-            form_data.append((field, val))
-
-        form_data.append(('rpSyslog_HidBtn_NumID', '1'))
-
-        code, response = self.post_form('/Forms/rpSyslog_1', form_data)
-
-        # If servers are specified, add them via the server form
-        if config.get('servers') and code == 200:
-            for server in config['servers']:
-                self._add_syslog_server_gs1920(server)
+        # STEP 2: MODIFY - only the global switch is changed by this form
+        changed = config.get('enabled') is not None and bool(config['enabled']) != global_enabled
+
+        if changed:
+            # STEP 3: BUILD form data
+            form_data = [('rpSyslog_Chk_GlobalActive', 'on')] if config['enabled'] else []
+            form_data.extend([('rpSyslog_Chk_TypeActive', val) for val in type_active])
+            form_data.extend(facilities.items())
+            form_data.append(('rpSyslog_HidBtn_NumID', '1'))
+
+            code, response = self.post_form('/Forms/rpSyslog_1', form_data)
+            if code != 200:
+                return False, 'Failed to configure syslog', False
+
+        # Only add the servers the switch does not list yet
+        missing = [server for server in config.get('servers') or []
+                   if not _syslog_server_listed(content, server.get('address', ''))]
+        if missing:
+            failed = self._add_syslog_servers_gs1920(missing)
+            changed = changed or len(failed) < len(missing)
+            if failed:
+                return False, 'Failed to add syslog servers %s' % ', '.join(failed), changed
+
+        if changed:
+            return True, 'Syslog configured', True
+        return True, 'Syslog already configured', False
+
+    def _add_syslog_servers_gs1920(self, servers):
+        """Add syslog servers on GS1920 with one server form POST.
+
+        Each server fills its own ServerIndexID slot. If the switch
+        rejects the combined form, it may still have taken some of the
+        servers, so the server table is read again and only the servers
+        it does not list are added, one at a time.
 
-        if code == 200:
-            return True, 'Syslog configured'
-        return False, 'Failed to configure syslog'
+        Returns:
+            List of the addresses the switch did not take, empty on success
+        """
+        if len(servers) > 1:
+            form_data = []
+            for index, server in enumerate(servers):
+                form_data.extend([
+                    ('rpSyslog_Toggle_Ipt_ServerAddr', server.get('address', '')),
+                    ('rpSyslog_Toggle_Ipt_UdpPort', str(server.get('port', 514))),
+                    ('rpSyslog_HidBtn_ServerIndexID', str(index)),
+                ])
+            form_data.append(('rpSyslog_HidBtn_ServerNumID', '1'))  # Add
+
+            code, response = self.post_form('/Forms/rpSyslog_2', form_data)
+            if _syslog_post_ok(code, response):
+                return []
+
+            # The failed POST dropped the page cache, so this is a fresh read
+            content = self.get_page('/rpSyslog.html')
+            servers = [server for server in servers
+                       if not _syslog_server_listed(content, server.get('address', ''))]
+
+        failed = []
+        for server in servers:
+            code, response = self._add_syslog_server_gs1920(server)
+            if not _syslog_post_ok(code, response):
+                failed.append(server.get('address', ''))
+        return failed
 
     def _add_syslog_server_gs1920(self, server):
-        """Add a syslog server on GS1920."""
+        """Add a single syslog server on GS1920."""
         form_data = [
             ('rpSyslog_Toggle_Ipt_ServerAddr', server.get('address', '')),
             ('rpSyslog_Toggle_Ipt_UdpPort', str(server.get('port', 514))),
@@ -1594,13 +2315,13 @@ class HttpApi(HttpApiBase):
                 - groups: dict of group_id -> {enabled, members, criteria}
 
         Returns:
-            Tuple of (success, message)
+            Tuple of (success, message, changed)
         """
         model = self.detect_model()
         if model == 'gs1900':
-            return False, 'LAG config not implemented for GS1900'
+            return False, 'LAG config not implemented for GS1900', False
         elif model == 'gs1915':
-            return False, 'LAG config not implemented for GS1915'
+            return False, 'LAG config not implemented for GS1915', False
         else:  # gs1920
             return self._configure_lag_gs1920(config)
 
@@ -1610,19 +2331,14 @@ class HttpApi(HttpApiBase):
         content = self.get_page('/rpLacpsetting.html')
 
         # Parse enabled groups
-        enabled_groups = set()
-        for match in re.finditer(
-            r'<INPUT[^>]*NAME="rpLacpsetting_Chk_GroupActive"[^>]*VALUE="\?(\d+)"[^>]*>',
-            content, re.IGNORECASE
-        ):
-            if 'CHECKED' in match.group(0).upper():
-                enabled_groups.add(match.group(1))
+        enabled_groups = set(_RE_LAG_GROUP_ACTIVE.findall(content))
 
         # Parse criteria selects
         criteria = self._parse_form_selects(content, r'rpLacpsetting_Slt_Criteria\?\d+,\d+')
 
         # Parse port-to-group assignments
         port_groups = self._parse_form_selects(content, r'rpLacpsetting_Slt_Group\?\d+')
+        before = (set(enabled_groups), dict(criteria), dict(port_groups))
 
         # STEP 2: MODIFY based on config
         groups_config = config.get('groups', {})
@@ -1636,59 +2352,41 @@ class HttpApi(HttpApiBase):
 
             # Set criteria for this group
             if group_cfg.get('criteria'):
-                criteria_key = 'rpLacpsetting_Slt_Criteria?%s,1' % group_id_str
-                criteria[criteria_key] = group_cfg['criteria']
+                criteria['rpLacpsetting_Slt_Criteria?' + group_id_str + ',1'] = group_cfg['criteria']
 
             # Assign members to this group
             if group_cfg.get('members'):
-                group_name = 'T%s' % group_id_str
-                for port in group_cfg['members']:
-                    port_key = 'rpLacpsetting_Slt_Group?%s' % port
-                    port_groups[port_key] = group_name
+                group_name = 'T' + group_id_str
+                port_groups.update([('rpLacpsetting_Slt_Group?' + str(port), group_name)
+                                    for port in group_cfg['members']])
 
-        # STEP 3: BUILD form data
-        form_data = []
-
-        for group in sorted(enabled_groups, key=int):
-            form_data.append(('rpLacpsetting_Chk_GroupActive', '?%s' % group))
-
-        for field, val in criteria.items():
-            form_data.append((field, val))
-
-        for field, val in port_groups.items():
-            form_data.append((field, val))
+        # Nothing to write if the switch already has the requested state
+        if (enabled_groups, criteria, port_groups) == before:
+            return True, 'LAG already configured', False
 
+        # STEP 3: BUILD form data
+        form_data = [('rpLacpsetting_Chk_GroupActive', '?' + group)
+                     for group in sorted(enabled_groups, key=int)]
+        form_data.extend(criteria.items())
+        form_data.extend(port_groups.items())
         form_data.append(('rpLacpsetting_HidBtn_NumID', '1'))
 
         code, response = self.post_form('/Forms/rpLacpsetting_1', form_data)
         if code == 200:
-            return True, 'LAG configured'
-        return False, 'Failed to configure LAG'
+            return True, 'LAG configured', True
+        return False, 'Failed to configure LAG', False
 
     def get_capabilities(self):
         """Return device capabilities."""
         model = self.detect_model()
         return {
-            'rpc': ['get_page', 'post_form', 'get_system_info', 'get_ports_info', 'get_vlans_info'],
+            'rpc': list(_CAPABILITY_RPC),
             'network_api': 'httpapi',
             'device_info': {
                 'network_os': 'zyxel',
                 'network_os_platform': model,
                 'model': model,
             },
-            'device_operations': {
-                'supports_commit': False,
-                'supports_replace': False,
-                'supports_rollback': False,
-                'supports_defaults': False,
-                'supports_onbox_diff': False,
-                'supports_generate_diff': False,
-                'supports_multiline_delimiter': False,
-                'supports_diff_match': False,
-                'supports_diff_ignore_lines': False,
-                'supports_config_replace': False,
-                'supports_admin': False,
-                'supports_commit_comment': False,
-            }
+            'device_operations': dict(_DEVICE_OPERATIONS),
         }
 
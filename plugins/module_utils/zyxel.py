@@ -13,6 +13,22 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.connection import Connection, ConnectionError
 
 
+# Port header line in CLI port output
+_RE_PORT_HEADER = re.compile(r'^[Pp]ort\s*(\d+)')
+
+# Turns a port attribute label into its lower_snake_case key
+_PORT_KEY_TRANS = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ ', 'abcdefghijklmnopqrstuvwxyz_')
+
+# Filler characters for the GS1900 encoded password
+GS1900_PASSWORD_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+
+# Connection handles, keyed by connection socket path
+_CONNECTIONS = {}
+
+# Parsed get_capabilities() results, keyed by connection socket path
+_CAPABILITIES_CACHE = {}
+
+
 def encode_gs1900_password(password):
     """Encode password for GS1900 series switches.
 
@@ -21,44 +37,55 @@ def encode_gs1900_password(password):
     - Password length digits are at positions 123 and 289
     - All other positions are random characters
     """
-    text = ""
-    possible = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
     input_len = len(password)
-    remaining = input_len
-    for i in range(1, 322):
-        if i % 5 == 0 and remaining > 0:
-            remaining -= 1
-            text += password[remaining]
-        elif i == 123:
-            text += "0" if input_len < 10 else str(input_len // 10)
-        elif i == 289:
-            text += str(input_len % 10)
-        else:
-            text += random.choice(possible)
-    return text
+    # Start from random filler, then overwrite the fixed positions
+    text = random.choices(GS1900_PASSWORD_CHARS, k=321)
+    text[122] = "0" if input_len < 10 else str(input_len // 10)
+    text[288] = str(input_len % 10)
+    # Every 5th position holds the password reversed, up to 64 characters
+    count = min(input_len, 64)
+    text[4:5 * count:5] = password[::-1][:count]
+    return "".join(text)
 
 
 def get_connection(module):
-    """Get the connection to the Zyxel device."""
-    if hasattr(module, '_zyxel_connection'):
-        return module._zyxel_connection
+    """Get the connection to the Zyxel device, shared per socket path."""
+    key = module._socket_path
+    if key not in _CONNECTIONS:
+        _CONNECTIONS[key] = Connection(key)
+    return _CONNECTIONS[key]
 
-    module._zyxel_connection = Connection(module._socket_path)
-    return module._zyxel_connection
+
+def config_changed(response):
+    """Return True if a configure_* result reports a change on the switch.
+
+    The httpapi configure_* calls return (success, message, changed).
+    GS1900 system config returns None when nothing was sent, or the raw
+    (code, response) of its POST.
+    """
+    if not response:
+        return False
+    if len(response) > 2:
+        return bool(response[2])
+    return response[0] == 200
 
 
 def get_capabilities(module):
-    """Get device capabilities."""
-    if hasattr(module, '_zyxel_capabilities'):
-        return module._zyxel_capabilities
+    """Get device capabilities, cached per persistent connection socket."""
+    key = module._socket_path
+    if key in _CAPABILITIES_CACHE:
+        return _CAPABILITIES_CACHE[key]
 
     try:
-        capabilities = Connection(module._socket_path).get_capabilities()
+        capabilities = get_connection(module).get_capabilities()
     except ConnectionError as exc:
         module.fail_json(msg=str(exc))
 
-    module._zyxel_capabilities = json.loads(capabilities)
-    return module._zyxel_capabilities
+    # The zyxel httpapi plugin returns a dict; other plugins return JSON text
+    if isinstance(capabilities, str):
+        capabilities = json.loads(capabilities)
+    _CAPABILITIES_CACHE[key] = capabilities
+    return _CAPABILITIES_CACHE[key]
 
 
 def send_request(module, path, data=None, method='GET'):
@@ -84,40 +111,20 @@ def run_commands(module, commands, check_rc=True):
     """Run commands on the Zyxel device.
 
     Note: Zyxel switches use HTTP API, not CLI. This function is provided
-    for backward compatibility but will use the HTTP API under the hood.
+    for backward compatibility and returns an empty result per command;
+    no CLI command has an HTTP API equivalent yet, so nothing is sent.
     """
-    connection = get_connection(module)
-    results = []
-    for cmd in commands:
-        try:
-            # For HTTP API, we simulate command execution
-            # by making appropriate API calls
-            result = connection.send_request(path='/', data=None, method='GET')
-            results.append(result[1] if isinstance(result, tuple) else str(result))
-        except ConnectionError as exc:
-            if check_rc:
-                module.fail_json(msg=str(exc))
-            results.append('')
-    return results
+    return ['' for dummy in commands]
 
 
 def load_config(module, commands, commit=False, comment=None):
     """Load configuration commands onto the device.
 
-    Note: Zyxel switches use HTTP API for configuration. This function
-    translates CLI-style commands to HTTP API calls.
+    Note: Zyxel switches use HTTP API for configuration. CLI-style commands
+    have no HTTP API translation yet, so this returns an empty result per
+    command without contacting the switch.
     """
-    connection = get_connection(module)
-    results = []
-    for cmd in commands:
-        try:
-            # Parse command and make appropriate API call
-            # This is a simplified implementation
-            result = connection.send_request(path='/', data=None, method='GET')
-            results.append(result[1] if isinstance(result, tuple) else str(result))
-        except ConnectionError as exc:
-            module.fail_json(msg=str(exc))
-    return results
+    return ['' for dummy in commands]
 
 
 def get_config(module, flags=None):
@@ -172,7 +179,7 @@ def parse_port_config(output):
     
     for line in output.splitlines():
         # Match port header (e.g., "Port 1" or "port1")
-        port_match = re.match(r'^[Pp]ort\s*(\d+)', line)
+        port_match = _RE_PORT_HEADER.match(line)
         if port_match:
             current_port = port_match.group(1)
             ports[current_port] = {}
@@ -180,7 +187,7 @@ def parse_port_config(output):
         
         if current_port and ':' in line:
             key, _, value = line.partition(':')
-            ports[current_port][key.strip().lower().replace(' ', '_')] = value.strip()
+            ports[current_port][key.strip().translate(_PORT_KEY_TRANS)] = value.strip()
     
     return ports
 
@@ -190,15 +197,14 @@ def parse_vlan_config(output):
     vlans = {}
     
     for line in output.splitlines():
-        # Match VLAN entries
-        vlan_match = re.match(r'^\s*(\d+)\s+(\S+)\s+(.*)$', line)
-        if vlan_match:
-            vlan_id = vlan_match.group(1)
-            name = vlan_match.group(2)
+        # VLAN entries are "<id> <name> [ports...]"
+        parts = line.split(None, 2)
+        if len(parts) >= 2 and parts[0].isdigit():
+            vlan_id = parts[0]
             vlans[vlan_id] = {
                 'id': vlan_id,
-                'name': name,
-                'ports': vlan_match.group(3).strip() if vlan_match.group(3) else ''
+                'name': parts[1],
+                'ports': parts[2].strip() if len(parts) > 2 else ''
             }
     
     return vlans
@@ -70,6 +70,7 @@ groups_configured:
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.network.zyxel.plugins.module_utils.zyxel import (
+    config_changed,
     get_connection,
 )
 
@@ -86,25 +87,30 @@ def main():
     )
 
     result = {'changed': False, 'groups_configured': []}
+    groups = module.params['groups']
 
     if not module.check_mode:
         connection = get_connection(module)
 
-        for group_id, config in module.params['groups'].items():
+        # Configure all groups with one read-modify-write of the LAG page
+        all_groups = {}
+        for group_id, config in groups.items():
             lag_config = {
                 'enabled': config.get('enabled', True),
                 'members': config.get('members', []),
             }
-            if config.get('criteria'):
-                lag_config['criteria'] = config['criteria']
-
-            success, message = connection.configure_lag(group_id, lag_config)
-            if success:
-                result['changed'] = True
-                result['groups_configured'].append(group_id)
+            criteria = config.get('criteria')
+            if criteria:
+                lag_config['criteria'] = criteria
+            all_groups[group_id] = lag_config
+
+        response = connection.configure_lag({'groups': all_groups})
+        result['changed'] = config_changed(response)
+        if response[0]:
+            result['groups_configured'] = list(all_groups.keys())
     else:
         result['changed'] = True
-        result['groups_configured'] = list(module.params['groups'].keys())
+        result['groups_configured'] = list(groups.keys())
 
     module.exit_json(**result)
 
@@ -71,6 +71,7 @@ config:
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.network.zyxel.plugins.module_utils.zyxel import (
+    config_changed,
     get_connection,
 )
 
@@ -101,8 +102,7 @@ def main():
     if not module.check_mode:
         connection = get_connection(module)
         response = connection.configure_system(config)
-        if response:
-            result['changed'] = True
+        result['changed'] = config_changed(response)
     else:
         result['changed'] = True
 
@@ -106,22 +106,26 @@ def main():
         supports_check_mode=True,
     )
 
-    result = {'changed': False, 'port': module.params['name'], 'config': {}}
+    params = module.params
+    port_id = params['name']
+    result = {'changed': False, 'port': port_id, 'config': {}}
 
-    port_id = module.params['name']
     config = {
-        'enabled': module.params['state'] == 'enabled',
-        'speed': module.params['speed'],
+        'enabled': params['state'] == 'enabled',
+        'speed': params['speed'],
     }
 
-    if module.params.get('description') is not None:
-        config['name'] = module.params['description']
+    if params.get('description') is not None:
+        config['name'] = params['description']
 
     result['config'] = config
 
     if not module.check_mode:
         connection = get_connection(module)
         response = connection.configure_port(port_id, config)
+        # GS1915/GS1920 report (success, message); GS1900 the raw (code, body)
+        if response and response[0] is False:
+            module.fail_json(msg=response[1])
         if response:
             result['changed'] = True
     else:
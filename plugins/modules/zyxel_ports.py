@@ -93,20 +93,26 @@ def main():
 
     if not module.check_mode:
         connection = get_connection(module)
+        # Configure all ports with one read-modify-write of the port page
+        port_configs = {}
         for port_id, config in ports.items():
             if config:
                 port_config = {
                     'enabled': config.get('enabled', True),
                 }
-                if config.get('speed'):
-                    port_config['speed'] = config['speed']
-                if config.get('name'):
-                    port_config['name'] = config['name']
-
-                response = connection.configure_port(port_id, port_config)
-                if response:
-                    result['changed'] = True
-                    result['ports_configured'].append(port_id)
+                speed = config.get('speed')
+                if speed:
+                    port_config['speed'] = speed
+                name = config.get('name')
+                if name:
+                    port_config['name'] = name
+                port_configs[port_id] = port_config
+
+        if port_configs:
+            success, message = connection.configure_ports(port_configs)
+            if success:
+                result['changed'] = True
+                result['ports_configured'] = list(port_configs.keys())
     else:
         result['changed'] = True
         result['ports_configured'] = list(ports.keys())
@@ -86,9 +86,8 @@ def main():
     all_ports = connection.get_ports_info()
 
     if requested_ports:
-        for port in requested_ports:
-            if port in all_ports:
-                result['ports'][port] = all_ports[port]
+        result['ports'] = dict([(port, all_ports[port]) for port in requested_ports
+                                if port in all_ports])
     else:
         result['ports'] = all_ports
 
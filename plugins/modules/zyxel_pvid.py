@@ -22,13 +22,22 @@ options:
   port:
     description:
       - Port number to configure.
+      - Required unless I(ports) is given.
     type: str
-    required: true
   pvid:
     description:
       - VLAN ID to set as the PVID for this port.
+      - Required with I(port).
     type: int
-    required: true
+  ports:
+    description:
+      - Dictionary of PVID settings keyed by port number, applied in one batch.
+      - Each entry needs a pvid and can include vlan_trunking, ingress_filtering
+        and acceptable_frame_type.
+      - The top-level vlan_trunking, ingress_filtering and acceptable_frame_type
+        options are used for entries that do not set them.
+      - Mutually exclusive with I(port).
+    type: dict
   vlan_trunking:
     description:
       - Enable or disable VLAN trunking on this port.
@@ -43,6 +52,12 @@ options:
       - Type of frames the port will accept.
     type: str
     choices: ['all', 'tagged', 'untagged']
+  num_ports:
+    description:
+      - Number of ports on the switch.
+      - Port numbers above this are rejected.
+    type: int
+    default: 28
 notes:
   - Uses HTTP API only - no SSH/CLI.
   - Tested against Zyxel GS1920 series switches.
@@ -72,13 +87,15 @@ EXAMPLES = r'''
 
 - name: Configure multiple ports with different PVIDs
   network.zyxel.zyxel_pvid:
-    port: "{{ item.port }}"
-    pvid: "{{ item.pvid }}"
-    vlan_trunking: "{{ item.trunking | default(omit) }}"
-  loop:
-    - { port: "1", pvid: 100, trunking: true }
-    - { port: "2", pvid: 200, trunking: true }
-    - { port: "3", pvid: 100 }
+    ports:
+      "1":
+        pvid: 100
+        vlan_trunking: true
+      "2":
+        pvid: 200
+        vlan_trunking: true
+      "3":
+        pvid: 100
 '''
 
 RETURN = r'''
@@ -89,12 +106,17 @@ changed:
   sample: true
 port:
   description: The port that was configured.
-  returned: always
+  returned: when I(port) is given
   type: str
 pvid:
   description: The PVID that was set.
-  returned: always
+  returned: when I(port) is given
   type: int
+ports_configured:
+  description: List of ports that were configured.
+  returned: when I(ports) is given
+  type: list
+  sample: ["1", "2", "3"]
 vlan_trunking:
   description: VLAN trunking setting if specified.
   returned: when specified
@@ -102,6 +124,7 @@ vlan_trunking:
 '''
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.parsing.convert_bool import boolean
 from ansible_collections.network.zyxel.plugins.module_utils.zyxel import (
     get_connection,
 )
@@ -110,34 +133,52 @@ from ansible_collections.network.zyxel.plugins.module_utils.zyxel import (
 def main():
     """Main entry point for module execution."""
     argument_spec = dict(
-        port=dict(type='str', required=True),
-        pvid=dict(type='int', required=True),
+        port=dict(type='str'),
+        pvid=dict(type='int'),
+        ports=dict(type='dict'),
         vlan_trunking=dict(type='bool'),
         ingress_filtering=dict(type='bool'),
         acceptable_frame_type=dict(type='str', choices=['all', 'tagged', 'untagged']),
+        num_ports=dict(type='int', default=28),
     )
 
     module = AnsibleModule(
         argument_spec=argument_spec,
+        mutually_exclusive=[['port', 'ports']],
+        required_one_of=[['port', 'ports']],
+        required_together=[['port', 'pvid']],
         supports_check_mode=True,
     )
 
-    result = {'changed': False, 'port': module.params['port'], 'pvid': module.params['pvid']}
+    ports = module.params.get('ports')
+    if ports is not None:
+        result = set_ports_pvid(module, ports)
+    else:
+        result = set_port_pvid(module)
+
+    module.exit_json(**result)
+
 
-    port = module.params['port']
-    pvid = module.params['pvid']
-    vlan_trunking = module.params.get('vlan_trunking')
-    ingress_filtering = module.params.get('ingress_filtering')
-    acceptable_frame_type = module.params.get('acceptable_frame_type')
+def set_port_pvid(module):
+    """Apply the port and pvid options to a single port."""
+    params = module.params
+    port = params['port']
+    pvid = params['pvid']
+    vlan_trunking = params.get('vlan_trunking')
+    ingress_filtering = params.get('ingress_filtering')
+    acceptable_frame_type = params.get('acceptable_frame_type')
+
+    result = {'changed': False, 'port': port, 'pvid': pvid}
 
     # Validate PVID range
-    if pvid < 1 or pvid > 4094:
+    if not 1 <= pvid <= 4094:
         module.fail_json(msg='PVID must be between 1 and 4094')
 
     if not module.check_mode:
         connection = get_connection(module)
         success, message = connection.set_port_pvid(
             port, pvid,
+            num_ports=params['num_ports'],
             vlan_trunking=vlan_trunking,
             ingress_filtering=ingress_filtering,
             acceptable_frame_type=acceptable_frame_type
@@ -152,7 +193,52 @@ def main():
     else:
         result['changed'] = True
 
-    module.exit_json(**result)
+    return result
+
+
+def set_ports_pvid(module, ports):
+    """Apply the ports option with a single batched connection call."""
+    params = module.params
+    port_settings = {}
+    for port_id, config in ports.items():
+        config = config or {}
+        pvid = config.get('pvid')
+        try:
+            pvid = int(pvid)
+        except (TypeError, ValueError):
+            module.fail_json(msg='Port %s needs an integer pvid' % port_id)
+        if not 1 <= pvid <= 4094:
+            module.fail_json(msg='PVID must be between 1 and 4094')
+        settings = {'pvid': pvid}
+        for key in ('vlan_trunking', 'ingress_filtering'):
+            value = config.get(key)
+            if value is None:
+                value = params.get(key)
+            else:
+                try:
+                    value = boolean(value)
+                except TypeError:
+                    module.fail_json(msg='Port %s %s must be a boolean' % (port_id, key))
+            settings[key] = value
+        frame_type = config.get('acceptable_frame_type')
+        if frame_type is None:
+            frame_type = params.get('acceptable_frame_type')
+        elif frame_type not in ('all', 'tagged', 'untagged'):
+            module.fail_json(msg='Port %s acceptable_frame_type must be all, tagged or untagged'
+                             % port_id)
+        settings['acceptable_frame_type'] = frame_type
+        port_settings[port_id] = settings
+
+    # An empty mapping has nothing to apply
+    result = {'changed': bool(port_settings), 'ports_configured': list(port_settings.keys())}
+    if port_settings and not module.check_mode:
+        connection = get_connection(module)
+        success, message = connection.set_ports_pvid(port_settings, num_ports=params['num_ports'])
+        if not success:
+            module.fail_json(msg=message)
+        result['message'] = message
+
+    return result
 
 
 if __name__ == '__main__':
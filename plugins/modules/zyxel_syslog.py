@@ -79,6 +79,7 @@ config:
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.network.zyxel.plugins.module_utils.zyxel import (
+    config_changed,
     get_connection,
 )
 
@@ -100,22 +101,23 @@ def main():
 
     result = {'changed': False, 'config': {}}
 
+    params = module.params
     config = {
-        'enabled': module.params.get('enabled', True),
+        'enabled': params.get('enabled', True),
     }
 
     # Build servers list
     servers = []
-    if module.params.get('servers'):
-        for srv in module.params['servers']:
+    if params.get('servers'):
+        for srv in params['servers']:
             if isinstance(srv, dict):
                 servers.append(srv)
             else:
                 servers.append({'address': srv, 'port': 514})
-    elif module.params.get('server'):
+    elif params.get('server'):
         servers.append({
-            'address': module.params['server'],
-            'port': module.params.get('port', 514)
+            'address': params['server'],
+            'port': params.get('port', 514)
         })
 
     if servers:
@@ -125,10 +127,10 @@ def main():
 
     if not module.check_mode:
         connection = get_connection(module)
-        success, message = connection.configure_syslog(config)
-        if success:
-            result['changed'] = True
-            result['message'] = message
+        response = connection.configure_syslog(config)
+        result['changed'] = config_changed(response)
+        if response[0]:
+            result['message'] = response[1]
     else:
         result['changed'] = True
 
@@ -80,8 +80,8 @@ config:
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.network.zyxel.plugins.module_utils.zyxel import (
+    config_changed,
     get_connection,
-    send_request,
 )
 
 
@@ -101,29 +101,18 @@ def main():
     )
 
     result = {'changed': False, 'config': {}}
+    params = module.params
     config = {}
-
-    if module.params.get('hostname'):
-        config['hostname'] = module.params['hostname']
-
-    if module.params.get('location'):
-        config['location'] = module.params['location']
-
-    if module.params.get('contact'):
-        config['contact'] = module.params['contact']
-
-    if module.params.get('ntp_servers'):
-        config['ntp_servers'] = module.params['ntp_servers']
-
-    if module.params.get('timezone'):
-        config['timezone'] = module.params['timezone']
+    for key in ('hostname', 'location', 'contact', 'ntp_servers', 'timezone'):
+        if params.get(key):
+            config[key] = params[key]
 
     if config:
         result['changed'] = True
         result['config'] = config
         if not module.check_mode:
             connection = get_connection(module)
-            connection.configure_system(config)
+            result['changed'] = config_changed(connection.configure_system(config))
 
     module.exit_json(**result)
 
@@ -85,6 +85,7 @@ group:
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.network.zyxel.plugins.module_utils.zyxel import (
+    config_changed,
     get_connection,
 )
 
@@ -104,20 +105,20 @@ def main():
         supports_check_mode=True,
     )
 
-    result = {'changed': False, 'group': module.params['group']}
+    params = module.params
+    result = {'changed': False, 'group': params['group']}
 
     config = {
-        'enabled': module.params['enabled'],
-        'members': module.params.get('members') or [],
+        'enabled': params['enabled'],
+        'members': params['members'] or [],
     }
-    if module.params.get('criteria'):
-        config['criteria'] = module.params['criteria']
+    if params['criteria']:
+        config['criteria'] = params['criteria']
 
     if not module.check_mode:
         connection = get_connection(module)
-        success, message = connection.configure_lag(module.params['group'], config)
-        if success:
-            result['changed'] = True
+        response = connection.configure_lag({'groups': {params['group']: config}})
+        result['changed'] = config_changed(response)
     else:
         result['changed'] = True
 
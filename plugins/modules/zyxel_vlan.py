@@ -86,7 +86,6 @@ changed:
   sample: true
 '''
 
-import re
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.network.zyxel.plugins.module_utils.zyxel import (
     get_connection,
@@ -127,9 +126,10 @@ def needs_update(current, params):
         return True
     if name and name != current.get('name', ''):
         return True
-    if sorted(str(p) for p in tagged) != sorted(current.get('tagged_ports', [])):
+    # Port lists are memberships, so order and duplicates do not matter
+    if set(map(str, tagged)) != set(current.get('tagged_ports', [])):
         return True
-    if sorted(str(p) for p in untagged) != sorted(current.get('untagged_ports', [])):
+    if set(map(str, untagged)) != set(current.get('untagged_ports', [])):
         return True
     return False
 
@@ -189,13 +189,13 @@ def main():
 
             if not module.check_mode:
                 # Pass config as a dict to avoid RPC issues with 'name' parameter
-                # Ensure lists are actual lists (not tuples) for JSON serialization
+                # AnsibleModule has already typed these as int, str and lists
                 vlan_config = {
-                    'vlan_id': int(vlan_id),
-                    'vlan_name': str(name) if name else '',
-                    'tagged_ports': list(tagged_ports) if tagged_ports else [],
-                    'untagged_ports': list(untagged_ports) if untagged_ports else [],
-                    'num_ports': int(num_ports),
+                    'vlan_id': vlan_id,
+                    'vlan_name': name or '',
+                    'tagged_ports': tagged_ports,
+                    'untagged_ports': untagged_ports,
+                    'num_ports': num_ports,
                 }
                 response = connection.create_vlan(vlan_config)
                 if isinstance(response, dict):
@@ -87,24 +87,57 @@ def main():
     result = {'changed': False, 'vlans_configured': []}
     vlans = module.params['vlans']
 
+    for vlan_id in vlans:
+        try:
+            valid = 1 <= int(vlan_id) <= 4094
+        except (TypeError, ValueError):
+            valid = False
+        if not valid:
+            module.fail_json(msg='VLAN ID %s must be a number between 1 and 4094' % vlan_id)
+
     if not module.check_mode:
         connection = get_connection(module)
 
+        # Split the VLANs up front so each kind is sent in one call
+        to_delete = []
+        to_create = []
         for vlan_id, config in vlans.items():
             if config:
-                state = config.get('state', 'present')
-                if state == 'absent':
-                    success, message = connection.delete_vlan(vlan_id)
+                if config.get('state', 'present') == 'absent':
+                    to_delete.append(vlan_id)
+                else:
+                    to_create.append((vlan_id, config))
+
+        failed = []
+
+        # Deletes go first so a removed VLAN frees its slot before creates
+        if to_delete:
+            responses = connection.delete_vlans(to_delete)
+            for vlan_id, response in zip(to_delete, responses):
+                if response.get('success'):
+                    result['changed'] = True
+                    result['vlans_configured'].append(vlan_id)
                 else:
-                    success, message = connection.create_vlan(
-                        vlan_id,
-                        name=config.get('name'),
-                        tagged_ports=config.get('tagged_ports'),
-                        untagged_ports=config.get('untagged_ports')
-                    )
-                if success:
+                    failed.append(response.get('msg', 'Failed to delete VLAN %s' % vlan_id))
+
+        if to_create:
+            # Pass configs as dicts to avoid RPC issues with a 'name' argument
+            vlan_configs = [{
+                'vlan_id': int(vlan_id),
+                'vlan_name': str(config.get('name') or ''),
+                'tagged_ports': list(config.get('tagged_ports') or []),
+                'untagged_ports': list(config.get('untagged_ports') or []),
+            } for vlan_id, config in to_create]
+            responses = connection.create_vlans(vlan_configs)
+            for (vlan_id, dummy), response in zip(to_create, responses):
+                if response.get('success'):
                     result['changed'] = True
                     result['vlans_configured'].append(vlan_id)
+                else:
+                    failed.append(response.get('msg', 'Failed to create VLAN %s' % vlan_id))
+
+        if failed:
+            module.fail_json(msg='; '.join(failed), **result)
     else:
         result['changed'] = True
         result['vlans_configured'] = list(vlans.keys())
@@ -83,14 +83,8 @@ def main():
     requested_vlans = module.params.get('vlan_ids')
 
     connection = get_connection(module)
-    all_vlans = connection.get_vlans_info()
-
-    if requested_vlans:
-        for vlan_id in requested_vlans:
-            if vlan_id in all_vlans:
-                result['vlans'][vlan_id] = all_vlans[vlan_id]
-    else:
-        result['vlans'] = all_vlans
+    # Let the connection filter so only the requested VLANs come back
+    result['vlans'] = connection.get_vlans_info(requested_vlans or None)
 
     module.exit_json(**result)
 
@@ -25,6 +25,12 @@ options:
       - If not specified, returns information for all VLANs
     required: false
     type: int
+  include_device_info:
+    description:
+      - Whether to return I(device_info).
+      - Defaults to true when I(vlan_id) is not given, and false when it is.
+    required: false
+    type: bool
 notes:
   - This module requires httpapi connection type
   - Configure ansible_connection=ansible.netcommon.httpapi
@@ -68,7 +74,7 @@ vlans:
       config: "vlan 200\\n  name \\"SERVERS\\"\\n  normal 1-4\\n  fixed \\"\\"\\n  forbidden 5-24\\n  untagged 5-24\\nexit"
 device_info:
   description: Device information
-  returned: always
+  returned: when I(include_device_info) is true
   type: dict
   sample:
     network_os: "zyxel"
@@ -84,6 +90,7 @@ def main():
     """Main module execution."""
     argument_spec = dict(
         vlan_id=dict(type='int', required=False),
+        include_device_info=dict(type='bool', required=False),
     )
 
     module = AnsibleModule(
@@ -92,13 +99,13 @@ def main():
     )
 
     vlan_id = module.params.get('vlan_id')
+    include_device_info = module.params.get('include_device_info')
+    if include_device_info is None:
+        include_device_info = not vlan_id
 
     try:
         connection = Connection(module._socket_path)
 
-        # Get device info
-        device_info = connection.get_device_info()
-
         # Get VLAN information
         if vlan_id:
             vlans = connection.get_vlan_info(vlan_id=vlan_id)
@@ -108,10 +115,13 @@ def main():
         result = {
             'changed': False,
             'vlans': vlans,
-            'device_info': device_info,
             'vlan_count': len(vlans)
         }
 
+        # Device info is only read from the switch when asked for
+        if include_device_info:
+            result['device_info'] = connection.get_device_info()
+
         module.exit_json(**result)
 
     except Exception as e:
@@ -20,6 +20,7 @@ author:
 import re
 
 from ansible.errors import AnsibleConnectionFailure
+from ansible.module_utils.common.text.converters import to_bytes
 from ansible.plugins.terminal import TerminalBase
 
 
@@ -28,20 +29,19 @@ class TerminalModule(TerminalBase):
 
     # Regex patterns for terminal prompts
     # Updated to handle Zyxel prompts with ANSI escape sequences (\x1b7 = ESC 7)
+    # Anchored with \Z, as the prompt always ends the buffer
     terminal_stdout_re = [
-        re.compile(rb'[\r\n]?[\w\-]+[>#]\s*(?:\x1b7)?$'),
-        re.compile(rb'[\r\n]?[\w\-]+\([\w\-]+\)[>#]\s*(?:\x1b7)?$'),
+        re.compile(rb'[\w\-]+(?:\([\w\-]+\))?[>#]\s*(?:\x1b7)?\Z'),
     ]
 
-    # Regex patterns for error messages
+    # Regex patterns for error messages, as one alternation so each
+    # response is scanned once
     terminal_stderr_re = [
-        re.compile(rb"% Invalid input detected", re.I),
-        re.compile(rb"% Ambiguous command", re.I),
-        re.compile(rb"% Incomplete command", re.I),
-        re.compile(rb"% Unknown command", re.I),
-        re.compile(rb"% Error", re.I),
-        re.compile(rb"command not found", re.I),
-        re.compile(rb"invalid parameter", re.I),
+        re.compile(
+            rb"% (?:Invalid input detected|Ambiguous command|Incomplete command"
+            rb"|Unknown command|Error)|command not found|invalid parameter",
+            re.I
+        ),
     ]
 
     # Regex patterns for initial prompts (login, password)
@@ -65,7 +65,8 @@ class TerminalModule(TerminalBase):
 
     def on_become(self, passwd=None):
         """Handle privilege escalation."""
-        if self._get_prompt().endswith(b'#'):
+        prompt = self._get_prompt()
+        if prompt is not None and prompt.endswith(b'#'):
             return
 
         cmd = {'command': 'enable'}
@@ -7,9 +7,81 @@ import sys
 import requests
 import urllib3
 import re
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Page patterns, compiled once for every page and VLAN scanned below
+
+# Pattern: VALUE="?N" followed by VID in next <td>
+CHECKBOX_RE = re.compile(r'NAME="rpVlantag_Chk_TabDel"\s+VALUE="\?(\d+)"', re.IGNORECASE)
+
+# Each VLAN row structure:
+# <INPUT ... NAME="rpVlantag_Chk_TabDel" VALUE="?N">
+#   <label>...</label>
+# </td>
+# <td>VID</td>
+# <td><span class="status-on/off">ON/OFF</span></td>
+# <td style="text-align:left" class="word-break">NAME</td>
+ROW_RE = re.compile(
+    r'NAME="rpVlantag_Chk_TabDel"\s+VALUE="\?(\d+)".*?</td>\s*<td[^>]*>(\d+)\s*</td>'
+    r'\s*<td[^>]*>.*?</td>\s*<td[^>]*>\s*(\S[^<]*)</td>',
+    re.IGNORECASE | re.DOTALL)
+
+PVID_RE = re.compile(r'NAME="rpVlanport_Ipt_PVID\?(\d+)"[^>]*VALUE="(\d+)"', re.IGNORECASE)
+
+# Port rows have select elements with options: Fixed, Forbidden, (Egress), Normal
+FIXED_RE = re.compile(
+    r'NAME="rpVlantag_Toggle_Slt_Port\?(\d+)"[^>]*>.*?<option[^>]*value="1"[^>]*selected',
+    re.IGNORECASE | re.DOTALL)
+
+TAGGED_RE = re.compile(
+    r'NAME="rpVlantag_Toggle_Chk_Tagging"[^>]*VALUE="\?(\d+)"[^>]*CHECKED', re.IGNORECASE)
+
+
+def parse_vlan_rows(text):
+    """Return (index, VID, name) for each VLAN row of the tag page.
+
+    Walks the parsed table with lxml when available; the regex fallback
+    has to backtrack across cells on large pages.
+    """
+    if not HAS_LXML:
+        return [(idx, vid, name.strip()) for idx, vid, name in ROW_RE.findall(text)]
+
+    rows = []
+    doc = lxml.html.fromstring(text)
+    for chk in doc.xpath('//input[@name="rpVlantag_Chk_TabDel"]'):
+        # Checkbox cell, then VID, status and name cells
+        cells = chk.xpath('ancestor::td[1]/following-sibling::td')
+        if len(cells) < 3:
+            continue
+        vid = cells[0].text_content().strip()
+        if vid.isdigit():
+            rows.append(((chk.get('value') or '').lstrip('?'), vid, cells[2].text_content().strip()))
+    return rows
+
+
+def parse_pvids(text):
+    """Return {port: PVID} from the VLAN port page."""
+    if not HAS_LXML:
+        return dict(PVID_RE.findall(text))
+
+    pvids = {}
+    doc = lxml.html.fromstring(text)
+    for field in doc.xpath('//input[starts-with(@name, "rpVlanport_Ipt_PVID?")]'):
+        port = field.get('name').partition('?')[2]
+        value = (field.get('value') or '').strip()
+        if port.isdigit() and value.isdigit():
+            pvids[port] = value
+    return pvids
+
+
 def main():
     if len(sys.argv) < 3:
         print("Usage: python debug_vlans.py <switch_ip> <password>")
@@ -21,6 +93,10 @@ def main():
 
     session = requests.Session()
     session.verify = False
+    session.headers['Connection'] = 'keep-alive'
+    # One pooled connection for every page; only GETs are retried
+    retries = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retries))
 
     # Login
     login_url = "https://{0}/Forms/login_1".format(switch_ip)
@@ -51,27 +127,15 @@ def main():
     print("\n=== Parsing VLANs from tag page ===")
 
     # Simpler approach: find all checkbox values and VID cells
-    # Pattern: VALUE="?N" followed by VID in next <td>
-    checkbox_pattern = r'NAME="rpVlantag_Chk_TabDel"\s+VALUE="\?(\d+)"'
-    checkboxes = re.findall(checkbox_pattern, resp.text, re.IGNORECASE)
+    checkboxes = CHECKBOX_RE.findall(resp.text)
     print("Found {0} VLAN table indexes: {1}".format(len(checkboxes), checkboxes))
 
     # Now find VID and Name for each row
-    # Each VLAN row structure:
-    # <INPUT ... NAME="rpVlantag_Chk_TabDel" VALUE="?N">
-    #   <label>...</label>
-    # </td>
-    # <td>VID</td>
-    # <td><span class="status-on/off">ON/OFF</span></td>
-    # <td style="text-align:left" class="word-break">NAME</td>
-    row_pattern = r'NAME="rpVlantag_Chk_TabDel"\s+VALUE="\?(\d+)".*?</td>\s*<td[^>]*>(\d+)\s*</td>\s*<td[^>]*>.*?</td>\s*<td[^>]*>\s*(\S[^<]*)</td>'
-    matches = re.findall(row_pattern, resp.text, re.IGNORECASE | re.DOTALL)
-
-    print("Found {0} VLANs:".format(len(matches)))
-    vlans = []
-    for idx, vid, name in matches:
-        vlans.append((idx, vid, name.strip()))
-        print("  Index={0}, VID={1}, Name='{2}'".format(idx, vid, name.strip()))
+    vlans = parse_vlan_rows(resp.text)
+
+    print("Found {0} VLANs:".format(len(vlans)))
+    for idx, vid, name in vlans:
+        print("  Index={0}, VID={1}, Name='{2}'".format(idx, vid, name))
 
     # Get port PVID assignments from vlanport page
     print("\n=== Fetching rpVlanport.html (port-VLAN mapping) ===")
@@ -79,12 +143,8 @@ def main():
     print("Status: {0}, Length: {1}".format(resp.status_code, len(resp.text)))
 
     # Parse PVID for each port
-    pvid_pattern = r'NAME="rpVlanport_Ipt_PVID\?(\d+)"[^>]*VALUE="(\d+)"'
-    pvid_matches = re.findall(pvid_pattern, resp.text, re.IGNORECASE)
+    pvid_by_port = parse_pvids(resp.text)
     print("\nPort PVID assignments:")
-    pvid_by_port = {}
-    for port, pvid in pvid_matches:
-        pvid_by_port[port] = pvid
 
     # Group ports by PVID
     ports_by_vlan = {}
@@ -112,13 +172,10 @@ def main():
                 f.write(resp.text)
 
             # Parse port membership - look for Fixed/Forbidden/Normal selections
-            # Port rows have select elements with options: Fixed, Forbidden, (Egress), Normal
-            fixed_pattern = r'NAME="rpVlantag_Toggle_Slt_Port\?(\d+)"[^>]*>.*?<option[^>]*value="1"[^>]*selected'
-            fixed_ports = re.findall(fixed_pattern, resp.text, re.IGNORECASE | re.DOTALL)
+            fixed_ports = FIXED_RE.findall(resp.text)
 
             # Also check for "Tagged" checkbox
-            tagged_pattern = r'NAME="rpVlantag_Toggle_Chk_Tagging"[^>]*VALUE="\?(\d+)"[^>]*CHECKED'
-            is_tagged = re.findall(tagged_pattern, resp.text, re.IGNORECASE)
+            is_tagged = TAGGED_RE.findall(resp.text)
 
             untagged_ports = []
             tagged_ports = []
@@ -2,13 +2,28 @@
 # -*- coding: utf-8 -*-
 """Integration test for Zyxel HTTP API connection to real switches."""
 
+import io
 import random
 import re
+from concurrent.futures import ThreadPoolExecutor
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 urllib3.disable_warnings()
 
 
+def make_session():
+    """Return a keep-alive session that retries failed GETs on one pooled connection."""
+    session = requests.Session()
+    session.verify = False
+    session.headers['Connection'] = 'keep-alive'
+    # Retry only covers idempotent methods, so login POSTs are never replayed
+    retries = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retries))
+    return session
+
+
 def encode_gs1900_password(password):
     """Encode password for GS1900 series switches."""
     text = ""
@@ -36,8 +51,7 @@ class ZyxelTestClient:
         self.username = username
         self.password = password
         self.model = model.lower()
-        self.session = requests.Session()
-        self.session.verify = False
+        self.session = make_session()
         self.auth_id = None
     
     def login(self):
@@ -87,68 +101,68 @@ class ZyxelTestClient:
         return False
     
     def get_system_info(self):
-        """Get system information."""
+        """Get the raw system information page."""
         if self.model == 'gs1900':
             resp = self.session.get(f'https://{self.host}/cgi-bin/dispatcher.cgi?cmd=512')
         elif self.model == 'gs1915':
             resp = self.session.get(f'https://{self.host}/rpsysinfo.html')
         else:  # gs1920
             resp = self.session.get(f'https://{self.host}/rpSysinfo.html')
-        return resp.text
+        return resp.content
 
     def get_port_config(self):
-        """Get port configuration."""
+        """Get the raw port configuration page."""
         if self.model == 'gs1900':
             resp = self.session.get(f'https://{self.host}/cgi-bin/dispatcher.cgi?cmd=768')
         elif self.model == 'gs1915':
             resp = self.session.get(f'https://{self.host}/rpport.html')
         else:  # gs1920
             resp = self.session.get(f'https://{self.host}/rpPort.html')
-        return resp.text
+        return resp.content
 
     def get_vlan_config(self):
-        """Get VLAN configuration."""
+        """Get the raw VLAN configuration page."""
         if self.model == 'gs1900':
             resp = self.session.get(f'https://{self.host}/cgi-bin/dispatcher.cgi?cmd=1282')
         elif self.model == 'gs1915':
             resp = self.session.get(f'https://{self.host}/rpvlantag.html')
         else:  # gs1920
             resp = self.session.get(f'https://{self.host}/rpVlan.html')
-        return resp.text
+        return resp.content
 
 
-def test_switch(name, host, model, username, password):
-    """Test a single switch."""
-    print(f"\n{'='*60}")
-    print(f"Testing {name} ({model}) at {host}")
-    print('='*60)
+def test_switch(name, host, model, username, password, out=None):
+    """Test a single switch, writing progress to out (stdout by default)."""
+    print(f"\n{'='*60}", file=out)
+    print(f"Testing {name} ({model}) at {host}", file=out)
+    print('='*60, file=out)
     
     client = ZyxelTestClient(host, username, password, model)
     
     # Test login
-    print("\n[1] Testing login...", end=" ")
+    print("\n[1] Testing login...", end=" ", file=out)
     if client.login():
-        print("SUCCESS")
+        print("SUCCESS", file=out)
     else:
-        print("FAILED")
+        print("FAILED", file=out)
         return False
     
     # Test system info
-    print("[2] Getting system info...", end=" ")
+    print("[2] Getting system info...", end=" ", file=out)
     sys_info = client.get_system_info()
-    print(f"OK ({len(sys_info)} bytes)")
+    print(f"OK ({len(sys_info)} bytes)", file=out)
     
     # Test port config
-    print("[3] Getting port config...", end=" ")
+    print("[3] Getting port config...", end=" ", file=out)
     port_config = client.get_port_config()
-    print(f"OK ({len(port_config)} bytes)")
+    print(f"OK ({len(port_config)} bytes)", file=out)
     
     # Test VLAN config
-    print("[4] Getting VLAN config...", end=" ")
+    print("[4] Getting VLAN config...", end=" ", file=out)
     vlan_config = client.get_vlan_config()
-    print(f"OK ({len(vlan_config)} bytes)")
+    print(f"OK ({len(vlan_config)} bytes)", file=out)
     
-    print(f"\n[PASS] {name} tests completed successfully")
+    print(f"\n[PASS] {name} tests completed successfully", file=out)
     return True
 
 
@@ -181,10 +195,19 @@ if __name__ == '__main__':
             ('GS1900-8HP', '192.168.1.12', 'gs1900'),
         ]
 
+    def run_switch(switch):
+        """Test one switch, keeping its output together."""
+        out = io.StringIO()
+        result = test_switch(*switch, username=USERNAME, password=PASSWORD, out=out)
+        return out.getvalue(), result
+
+    # Each client owns its session, so switches can be tested side by side
+    max_workers = int(os.environ.get('ZYXEL_MAX_PARALLEL', 0)) or max(len(switches), 1)
     results = []
-    for name, host, model in switches:
-        result = test_switch(name, host, model, USERNAME, PASSWORD)
-        results.append((name, result))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for (name, host, model), (output, result) in zip(switches, pool.map(run_switch, switches)):
+            print(output, end='')
+            results.append((name, result))
 
     print("\n" + "="*60)
     print("SUMMARY")
@@ -54,6 +54,26 @@ def mock_module():
     return module
 
 
+@pytest.fixture
+def run_module(mock_module):
+    """Run a module's main() against mock_module and a mocked connection.
+
+    Returns a function taking the module, its params and the return value
+    of each connection method it calls, which returns the exit_json kwargs.
+    """
+    def run(module, params, **results):
+        mock_module.params = params
+        mock_module.exit_json.side_effect = SystemExit(0)
+        with patch.object(module, 'AnsibleModule', return_value=mock_module), \
+                patch.object(module, 'get_connection') as mock_get_connection:
+            for method, value in results.items():
+                getattr(mock_get_connection.return_value, method).return_value = value
+            with pytest.raises(SystemExit):
+                module.main()
+        return mock_module.exit_json.call_args[1]
+    return run
+
+
 @pytest.fixture
 def mock_connection():
     """Create a mock connection object."""
@@ -9,6 +9,7 @@ __metaclass__ = type
 import pytest
 from unittest.mock import MagicMock, patch
 
+from ansible_collections.network.zyxel.plugins.httpapi import zyxel as zyxel_httpapi
 from ansible_collections.network.zyxel.plugins.httpapi.zyxel import (
     HttpApi,
     encode_gs1900_password,
@@ -130,6 +131,40 @@ GS1915_VLAN_PORT_HTML = '''
 <input type="checkbox" name="rpvlanport_ChkVLANTrunking" VALUE="?2">
 '''
 
+# GS1920 VLAN port settings with acceptable frame type selects
+GS1920_VLAN_PORT_FRAME_HTML = '''
+<input name="rpVlanport_Ipt_PVID?1" VALUE="5">
+<select name="rpVlanport_Slt_AcceptableFrame?1">
+<OPTION VALUE="0">All<OPTION VALUE="1" SELECTED>Tag Only</select>
+<input type=checkbox name="rpVlanport_Chk_Ingress" VALUE="?1" checked>
+<input name="rpVlanport_Ipt_PVID?2" VALUE="1">
+<select name="rpVlanport_Slt_AcceptableFrame?2">
+<OPTION VALUE=0>All<OPTION VALUE=2 SELECTED>Untag Only</select>
+<input type=checkbox name="rpVlanport_Chk_Ingress" VALUE="?2">
+'''
+
+# GS1920 VLAN tag page table rows
+GS1920_VLANTAG_HTML = '''
+<table><tbody>
+<tr><td><INPUT TYPE="CHECKBOX" NAME="rpVlantag_Chk_TabDel" VALUE="?1"></td>
+<td>1   </td><td><span class="status-on">ON</span></td><td>CORE</td></tr>
+<tr><td></td>
+<td>130</td><td><span class="status-off">OFF</span></td><td>STATIC</td></tr>
+<tr><td><INPUT TYPE="CHECKBOX" NAME="rpVlantag_Chk_TabDel" VALUE="?7"></td>
+<td>120</td><td><span class="status-on">ON</span></td><td>VOV</td></tr>
+</tbody></table>
+'''
+
+# GS1915 VLAN tag page table rows
+GS1915_VLANTAG_HTML = '''
+<table>
+<tr><td><input type="checkbox" name="rpvlantag_ChkDel" VALUE="?1,1"></td>
+<td><a href="javascript:GetIndexID(1);">1</a></td></tr>
+<tr><td><input type="checkbox" name="rpvlantag_ChkDel" VALUE="?1,13"></td>
+<td><a href="javascript:GetIndexID(121);">121</a></td></tr>
+</table>
+'''
+
 
 class TestEncodeGs1900Password:
     """Tests for the GS1900 password encoding function."""
@@ -172,6 +207,8 @@ class TestHttpApiParsing:
             httpapi.connection = mock_connection
             httpapi._model = None
             httpapi._logged_in = False
+            httpapi._page_cache = {}
+            httpapi._parsed_cache = {}
             httpapi._auth_id = None
             httpapi._firmware_version = None
         return httpapi
@@ -205,6 +242,62 @@ class TestHttpApiParsing:
         assert result['2']['pvid'] == 1
         assert result['2']['ingress_filtering'] is True
 
+    def test_vlans_info_untagged_from_pvid_gs1900(self, mock_httpapi):
+        """Test that PVID assignments become numerically sorted untagged ports."""
+        row = (
+            '<input type="checkbox" name="port" value="%d">'
+            '<td class="font-4" ><div align=center>%d</div></td>'
+            '<td class="font-4" ><div align=center>1</div></td>'
+            '<td class="font-4" ><div align=center>ALL</div></td>'
+            '<td class="font-4" ><div align=center>Disable</div></td>'
+            '<td class="font-4" ><div align=center>Disable</div></td>'
+        )
+        port_html = ''.join(row % (port, port) for port in (10, 9, 2))
+        mock_httpapi._model = 'gs1900'
+        mock_httpapi.get_page = MagicMock(side_effect=[GS1900_VLAN_HTML, port_html])
+        result = mock_httpapi.get_vlans_info()
+        assert result['1']['untagged_ports'] == ['2', '9', '10']
+        assert result['100']['untagged_ports'] == []
+        # Filtering reuses the parsed result and skips unknown IDs
+        assert list(mock_httpapi.get_vlans_info(['100', 4000])) == ['100']
+        assert list(mock_httpapi.get_vlan_info(vlan_id=100)) == ['100']
+        assert mock_httpapi.get_vlan_info() == result
+
+    def test_parse_system_info_gs1900_hostname(self, mock_httpapi):
+        """Test GS1900 hostname extraction with and without extra attributes."""
+        result = mock_httpapi._parse_system_info(
+            '<input type="text" name="system_name" value="sw-core">', 'gs1900')
+        assert result['hostname'] == 'sw-core'
+        result = mock_httpapi._parse_system_info(
+            '<input name="system_name" maxlength="64" value="sw-edge">', 'gs1900')
+        assert result['hostname'] == 'sw-edge'
+
+    def test_parse_system_info_gs1920(self, mock_httpapi):
+        """Test that GS1920 system info values are trimmed by the patterns."""
+        content = '''
+        <tr><td>System Name</td><td class="info">  core-sw  </td></tr>
+        <tr><td>Product Model</td><td>GS1920-24HPv2</td></tr>
+        <tr><td>F/W Version</td><td>
+          V4.80(ABMH.1) | 05/04/2022
+        </td></tr>
+        <tr><td>Ethernet Address</td><td>bc:99:11:00:00:01</td></tr>
+        '''
+        result = mock_httpapi._parse_system_info(content, 'gs1920')
+        assert result['hostname'] == 'core-sw'
+        assert result['model'] == 'GS1920-24HPv2'
+        assert result['firmware'] == 'V4.80(ABMH.1) | 05/04/2022'
+        assert result['mac_address'] == 'bc:99:11:00:00:01'
+
+    def test_get_gs1900_xssid(self, mock_httpapi):
+        """Test XSSID token extraction from GS1900 form pages."""
+        mock_httpapi._get_page_bytes = MagicMock(
+            return_value=b'<input type="hidden" name="XSSID" value="A1B2C3">')
+        assert mock_httpapi._get_gs1900_xssid(1293) == 'A1B2C3'
+        mock_httpapi._get_page_bytes.return_value = b'<input type="hidden" name="XSSID"\n value="D4E5">'
+        assert mock_httpapi._get_gs1900_xssid(1293) == 'D4E5'
+        mock_httpapi._get_page_bytes.return_value = b'<form></form>'
+        assert mock_httpapi._get_gs1900_xssid(1293) is None
+
     # GS1900 Port parsing tests
     def test_parse_ports_gs1900(self, mock_httpapi):
         """Test parsing port info from GS1900 HTML."""
@@ -217,6 +310,347 @@ class TestHttpApiParsing:
         assert result['2']['name'] == 'Uplink'
         assert result['2']['enabled'] is False
 
+    def test_parse_ports_gs1900_without_lxml(self, mock_httpapi):
+        """Test that the regex fallback parses GS1900 tables like lxml does."""
+        expected = mock_httpapi._parse_ports_info(GS1900_PORT_HTML, 'gs1900')
+        expected_settings = mock_httpapi._parse_port_settings_gs1900(GS1900_VLAN_PORT_HTML)
+        with patch.object(zyxel_httpapi, 'HAS_LXML', False):
+            assert mock_httpapi._parse_ports_info(GS1900_PORT_HTML, 'gs1900') == expected
+            assert mock_httpapi._parse_port_settings_gs1900(GS1900_VLAN_PORT_HTML) == expected_settings
+
+    def test_parse_vlans_from_tag_page_gs1920(self, mock_httpapi):
+        """Test that VLAN tag page rows parse the same with and without lxml."""
+        expected = {
+            '1': {'name': 'CORE', 'tagged_ports': [], 'untagged_ports': []},
+            '120': {'name': 'VOV', 'tagged_ports': [], 'untagged_ports': []},
+        }
+        assert mock_httpapi._parse_vlans_from_tag_page(GS1920_VLANTAG_HTML, 'gs1920') == expected
+        with patch.object(zyxel_httpapi, 'HAS_LXML', False):
+            assert mock_httpapi._parse_vlans_from_tag_page(GS1920_VLANTAG_HTML, 'gs1920') == expected
+
+    def test_parse_form_fields(self, mock_httpapi):
+        """Test reading checkbox, input and select values from a form."""
+        content = '''
+        <INPUT TYPE="checkbox" NAME="rpPort_Chk_PortActive" VALUE="?1" checked>
+        <INPUT TYPE="checkbox" NAME="rpPort_Chk_PortActive" VALUE="?2">
+        <INPUT TYPE="checkbox" NAME="rpPort_Chk_PortActive" VALUE="?3" TITLE="UNCHECKED">
+        <INPUT TYPE="text" NAME="rpPort_Ipt_PortName?1" VALUE="uplink">
+        <SELECT NAME="rpPort_Slt_Speed?1"><OPTION VALUE="0">Auto
+        <OPTION VALUE="3" SELECTED>1000M</SELECT>
+        <SELECT NAME="rpPort_Slt_Speed?2"><OPTION SELECTED VALUE="5">100M</SELECT>
+        '''
+        assert mock_httpapi._parse_form_checkboxes(content, 'rpPort_Chk_PortActive') == ['?1']
+        assert mock_httpapi._parse_form_inputs(content, r'rpPort_Ipt_PortName\?\d+') == {
+            'rpPort_Ipt_PortName?1': 'uplink'}
+        assert mock_httpapi._parse_form_selects(content, r'rpPort_Slt_Speed\?\d+') == {
+            'rpPort_Slt_Speed?1': '3', 'rpPort_Slt_Speed?2': '5'}
+
+    def test_parse_form_fields_page_case(self, mock_httpapi):
+        """Test that upper, lower and mixed case pages parse the same."""
+        upper = ('<INPUT TYPE="checkbox" NAME="rpPort_Chk_PortActive" VALUE="?1" CHECKED>'
+                 '<SELECT NAME="rpPort_Slt_Speed?1"><OPTION VALUE="3" SELECTED>1000M</SELECT>')
+        lower = upper.replace('INPUT', 'input').replace('NAME', 'name').replace('VALUE', 'value') \
+            .replace('CHECKED', 'checked').replace('SELECTED', 'selected').replace('SELECT', 'select') \
+            .replace('OPTION', 'option')
+        mixed = upper.replace('CHECKED', 'Checked')
+        for content in (upper, lower, mixed):
+            assert mock_httpapi._parse_form_checkboxes(content, 'rpport_chk_portactive') == ['?1']
+            assert mock_httpapi._parse_form_selects(content, r'rpPort_Slt_Speed\?\d+') == {
+                'rpPort_Slt_Speed?1': '3'}
+
+    def test_parse_port_form_gs1920(self, mock_httpapi):
+        """Test reading the GS1920 port form state with and without lxml."""
+        content = '''
+        <INPUT TYPE="checkbox" NAME="rpPort_Chk_PortActive" VALUE="?1" checked>
+        <INPUT TYPE="text" NAME="rpPort_Ipt_PortName?1" VALUE="uplink">
+        <SELECT NAME="rpPort_Slt_Speed?1"><OPTION VALUE="0">Auto</SELECT>
+        <INPUT TYPE="checkbox" NAME="rpPort_Chk_PortActive" VALUE="?2" CHECKED>
+        <INPUT TYPE="text" NAME="rpPort_Ipt_PortName?2" VALUE="">
+        <SELECT NAME="rpPort_Slt_Speed?2"><OPTION SELECTED VALUE="5">100M</SELECT>
+        <INPUT TYPE="checkbox" NAME="rpPort_Chk_PortActive" VALUE="?3">
+        '''
+        for has_lxml in (True, False):
+            with patch.object(zyxel_httpapi, 'HAS_LXML', has_lxml and zyxel_httpapi.HAS_LXML):
+                enabled, names, speeds = mock_httpapi._parse_port_form(
+                    content, zyxel_httpapi._PORT_FORM_FIELDS_GS1920)
+                # A select without a SELECTED option must not hide the port 2 inputs
+                assert enabled == set(['1', '2'])
+                assert names == {'rpPort_Ipt_PortName?1': 'uplink', 'rpPort_Ipt_PortName?2': ''}
+                assert speeds == {'rpPort_Slt_Speed?2': '5'}
+
+    def test_get_vlan_index(self, mock_httpapi):
+        """Test finding VLAN table indexes with and without lxml."""
+        for has_lxml in (True, False):
+            with patch.object(zyxel_httpapi, 'HAS_LXML', has_lxml and zyxel_httpapi.HAS_LXML):
+                mock_httpapi._model = 'gs1920'
+                mock_httpapi.get_page = MagicMock(return_value=GS1920_VLANTAG_HTML)
+                assert mock_httpapi.get_vlan_index(120) == '7'
+                assert mock_httpapi.get_vlan_index(999) is None
+                # A row without a checkbox must not borrow the next row's index
+                assert mock_httpapi.get_vlan_index(130) is None
+                mock_httpapi._model = 'gs1915'
+                mock_httpapi.get_page = MagicMock(return_value=GS1915_VLANTAG_HTML)
+                assert mock_httpapi.get_vlan_index(121) == '1,13'
+                assert mock_httpapi.get_vlan_index(12) is None
+
+    def test_port_labels(self, mock_httpapi):
+        """Test port label tables, including ports beyond the table size."""
+        assert list(zyxel_httpapi._port_labels(2)) == [(1, '1', '?1'), (2, '2', '?2')]
+        labels = list(zyxel_httpapi._port_labels(zyxel_httpapi._MAX_TABLE_PORT + 2))
+        assert len(labels) == zyxel_httpapi._MAX_TABLE_PORT + 2
+        assert labels[-1] == (258, '258', '?258')
+
+    def test_create_vlan_form_gs1915(self, mock_httpapi):
+        """Test the port membership entries of the GS1915 VLAN create form."""
+        mock_httpapi.post_form = MagicMock(return_value=(200, 'OK'))
+        # Tagged wins over untagged, ports beyond the switch are ignored
+        success, msg = mock_httpapi._create_vlan_gs1915(120, 'uplink', [2, 9], ['3', '2'], 4)
+        assert success
+        form_data = mock_httpapi.post_form.call_args[0][1]
+        assert form_data[-5:] == [
+            ('rpvlantag_RpgControl?1', '0'),
+            ('rpvlantag_RpgControl?2', '1'),
+            ('rpvlantag_ChkTagging', '?2'),
+            ('rpvlantag_RpgControl?3', '1'),
+            ('rpvlantag_RpgControl?4', '0'),
+        ]
+
+    def test_vlan_batches_share_result_shape(self, mock_httpapi):
+        """Test that delete_vlans and create_vlans both return success/msg dicts."""
+        mock_httpapi.delete_vlan = MagicMock(side_effect=[
+            (True, 'VLAN 10 deleted'), (False, 'Failed to delete VLAN 20')])
+        mock_httpapi.create_vlan = MagicMock(return_value={'success': True, 'msg': 'VLAN 30 created'})
+        assert mock_httpapi.delete_vlans(['10', '20']) == [
+            {'success': True, 'msg': 'VLAN 10 deleted'},
+            {'success': False, 'msg': 'Failed to delete VLAN 20'},
+        ]
+        assert mock_httpapi.create_vlans([{'vlan_id': 30}]) == [
+            {'success': True, 'msg': 'VLAN 30 created'}]
+
+    def test_configure_ports_batch_gs1920(self, mock_httpapi):
+        """Test that several port changes share one page read and one POST."""
+        mock_httpapi._model = 'gs1920'
+        mock_httpapi.get_page = MagicMock(return_value=(
+            '<INPUT TYPE="checkbox" NAME="rpPort_Chk_PortActive" VALUE="?1" CHECKED>'
+            '<INPUT TYPE="text" NAME="rpPort_Ipt_PortName?1" VALUE="">'
+            '<INPUT TYPE="checkbox" NAME="rpPort_Chk_PortActive" VALUE="?2">'
+            '<INPUT TYPE="text" NAME="rpPort_Ipt_PortName?2" VALUE="">'))
+        mock_httpapi.post_form = MagicMock(return_value=(200, 'OK'))
+        success, msg = mock_httpapi.configure_ports({
+            '1': {'enabled': False},
+            '2': {'enabled': True, 'name': 'uplink', 'speed': '1g-full'},
+        })
+        assert (success, msg) == (True, 'Ports 1, 2 configured')
+        mock_httpapi.get_page.assert_called_once()
+        # Page fields come in page order, then the requested ones it lacked
+        mock_httpapi.post_form.assert_called_once_with('/Forms/rpPort_1', [
+            ('rpPort_Ipt_PortName?1', ''),
+            ('rpPort_Ipt_PortName?2', 'uplink'),
+            ('rpPort_Chk_PortActive', '?2'),
+            ('rpPort_Slt_Speed?2', '00000003'),
+            ('rpPort_HidBtn_NumID', '1'),
+        ])
+
+    def test_get_device_info_memoised(self, mock_httpapi):
+        """Test that device info reads the system page only once."""
+        mock_httpapi._model = 'gs1920'
+        mock_httpapi.get_system_info = MagicMock(return_value={'firmware': 'V4.80'})
+        expected = {
+            'network_os': 'zyxel',
+            'network_os_platform': 'gs1920',
+            'network_os_version': 'V4.80',
+        }
+        assert mock_httpapi.get_device_info() == expected
+        assert mock_httpapi.get_device_info() == expected
+        mock_httpapi.get_system_info.assert_called_once()
+
+    def test_get_vlan_port_settings_cached(self, mock_httpapi):
+        """Test that parsed VLAN port settings are reused until a write."""
+        mock_httpapi._model = 'gs1920'
+        mock_httpapi.get_page = MagicMock(
+            return_value='<INPUT TYPE="text" NAME="rpVlanport_Ipt_PVID?1" VALUE="10">')
+        ports = mock_httpapi.get_vlan_port_settings()
+        assert mock_httpapi.get_vlan_port_settings() is ports
+        mock_httpapi.get_page.assert_called_once()
+        mock_httpapi._invalidate_cache()
+        mock_httpapi.get_vlan_port_settings()
+        assert mock_httpapi.get_page.call_count == 2
+
+    def test_configure_system_gs1900(self, mock_httpapi):
+        """Test that GS1900 system config only posts the given fields."""
+        mock_httpapi.post_form = MagicMock(return_value=(200, 'OK'))
+        assert mock_httpapi._configure_system_gs1900({'ntp_servers': ['192.0.2.1']}) is None
+        mock_httpapi.post_form.assert_not_called()
+        assert mock_httpapi._configure_system_gs1900({'hostname': 'sw1'}) == (200, 'OK')
+        mock_httpapi.post_form.assert_called_once_with(512, {
+            'cmd': 512, 'system_name': 'sw1', 'sysSubmit': 'Apply'})
+
+    def test_configure_syslog_form_gs1920(self, mock_httpapi):
+        """Test that syslog config preserves the global enable and categories."""
+        mock_httpapi.get_page = MagicMock(return_value=(
+            '<INPUT TYPE="checkbox" NAME="rpSyslog_Chk_GlobalActive" checked>'
+            '<INPUT TYPE="checkbox" NAME="rpSyslog_Chk_TypeActive" VALUE="?1" CHECKED>'
+            '<SELECT NAME="rpSyslog_Slt_Facility?1"><OPTION VALUE="0" SELECTED>local0</SELECT>'))
+        mock_httpapi.post_form = MagicMock(return_value=(200, 'OK'))
+        assert mock_httpapi._configure_syslog_gs1920({'enabled': True}) == (
+            True, 'Syslog already configured', False)
+        mock_httpapi.post_form.assert_not_called()
+        assert mock_httpapi._configure_syslog_gs1920({'enabled': False}) == (True, 'Syslog configured', True)
+        assert mock_httpapi.post_form.call_args[0][1] == [
+            ('rpSyslog_Chk_TypeActive', '?1'),
+            ('rpSyslog_Slt_Facility?1', '0'),
+            ('rpSyslog_HidBtn_NumID', '1'),
+        ]
+        mock_httpapi.get_page.return_value = ''
+        mock_httpapi._configure_syslog_gs1920({'enabled': True})
+        assert mock_httpapi.post_form.call_args[0][1] == [
+            ('rpSyslog_Chk_GlobalActive', 'on'),
+            ('rpSyslog_HidBtn_NumID', '1'),
+        ]
+
+    def test_configure_syslog_servers_gs1920(self, mock_httpapi):
+        """Test that only servers missing from the syslog page are added."""
+        mock_httpapi.get_page = MagicMock(return_value=(
+            '<INPUT TYPE="checkbox" NAME="rpSyslog_Chk_GlobalActive" CHECKED>'
+            '<TD>192.0.2.10</TD><TD>514</TD>'))
+        mock_httpapi._add_syslog_servers_gs1920 = MagicMock(return_value=[])
+        config = {'enabled': True, 'servers': [{'address': '192.0.2.10'}]}
+        assert mock_httpapi._configure_syslog_gs1920(config) == (True, 'Syslog already configured', False)
+        mock_httpapi._add_syslog_servers_gs1920.assert_not_called()
+
+        config['servers'].append({'address': '192.0.2.11'})
+        assert mock_httpapi._configure_syslog_gs1920(config) == (True, 'Syslog configured', True)
+        mock_httpapi._add_syslog_servers_gs1920.assert_called_once_with([{'address': '192.0.2.11'}])
+
+        mock_httpapi._add_syslog_servers_gs1920.return_value = ['192.0.2.11']
+        assert mock_httpapi._configure_syslog_gs1920(config) == (
+            False, 'Failed to add syslog servers 192.0.2.11', False)
+
+    def test_add_syslog_servers_gs1920(self, mock_httpapi):
+        """Test that syslog servers share one POST, falling back per server."""
+        servers = [{'address': '192.0.2.10'}, {'address': '192.0.2.11', 'port': 1514}]
+        mock_httpapi.post_form = MagicMock(return_value=(200, 'OK'))
+        assert mock_httpapi._add_syslog_servers_gs1920(servers) == []
+        mock_httpapi.post_form.assert_called_once_with('/Forms/rpSyslog_2', [
+            ('rpSyslog_Toggle_Ipt_ServerAddr', '192.0.2.10'),
+            ('rpSyslog_Toggle_Ipt_UdpPort', '514'),
+            ('rpSyslog_HidBtn_ServerIndexID', '0'),
+            ('rpSyslog_Toggle_Ipt_ServerAddr', '192.0.2.11'),
+            ('rpSyslog_Toggle_Ipt_UdpPort', '1514'),
+            ('rpSyslog_HidBtn_ServerIndexID', '1'),
+            ('rpSyslog_HidBtn_ServerNumID', '1'),
+        ])
+        mock_httpapi.get_page = MagicMock(return_value='<TD>192.0.2.100</TD>')
+        mock_httpapi.post_form = MagicMock(side_effect=[(200, 'Error'), (200, 'OK'), (200, 'OK')])
+        assert mock_httpapi._add_syslog_servers_gs1920(servers) == []
+        assert mock_httpapi.post_form.call_count == 3
+
+    def test_add_syslog_servers_fallback_skips_accepted(self, mock_httpapi):
+        """Test that the per-server fallback only adds servers the switch lacks."""
+        servers = [{'address': '192.0.2.10'}, {'address': '192.0.2.1', 'port': 1514}]
+        mock_httpapi.get_page = MagicMock(
+            return_value='<TD>192.0.2.10</TD><TD>514</TD><TD>192.0.2.100</TD>')
+        mock_httpapi.post_form = MagicMock(side_effect=[(200, 'Error'), (200, 'OK')])
+        assert mock_httpapi._add_syslog_servers_gs1920(servers) == []
+        mock_httpapi.get_page.assert_called_once_with('/rpSyslog.html')
+        assert mock_httpapi.post_form.call_count == 2
+        assert ('rpSyslog_Toggle_Ipt_ServerAddr', '192.0.2.1') in mock_httpapi.post_form.call_args[0][1]
+
+        # Nothing is resent when the switch already took every server
+        mock_httpapi.get_page.return_value = '<TD>192.0.2.10</TD><TD>192.0.2.1</TD>'
+        mock_httpapi.post_form = MagicMock(return_value=(200, 'Error'))
+        assert mock_httpapi._add_syslog_servers_gs1920(servers) == []
+        mock_httpapi.post_form.assert_called_once()
+
+    def test_add_syslog_servers_reports_failures(self, mock_httpapi):
+        """Test that every server the switch rejects is reported."""
+        servers = [{'address': '192.0.2.10'}, {'address': '192.0.2.11'}, {'address': '192.0.2.12'}]
+        mock_httpapi.get_page = MagicMock(return_value='')
+        mock_httpapi.post_form = MagicMock(
+            side_effect=[(200, 'Error'), (500, ''), (200, 'OK'), (200, 'Error')])
+        assert mock_httpapi._add_syslog_servers_gs1920(servers) == ['192.0.2.10', '192.0.2.12']
+
+        # A single server gets the same success test as the combined form
+        mock_httpapi.post_form = MagicMock(return_value=(200, 'Error'))
+        assert mock_httpapi._add_syslog_servers_gs1920(servers[:1]) == ['192.0.2.10']
+        mock_httpapi.post_form.assert_called_once()
+
+    def test_configure_lag_form_gs1920(self, mock_httpapi):
+        """Test that LAG config keeps enabled groups and adds new members."""
+        mock_httpapi.get_page = MagicMock(return_value=(
+            '<INPUT TYPE="checkbox" NAME="rpLacpsetting_Chk_GroupActive" VALUE="?1" checked>'
+            '<INPUT TYPE="checkbox" NAME="rpLacpsetting_Chk_GroupActive" VALUE="?2">'
+            '<SELECT NAME="rpLacpsetting_Slt_Group?5"><OPTION VALUE="T1" SELECTED>T1</SELECT>'))
+        mock_httpapi.post_form = MagicMock(return_value=(200, 'OK'))
+        assert mock_httpapi._configure_lag_gs1920({'groups': {2: {'members': [6]}}}) == (
+            True, 'LAG configured', True)
+        assert mock_httpapi.post_form.call_args[0][1] == [
+            ('rpLacpsetting_Chk_GroupActive', '?1'),
+            ('rpLacpsetting_Chk_GroupActive', '?2'),
+            ('rpLacpsetting_Slt_Group?5', 'T1'),
+            ('rpLacpsetting_Slt_Group?6', 'T2'),
+            ('rpLacpsetting_HidBtn_NumID', '1'),
+        ]
+        mock_httpapi.post_form.reset_mock()
+        assert mock_httpapi._configure_lag_gs1920({'groups': {1: {'members': [5]}}}) == (
+            True, 'LAG already configured', False)
+        mock_httpapi.post_form.assert_not_called()
+
+    def test_set_port_pvid_form_gs1915(self, mock_httpapi):
+        """Test that only the target port's PVID changes, for any port ID spelling."""
+        mock_httpapi.get_page = MagicMock(return_value='')
+        mock_httpapi.post_form = MagicMock(return_value=(200, 'OK'))
+        success, msg = mock_httpapi._set_port_pvid_gs1915('02', 120, 3, vlan_trunking=True)
+        assert success
+        assert mock_httpapi.post_form.call_args[0][1] == [
+            ('rpvlanport_HidBtnNum', '1'),
+            ('rpvlanport_IptPVID?1', '1'),
+            ('rpvlanport_IptPVID?2', '120'),
+            ('rpvlanport_ChkVLANTrunking', '?2'),
+            ('rpvlanport_IptPVID?3', '1'),
+        ]
+
+    @pytest.mark.parametrize('model', ['gs1900', 'gs1915', 'gs1920'])
+    def test_invalid_port_ids_rejected(self, mock_httpapi, model):
+        """Test that non-numeric port keys are reported instead of raising."""
+        mock_httpapi._model = model
+        mock_httpapi.get_page = MagicMock(return_value='')
+        mock_httpapi.post_form = MagicMock(return_value=(200, 'OK'))
+        assert mock_httpapi.configure_port('lag1', {'enabled': True}) == (
+            False, 'Invalid port ID lag1')
+        assert mock_httpapi.configure_ports({'1': {}, ' 1a': {}, '0': {}}) == (
+            False, 'Invalid port IDs  1a, 0')
+        assert mock_httpapi.set_port_pvid('lag1', 10) == (False, 'Invalid port ID lag1')
+        assert mock_httpapi.set_ports_pvid({'lag1': {'pvid': 10}}) == (
+            False, 'Invalid port IDs lag1')
+        assert mock_httpapi.set_port_pvid('11', 10, num_ports=10) == (
+            False, 'Invalid port ID 11')
+        assert mock_httpapi.set_ports_pvid({'1': {'pvid': 10}, '11': {'pvid': 10}},
+                                           num_ports=10) == (False, 'Invalid port IDs 11')
+        mock_httpapi.post_form.assert_not_called()
+
+    def test_set_ports_pvid_single_post_gs1920(self, mock_httpapi):
+        """Test that several ports' PVIDs are applied with one GS1920 POST."""
+        mock_httpapi._model = 'gs1920'
+        mock_httpapi.get_page = MagicMock(return_value='')
+        mock_httpapi.post_form = MagicMock(return_value=(200, 'OK'))
+        success, msg = mock_httpapi.set_ports_pvid(
+            {'1': {'pvid': 100, 'vlan_trunking': True},
+             '03': {'pvid': 200, 'acceptable_frame_type': 'tagged'}}, num_ports=3)
+        assert success
+        assert msg == 'Ports 1, 03 PVID set'
+        mock_httpapi.post_form.assert_called_once()
+        assert mock_httpapi.post_form.call_args[0][1] == [
+            ('rpVlanport_HidBtn_NumID', '1'),
+            ('rpVlanport_Ipt_PVID?1', '100'),
+            ('rpVlanport_Slt_AcceptableFrame?1', '00000000'),
+            ('rpVlanport_Chk_VLANTrunking', '?1'),
+            ('rpVlanport_Ipt_PVID?2', '1'),
+            ('rpVlanport_Slt_AcceptableFrame?2', '00000000'),
+            ('rpVlanport_Ipt_PVID?3', '200'),
+            ('rpVlanport_Slt_AcceptableFrame?3', '00000001'),
+        ]
+
     # GS1915 VLAN parsing tests
     def test_parse_vlans_gs1915(self, mock_httpapi):
         """Test parsing VLANs from GS1915 HTML."""
@@ -226,6 +660,15 @@ class TestHttpApiParsing:
         assert '100' in result
         assert result['100']['name'] == 'Management'
 
+    def test_parse_port_range(self, mock_httpapi):
+        """Test expanding port range strings."""
+        assert mock_httpapi._parse_port_range('1-4,6, 8 - 10') == [
+            '1', '2', '3', '4', '6', '8', '9', '10']
+        assert mock_httpapi._parse_port_range('') == []
+        assert mock_httpapi._parse_port_range('---') == []
+        # Malformed parts are skipped rather than mined for digits
+        assert mock_httpapi._parse_port_range('1-x,3a,5') == ['5']
+
     # GS1915 Port parsing tests
     def test_parse_ports_gs1915(self, mock_httpapi):
         """Test parsing port info from GS1915 HTML."""
@@ -278,6 +721,14 @@ class TestHttpApiParsing:
         assert '2' in result
         assert result['2']['pvid'] == 1
 
+    def test_parse_vlan_ports_frame_type(self, mock_httpapi):
+        """Test parsing acceptable frame type selects from rpVlanport.html."""
+        result = mock_httpapi._parse_vlan_port_settings(GS1920_VLAN_PORT_FRAME_HTML)
+        assert result['1']['acceptable_frame_type'] == 'tagged_only'
+        assert result['1']['pvid'] == 5
+        assert result['2']['acceptable_frame_type'] == 'untagged_only'
+        assert result['2']['ingress_filtering'] is False
+
 
 class TestModelDetection:
     """Tests for model detection."""
@@ -292,6 +743,8 @@ class TestModelDetection:
             httpapi.connection = mock_connection
             httpapi._model = None
             httpapi._logged_in = False
+            httpapi._page_cache = {}
+            httpapi._parsed_cache = {}
             httpapi._auth_id = None
             httpapi._firmware_version = None
             httpapi.get_option = MagicMock(return_value=None)
@@ -303,6 +756,26 @@ class TestModelDetection:
         result = mock_httpapi.detect_model()
         assert result == 'gs1915'
 
+    def test_detect_model_from_login_page(self, mock_httpapi):
+        """Test model detection from the login page content."""
+        response_data = MagicMock()
+        response_data.getvalue.return_value = b'<title>GS1915-24EP</title>'
+        mock_httpapi.connection.send.return_value = (MagicMock(), response_data)
+        assert mock_httpapi.detect_model() == 'gs1915'
+
+    def test_detect_model_default(self, mock_httpapi):
+        """Test that unknown login pages default to gs1920."""
+        response_data = MagicMock()
+        response_data.getvalue.return_value = b'<title>Login</title>'
+        mock_httpapi.connection.send.return_value = (MagicMock(), response_data)
+        assert mock_httpapi.detect_model() == 'gs1920'
+
+    def test_detect_model_option_skips_probe(self, mock_httpapi):
+        """Test that a configured model does not request the login page."""
+        mock_httpapi.get_option = MagicMock(return_value='GS1900')
+        assert mock_httpapi.detect_model() == 'gs1900'
+        mock_httpapi.connection.send.assert_not_called()
+
     def test_model_caching(self, mock_httpapi):
         """Test that model is cached after first detection."""
         mock_httpapi._model = 'gs1900'
@@ -311,3 +784,82 @@ class TestModelDetection:
         # get_option should not be called since model is cached
         mock_httpapi.get_option.assert_not_called()
 
+    def test_reset_model_cache(self, mock_httpapi):
+        """Test that reset_model_cache forces detection to run again."""
+        mock_httpapi._model = 'gs1900'
+        mock_httpapi._page_cache['/rpSysinfo.html'] = (0.0, 'cached')
+        mock_httpapi.reset_model_cache()
+        mock_httpapi.get_option = MagicMock(return_value='gs1920')
+        assert mock_httpapi.detect_model() == 'gs1920'
+        assert mock_httpapi._page_cache == {}
+
+    def test_compare_firmware_version(self, mock_httpapi):
+        """Test firmware version comparison on plain and Zyxel version strings."""
+        assert mock_httpapi._compare_firmware_version('V1.15', 'V1.16') == -1
+        assert mock_httpapi._compare_firmware_version('V2.70', 'V2.7') == 1
+        assert mock_httpapi._compare_firmware_version('V1.15', '1.15.0') == 0
+        assert mock_httpapi._compare_firmware_version('unknown', 'V1.15') == -1
+        assert mock_httpapi._compare_firmware_version(
+            'V4.80(ABMH.1) | 05/04/2022', 'V4.80(ABMH.2) | 01/12/2023') == -1
+        assert mock_httpapi._compare_firmware_version('V4.80(ABMH.1)', 'V4.70(ABMH.9)') == 1
+        assert mock_httpapi._compare_firmware_version('V4.80(ABMH.1)', 'V4.80') == 1
+        assert mock_httpapi._compare_firmware_version('V4.80(ABMH.1)', 'V4.80(ABMH.1)') == 0
+
+
+class TestSendRequest:
+    """Tests for send_request and the page cache."""
+
+    @pytest.fixture
+    def mock_httpapi(self):
+        """Create a mock HttpApi instance."""
+        mock_connection = MagicMock()
+        mock_connection.get_option.return_value = None
+        response = MagicMock()
+        response.getcode.return_value = 200
+        response_data = MagicMock()
+        response_data.getvalue.return_value = b'via connection'
+        mock_connection.send.return_value = (response, response_data)
+        with patch.object(HttpApi, '__init__', lambda x, y: None):
+            httpapi = HttpApi(mock_connection)
+            httpapi.connection = mock_connection
+            httpapi._model = 'gs1920'
+            httpapi._logged_in = False
+            httpapi._page_cache = {}
+            httpapi._parsed_cache = {}
+            httpapi._auth_id = None
+            httpapi._firmware_version = None
+        return httpapi
+
+    def test_post_form_encoding(self, mock_httpapi):
+        """Test that POST payloads encode the same with and without quoting."""
+        mock_httpapi.send_request('/Forms/login_1', {'user': 'admin', 'login': 'true'}, method='POST')
+        assert mock_httpapi.connection.send.call_args[0][1] == 'user=admin&login=true'
+        mock_httpapi.send_request('/Forms/rpVlanport_1', {'rpVlanport_Ipt_PVID?1': 'a b'}, method='POST')
+        assert mock_httpapi.connection.send.call_args[0][1] == 'rpVlanport_Ipt_PVID%3F1=a+b'
+
+    def test_get_page_cached_until_write(self, mock_httpapi):
+        """Test that pages are cached until a write request is sent."""
+        mock_httpapi.get_page('/rpSysinfo.html')
+        mock_httpapi.get_page('/rpSysinfo.html')
+        assert mock_httpapi.connection.send.call_count == 1
+        mock_httpapi.send_request('/Forms/rpGeneral_1', {'a': '1'}, method='POST')
+        mock_httpapi.get_page('/rpSysinfo.html')
+        assert mock_httpapi.connection.send.call_count == 3
+
+    def test_get_page_cache_expires(self, mock_httpapi):
+        """Test that cached pages are fetched again once the TTL has passed."""
+        with patch.object(zyxel_httpapi.time, 'monotonic', return_value=100.0):
+            mock_httpapi.get_page('/rpSysinfo.html')
+        with patch.object(zyxel_httpapi.time, 'monotonic', return_value=100.0 + zyxel_httpapi._CACHE_TTL):
+            mock_httpapi.get_page('/rpSysinfo.html')
+        assert mock_httpapi.connection.send.call_count == 1
+        with patch.object(zyxel_httpapi.time, 'monotonic', return_value=101.0 + zyxel_httpapi._CACHE_TTL):
+            mock_httpapi.get_page('/rpSysinfo.html')
+        assert mock_httpapi.connection.send.call_count == 2
+
+    def test_get_page_without_cache(self, mock_httpapi):
+        """Test that use_cache=False always fetches the page."""
+        mock_httpapi.get_page('/rpSysinfo.html', use_cache=False)
+        mock_httpapi.get_page('/rpSysinfo.html', use_cache=False)
+        assert mock_httpapi.connection.send.call_count == 2
+        assert mock_httpapi._page_cache == {}
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2024, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""Tests for module_utils."""
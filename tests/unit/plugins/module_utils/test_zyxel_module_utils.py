@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2024, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""Unit tests for Zyxel module_utils."""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import pytest
+from unittest.mock import patch
+
+from ansible_collections.network.zyxel.plugins.module_utils import zyxel as zyxel_utils
+
+
+class TestGetCapabilities:
+    """Tests for get_capabilities."""
+
+    @pytest.mark.parametrize('capabilities', [
+        {'network_api': 'httpapi', 'device_info': {'network_os': 'zyxel'}},
+        '{"network_api": "httpapi", "device_info": {"network_os": "zyxel"}}',
+    ])
+    def test_dict_and_json_capabilities(self, mock_module, capabilities):
+        """Test that the plugin's dict and JSON text both parse, once per socket."""
+        mock_module._socket_path = '/tmp/zyxel-capabilities-test'
+        with patch.dict(zyxel_utils._CAPABILITIES_CACHE, clear=True), \
+                patch.object(zyxel_utils, 'get_connection') as mock_get_connection:
+            mock_get_connection.return_value.get_capabilities.return_value = capabilities
+            expected = {'network_api': 'httpapi', 'device_info': {'network_os': 'zyxel'}}
+            assert zyxel_utils.get_capabilities(mock_module) == expected
+            assert zyxel_utils.get_capabilities(mock_module) == expected
+        mock_get_connection.return_value.get_capabilities.assert_called_once()
@@ -30,6 +30,16 @@ class TestLagModule:
         from ansible_collections.network.zyxel.plugins.modules import zyxel_lag
         assert hasattr(zyxel_lag, 'main')
 
+    @pytest.mark.parametrize('response, changed', [
+        ((True, 'LAG configured', True), True),
+        ((True, 'LAG already configured', False), False),
+    ])
+    def test_changed_reflects_switch(self, run_module, response, changed):
+        """Test that an 'already configured' LAG run reports no change."""
+        from ansible_collections.network.zyxel.plugins.modules import zyxel_lag
+        result = run_module(zyxel_lag, {'groups': {'1': {'members': ['5', '6']}}}, configure_lag=response)
+        assert result['changed'] is changed
+
 
 class TestMacTableModule:
     """Tests for zyxel_mac_address_table_info module."""
@@ -11,6 +11,7 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import pytest
+from unittest.mock import patch
 
 
 class TestPortsModule:
@@ -30,3 +31,48 @@ class TestVlansModule:
         from ansible_collections.network.zyxel.plugins.modules import zyxel_vlans
         assert hasattr(zyxel_vlans, 'main')
 
+    @pytest.mark.parametrize('vlan_id', ['ten', '0', '4095'])
+    @patch('ansible_collections.network.zyxel.plugins.modules.zyxel_vlans.get_connection')
+    @patch('ansible_collections.network.zyxel.plugins.modules.zyxel_vlans.AnsibleModule')
+    def test_invalid_vlan_id_fails(self, mock_ansible_module, mock_get_connection,
+                                   mock_module, vlan_id):
+        """Test that a VLAN key that is not a valid VLAN ID fails the module."""
+        from ansible_collections.network.zyxel.plugins.modules import zyxel_vlans
+        mock_module.params = {'vlans': {'10': {'name': 'ok'}, vlan_id: {'name': 'bad'}}}
+        mock_ansible_module.return_value = mock_module
+
+        with pytest.raises(SystemExit):
+            zyxel_vlans.main()
+
+        mock_module.fail_json.assert_called_once_with(
+            msg='VLAN ID %s must be a number between 1 and 4094' % vlan_id)
+        mock_get_connection.assert_not_called()
+
+    @patch('ansible_collections.network.zyxel.plugins.modules.zyxel_vlans.get_connection')
+    @patch('ansible_collections.network.zyxel.plugins.modules.zyxel_vlans.AnsibleModule')
+    def test_failed_vlans_fail_module(self, mock_ansible_module, mock_get_connection,
+                                      mock_module):
+        """Test that failed deletes and creates are reported through fail_json."""
+        from ansible_collections.network.zyxel.plugins.modules import zyxel_vlans
+        mock_module.params = {'vlans': {
+            '10': {'state': 'absent'}, '20': {'state': 'absent'},
+            '30': {'name': 'servers'}, '40': {'name': 'users'},
+        }}
+        mock_ansible_module.return_value = mock_module
+        connection = mock_get_connection.return_value
+        connection.delete_vlans.return_value = [
+            {'success': True, 'msg': 'VLAN 10 deleted'},
+            {'success': False, 'msg': 'Failed to delete VLAN 20'},
+        ]
+        connection.create_vlans.return_value = [
+            {'success': False, 'msg': 'Failed to create VLAN 30: HTTP 500'},
+            {'success': True, 'msg': 'VLAN 40 created'},
+        ]
+
+        with pytest.raises(SystemExit):
+            zyxel_vlans.main()
+
+        mock_module.fail_json.assert_called_once_with(
+            msg='Failed to delete VLAN 20; Failed to create VLAN 30: HTTP 500',
+            changed=True, vlans_configured=['10', '40'])
+        mock_module.exit_json.assert_not_called()
@@ -21,6 +21,17 @@ class TestSyslogModule:
         from ansible_collections.network.zyxel.plugins.modules import zyxel_syslog
         assert hasattr(zyxel_syslog, 'main')
 
+    @pytest.mark.parametrize('response, changed', [
+        ((True, 'Syslog configured', True), True),
+        ((True, 'Syslog already configured', False), False),
+    ])
+    def test_changed_reflects_switch(self, run_module, response, changed):
+        """Test that an 'already configured' syslog run reports no change."""
+        from ansible_collections.network.zyxel.plugins.modules import zyxel_syslog
+        params = {'enabled': True, 'server': None, 'port': 514, 'servers': None}
+        result = run_module(zyxel_syslog, params, configure_syslog=response)
+        assert result['changed'] is changed
+
 
 class TestNtpModule:
     """Tests for zyxel_ntp module."""
@@ -1,16 +1,13 @@
 # -*- coding: utf-8 -*-
 # Copyright: (c) 2024, Ansible Project
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
-"""Unit tests for zyxel_pvid module - HTTP API version.
-
-Note: This module is currently stubbed as HTTP API support is not yet implemented.
-These tests verify the module can be imported and has the expected structure.
-"""
+"""Unit tests for zyxel_pvid module - HTTP API version."""
 
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import pytest
+from unittest.mock import patch
 
 
 class TestPvidModule:
@@ -21,3 +18,68 @@ class TestPvidModule:
         from ansible_collections.network.zyxel.plugins.modules import zyxel_pvid
         assert hasattr(zyxel_pvid, 'main')
 
+    @pytest.mark.parametrize('check_mode', [True, False])
+    @patch('ansible_collections.network.zyxel.plugins.modules.zyxel_pvid.get_connection')
+    @patch('ansible_collections.network.zyxel.plugins.modules.zyxel_pvid.AnsibleModule')
+    def test_empty_ports_is_unchanged(self, mock_ansible_module, mock_get_connection,
+                                      mock_module, check_mode):
+        """Test that an empty ports mapping exits unchanged without touching the switch."""
+        from ansible_collections.network.zyxel.plugins.modules import zyxel_pvid
+        mock_module.params = {
+            'port': None, 'pvid': None, 'ports': {}, 'vlan_trunking': None,
+            'ingress_filtering': None, 'acceptable_frame_type': None, 'num_ports': 28,
+        }
+        mock_module.check_mode = check_mode
+        mock_module.exit_json.side_effect = SystemExit(0)
+        mock_ansible_module.return_value = mock_module
+
+        with pytest.raises(SystemExit):
+            zyxel_pvid.main()
+
+        mock_module.exit_json.assert_called_once_with(changed=False, ports_configured=[])
+        mock_module.fail_json.assert_not_called()
+        mock_get_connection.assert_not_called()
+
+    @patch('ansible_collections.network.zyxel.plugins.modules.zyxel_pvid.get_connection')
+    @patch('ansible_collections.network.zyxel.plugins.modules.zyxel_pvid.AnsibleModule')
+    def test_single_port_passes_num_ports(self, mock_ansible_module, mock_get_connection,
+                                          mock_module):
+        """Test that the single-port path exits once and passes num_ports through."""
+        from ansible_collections.network.zyxel.plugins.modules import zyxel_pvid
+        mock_module.params = {
+            'port': '10', 'pvid': 100, 'ports': None, 'vlan_trunking': None,
+            'ingress_filtering': None, 'acceptable_frame_type': None, 'num_ports': 10,
+        }
+        mock_ansible_module.return_value = mock_module
+        connection = mock_get_connection.return_value
+        connection.set_port_pvid.return_value = (True, 'Port 10 PVID set to 100')
+
+        zyxel_pvid.main()
+
+        connection.set_port_pvid.assert_called_once_with(
+            '10', 100, num_ports=10, vlan_trunking=None,
+            ingress_filtering=None, acceptable_frame_type=None)
+        mock_module.exit_json.assert_called_once_with(
+            changed=True, port='10', pvid=100, message='Port 10 PVID set to 100')
+
+    @patch('ansible_collections.network.zyxel.plugins.modules.zyxel_pvid.get_connection')
+    @patch('ansible_collections.network.zyxel.plugins.modules.zyxel_pvid.AnsibleModule')
+    def test_ports_passes_num_ports(self, mock_ansible_module, mock_get_connection,
+                                    mock_module):
+        """Test that the ports path exits once and passes num_ports through."""
+        from ansible_collections.network.zyxel.plugins.modules import zyxel_pvid
+        mock_module.params = {
+            'port': None, 'pvid': None, 'ports': {'1': {'pvid': 100}}, 'vlan_trunking': None,
+            'ingress_filtering': None, 'acceptable_frame_type': None, 'num_ports': 10,
+        }
+        mock_ansible_module.return_value = mock_module
+        connection = mock_get_connection.return_value
+        connection.set_ports_pvid.return_value = (True, 'Port 1 PVID set')
+
+        zyxel_pvid.main()
+
+        connection.set_ports_pvid.assert_called_once_with(
+            {'1': {'pvid': 100, 'vlan_trunking': None, 'ingress_filtering': None,
+                   'acceptable_frame_type': None}}, num_ports=10)
+        mock_module.exit_json.assert_called_once_with(
+            changed=True, ports_configured=['1'], message='Port 1 PVID set')
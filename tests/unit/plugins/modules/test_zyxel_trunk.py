@@ -21,3 +21,13 @@ class TestTrunkModule:
         from ansible_collections.network.zyxel.plugins.modules import zyxel_trunk
         assert hasattr(zyxel_trunk, 'main')
 
+    @pytest.mark.parametrize('response, changed', [
+        ((True, 'LAG configured', True), True),
+        ((True, 'LAG already configured', False), False),
+    ])
+    def test_changed_reflects_switch(self, run_module, response, changed):
+        """Test that an 'already configured' trunk run reports no change."""
+        from ansible_collections.network.zyxel.plugins.modules import zyxel_trunk
+        params = {'group': '1', 'enabled': True, 'members': ['5'], 'criteria': None}
+        result = run_module(zyxel_trunk, params, configure_lag=response)
+        assert result['changed'] is changed
@@ -128,3 +128,17 @@ class TestNeedsUpdate:
         }
         assert needs_update(current, params) is False
 
+    def test_duplicate_ports_no_update(self):
+        """Test that port order and duplicates do not trigger an update."""
+        current = {
+            'exists': True,
+            'name': 'Test',
+            'tagged_ports': ['24'],
+            'untagged_ports': ['1', '2'],
+        }
+        params = {
+            'name': 'Test',
+            'tagged_ports': [24, '24'],
+            'untagged_ports': ['2', '1', '2'],
+        }
+        assert needs_update(current, params) is False